@@ -1,11 +1,24 @@
 from app.core.normalization import (
     normalize_name,
+    normalize_many,
     validate_name,
+    validate_many,
     generate_normalized_name,
+    suffixed_name,
     is_atomic_root,
     is_root_phrase
 )
 from app.core.conflict_checker import ConflictChecker
+from app.core.suffix_allocator import SuffixAllocator, suffix_allocator
+from app.core.name_registry import NameRegistry, RegistryListener, name_registry
+from app.core.root_suggester import RootSuggester, root_suggester
+from app.core.autocomplete import PrefixTrie, NameAutocomplete, name_autocomplete
+from app.core.root_segmenter import RootSegmenter, root_segmenter
+from app.core.root_matcher import RootMatcher, root_matcher
+from app.core.csv_stream import iter_csv_records, iter_csv_rows
+from app.core.conditional import check_not_modified, etag_matches
+from app.core.catalog import CatalogSnapshot, catalog
+from app.core.pagination import paginate_query, paginate_ranked, encode_cursor, decode_cursor
 from app.core.response import (
     success_response,
     error_response,
@@ -44,12 +57,49 @@ from app.core.exceptions import (
 __all__ = [
     # Normalization utilities
     "normalize_name",
+    "normalize_many",
     "validate_name",
+    "validate_many",
     "generate_normalized_name",
+    "suffixed_name",
     "is_atomic_root",
     "is_root_phrase",
     # Conflict checker
     "ConflictChecker",
+    # Suffix allocator
+    "SuffixAllocator",
+    "suffix_allocator",
+    # Name registry
+    "NameRegistry",
+    "RegistryListener",
+    "name_registry",
+    # Root suggester
+    "RootSuggester",
+    "root_suggester",
+    # Autocomplete
+    "PrefixTrie",
+    "NameAutocomplete",
+    "name_autocomplete",
+    # Root segmentation
+    "RootSegmenter",
+    "root_segmenter",
+    # Root matcher
+    "RootMatcher",
+    "root_matcher",
+    # Catalog snapshot
+    "CatalogSnapshot",
+    "catalog",
+    # Conditional requests
+    "check_not_modified",
+    "etag_matches",
+    # Pagination utilities
+    "paginate_query",
+    "paginate_ranked",
+    "encode_cursor",
+    "decode_cursor",
+    # CSV streaming
+    "iter_csv_records",
+    "iter_csv_rows",
     # Response utilities
     "success_response",
     "error_response",
@@ -0,0 +1,332 @@
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.name_registry import RegistryListener, name_registry
+from app.core.normalization import normalize_name
+from app.db.versions import get_table_versions
+
+# 每个节点缓存的候选数上限（即单次补全的最大返回数）
+MAX_COMPLETIONS = 20
+
+def normalize_prefix(q: str) -> str:
+    """规范化补全输入，保留末尾的分隔符（"user " 与 "user_" 都补全为 user_ 开头的名称）"""
+    prefix = normalize_name(q)
+    if prefix and q[-1:] in ("_", " ", "-"):
+        prefix += "_"
+    return prefix
+
+class _Node:
+    __slots__ = ("label", "children", "owners", "top")
+
+    def __init__(self, label: str = ""):
+        self.label = label            # 父节点到本节点的边标签
+        self.children: Dict[str, "_Node"] = {}  # 边标签首字符 -> 子节点
+        self.owners: Optional[set] = None       # 以本节点结尾的词项所属对象ID
+        self.top: Tuple[int, ...] = ()          # 子树内按权重排序的前 MAX_COMPLETIONS 个对象ID
+
+class PrefixTrie:
+    """
+    带权前缀树（压缩前缀树）
+
+    词项按字符插入，每个对象（词根/字段）可有多个词项（规范化名与别名）。
+    每个节点缓存子树内权重最高的前 MAX_COMPLETIONS 个对象，补全只需沿前缀下行后直接读取，
+    与候选总数无关。词项或权重变更时只重算受影响路径上的节点。
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self._terms: Dict[int, Tuple[str, ...]] = {}   # 对象ID -> 词项（首项为规范化名）
+        self._names: Dict[int, str] = {}               # 对象ID -> 显示名
+        self._weights: Dict[int, int] = {}             # 对象ID -> 权重
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def weight(self, owner: int) -> int:
+        return self._weights.get(owner, 0)
+
+    # ---- 维护 ----
+
+    def clear(self):
+        self._root = _Node()
+        self._terms.clear()
+        self._names.clear()
+
+    def put(self, owner: int, name: str, terms: Iterable[str]):
+        """新增或替换对象的词项"""
+        self.remove(owner)
+        terms = tuple(term for term in dict.fromkeys(terms) if term)
+        self._terms[owner] = terms
+        self._names[owner] = name
+        for term in terms:
+            self._insert(term, owner)
+        for term in terms:
+            self._refresh_path(term)
+
+    def remove(self, owner: int):
+        terms = self._terms.pop(owner, ())
+        self._names.pop(owner, None)
+        for term in terms:
+            self._delete(term, owner)
+        for term in terms:
+            self._refresh_path(term)
+
+    def bulk_load(self, entries: Iterable[Tuple[int, str, Iterable[str]]]):
+        """全量加载 (对象ID, 显示名, 词项) 后一次性计算节点缓存"""
+        self.clear()
+        for owner, name, terms in entries:
+            terms = tuple(term for term in dict.fromkeys(terms) if term)
+            self._terms[owner] = terms
+            self._names[owner] = name
+            for term in terms:
+                self._insert(term, owner)
+        self._refresh_all()
+
+    def set_weights(self, weights: Dict[int, int], replace: bool = False):
+        """
+        更新权重，只重算权重变化的对象所在路径
+
+        Args:
+            weights: {对象ID: 权重}
+            replace: 是否为全量权重（未出现的对象视为0）
+        """
+        if replace:
+            weights = {owner: weights.get(owner, 0) for owner in set(self._weights) | set(weights)}
+        changed = [owner for owner, weight in weights.items() if self._weights.get(owner, 0) != weight]
+        for owner in changed:
+            if weights[owner]:
+                self._weights[owner] = weights[owner]
+            else:
+                self._weights.pop(owner, None)
+        if len(changed) * 10 > len(self._terms):
+            self._refresh_all()
+            return
+        for owner in changed:
+            for term in self._terms.get(owner, ()):
+                self._refresh_path(term)
+
+    # ---- 查询 ----
+
+    def complete(self, prefix: str, limit: int = 10) -> List[Dict]:
+        """
+        前缀补全
+
+        Returns:
+            [{"id", "name", "matched", "is_alias", "weight"}]，按权重降序、名称升序
+        """
+        node = self._find(prefix)
+        if node is None:
+            return []
+        results = []
+        for owner in node.top[:limit]:
+            terms = self._terms[owner]
+            matched = next((term for term in terms if term.startswith(prefix)), terms[0])
+            results.append({
+                "id": owner,
+                "name": self._names[owner],
+                "matched": matched,
+                "is_alias": matched != terms[0],
+                "weight": self._weights.get(owner, 0)
+            })
+        return results
+
+    # ---- 内部方法 ----
+
+    def _find(self, prefix: str) -> Optional[_Node]:
+        """定位覆盖该前缀的节点（前缀可止于边标签中间）"""
+        node, i = self._root, 0
+        while i < len(prefix):
+            child = node.children.get(prefix[i])
+            if child is None:
+                return None
+            label = child.label
+            rest = prefix[i:i + len(label)]
+            if not label.startswith(rest):
+                return None
+            i += len(rest)
+            node = child
+        return node
+
+    def _insert(self, term: str, owner: int):
+        node, i = self._root, 0
+        while i < len(term):
+            child = node.children.get(term[i])
+            if child is None:
+                leaf = _Node(term[i:])
+                node.children[term[i]] = leaf
+                node = leaf
+                break
+            label = child.label
+            common = 0
+            while common < len(label) and i + common < len(term) and label[common] == term[i + common]:
+                common += 1
+            if common < len(label):
+                # 拆分边：父 -> middle(label[:common]) -> child(label[common:])
+                middle = _Node(label[:common])
+                child.label = label[common:]
+                middle.children[child.label[0]] = child
+                node.children[term[i]] = middle
+                child = middle
+            node = child
+            i += common
+        if node.owners is None:
+            node.owners = set()
+        node.owners.add(owner)
+
+    def _delete(self, term: str, owner: int):
+        path = self._path(term)
+        if path[-1][1] != len(term):
+            return
+        node = path[-1][0]
+        if node.owners:
+            node.owners.discard(owner)
+            if not node.owners:
+                node.owners = None
+        # 清理空节点并合并只有一个子节点的中间节点
+        for depth in range(len(path) - 1, 0, -1):
+            node, parent = path[depth][0], path[depth - 1][0]
+            if node.owners is None and not node.children:
+                del parent.children[node.label[0]]
+            elif node.owners is None and len(node.children) == 1:
+                (child,) = node.children.values()
+                child.label = node.label + child.label
+                parent.children[node.label[0]] = child
+            else:
+                break
+
+    def _path(self, term: str) -> List[Tuple[_Node, int]]:
+        """从根节点沿词项下行，返回 [(节点, 已匹配长度)]，只包含边标签完整匹配的节点"""
+        path = [(self._root, 0)]
+        node, i = self._root, 0
+        while i < len(term):
+            child = node.children.get(term[i])
+            if child is None or not term.startswith(child.label, i):
+                break
+            i += len(child.label)
+            node = child
+            path.append((node, i))
+        return path
+
+    def _refresh_path(self, term: str):
+        for node, _ in reversed(self._path(term)):
+            self._compute_top(node)
+
+    def _refresh_all(self):
+        # 后序遍历（显式栈，避免长名称导致递归过深）
+        stack = [(self._root, False)]
+        while stack:
+            node, visited = stack.pop()
+            if visited:
+                self._compute_top(node)
+                continue
+            stack.append((node, True))
+            stack.extend((child, False) for child in node.children.values())
+
+    def _compute_top(self, node: _Node):
+        candidates = set(node.owners or ())
+        for child in node.children.values():
+            candidates.update(child.top)
+        weights, names = self._weights, self._names
+        node.top = tuple(sorted(
+            candidates, key=lambda owner: (-weights.get(owner, 0), names.get(owner, ""))
+        )[:MAX_COMPLETIONS])
+
+class NameAutocomplete(RegistryListener):
+    """
+    词根与字段名称补全
+
+    名称随注册表增量维护；权重（词根使用次数、字段被模型引用次数）在相关表版本号前进时
+    从数据库读取，只对变化的对象重算前缀树缓存。每次补全只多一次版本号查询。
+    """
+
+    def __init__(self):
+        self.roots = PrefixTrie()
+        self.fields = PrefixTrie()
+        self._lock = threading.RLock()
+        self._weight_versions: Dict[str, Optional[int]] = {}  # 权重来源表 -> 已同步版本
+
+    # ---- 注册表回调 ----
+
+    def on_load(self, roots, fields):
+        with self._lock:
+            self.roots.bulk_load(
+                (root_id, name, (normalized_name, *sorted(aliases)))
+                for root_id, (name, normalized_name, aliases) in roots.items()
+            )
+            self.fields.bulk_load(
+                (field_id, field_name, (normalized_name,))
+                for field_id, (field_name, normalized_name) in fields.items()
+            )
+
+    def on_root_upsert(self, root_id, name, normalized_name, aliases):
+        with self._lock:
+            self.roots.put(root_id, name, (normalized_name, *sorted(aliases)))
+
+    def on_root_remove(self, root_id):
+        with self._lock:
+            self.roots.remove(root_id)
+
+    def on_field_upsert(self, field_id, field_name, normalized_name):
+        with self._lock:
+            self.fields.put(field_id, field_name, (normalized_name,))
+
+    def on_field_remove(self, field_id):
+        with self._lock:
+            self.fields.remove(field_id)
+
+    # ---- 查询（调用前先同步目录快照） ----
+
+    def complete_roots(self, db: Session, prefix: str, limit: int = 10) -> List[Dict]:
+        self.sync_root_weights(db)
+        with self._lock:
+            return self.roots.complete(prefix, limit)
+
+    def complete_fields(self, db: Session, prefix: str, limit: int = 10) -> List[Dict]:
+        self._sync_weights(db, "model_fields", self.fields, self._load_field_weights)
+        with self._lock:
+            return self.fields.complete(prefix, limit)
+
+    def sync_root_weights(self, db: Session):
+        """同步词根使用次数（词根切分等其他索引也按此权重排序）"""
+        self._sync_weights(db, "roots", self.roots, self._load_root_weights)
+
+    def root_weight(self, root_id: int) -> int:
+        return self.roots.weight(root_id)
+
+    def invalidate(self):
+        """清空权重同步状态，下次访问时重新读取"""
+        with self._lock:
+            self._weight_versions.clear()
+
+    # ---- 内部方法 ----
+
+    def _sync_weights(self, db: Session, table: str, trie: PrefixTrie, loader):
+        versions = get_table_versions(db, (table,))
+        version = versions[table] if versions else None
+        with self._lock:
+            if table in self._weight_versions and (version is None or self._weight_versions[table] == version):
+                return
+            # 先记录版本再读取，读取期间的并发写入会在下次比对时再次同步
+            self._weight_versions[table] = version
+            trie.set_weights(loader(db), replace=True)
+
+    @staticmethod
+    def _load_root_weights(db: Session) -> Dict[int, int]:
+        from app.models.root import Root
+
+        return dict(db.query(Root.id, Root.usage_count).filter(Root.usage_count > 0).all())
+
+    @staticmethod
+    def _load_field_weights(db: Session) -> Dict[int, int]:
+        from app.models.model_field import ModelField
+
+        return dict(
+            db.query(ModelField.field_id, func.count(ModelField.id)).group_by(ModelField.field_id).all()
+        )
+
+# 创建全局名称补全实例
+name_autocomplete = NameAutocomplete()
+name_registry.add_listener(name_autocomplete)
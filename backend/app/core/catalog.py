@@ -0,0 +1,162 @@
+import logging
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.name_registry import NameRegistry, name_registry
+from app.db.versions import get_table_versions
+
+logger = logging.getLogger(__name__)
+
+# 注册表覆盖的表：本进程的写操作会在提交后增量更新注册表
+REGISTRY_TABLES = ("roots", "fields")
+CATALOG_TABLES = REGISTRY_TABLES + ("models",)
+
+class CatalogSnapshot:
+    """
+    目录快照
+
+    进程内缓存词根（含别名）、字段与模型名称：词根与字段复用名称注册表，
+    模型只保存 ID 与名称。以 table_versions 中的版本号作为全局变更序列，
+    访问时按需比对，版本前进时只重新加载变更的部分，多个 worker 进程
+    无需外部缓存服务即可保持一致。
+
+    本进程自己的写操作通过 queue_registry_update 登记注册表更新，提交成功后在同一回调中
+    先应用更新、再把连续前进的版本号记为已同步，其间不会有并发请求看到“已同步”却缺少新名称；
+    只有其他进程的写入才触发重新加载。
+    """
+
+    def __init__(self, registry: NameRegistry, refresh_interval: float = 1.0):
+        self.registry = registry
+        self.refresh_interval = refresh_interval
+        self._lock = threading.RLock()
+        self._versions: Dict[str, int] = {}  # 快照对应的表版本号
+        self._checked_at = 0.0
+        self._models: Dict[int, str] = {}        # 模型ID -> 模型名
+        self._model_ids: Dict[str, int] = {}     # 模型名 -> 模型ID
+        self._models_loaded = False
+
+    def sync(self, db: Session, force: bool = False):
+        """
+        与数据库版本号对齐
+
+        Args:
+            force: 忽略检查间隔（写操作前的冲突检测需要最新数据）
+
+        检查间隔内其他进程的提交可能尚未反映到快照中：据此判断“不存在”前，
+        应在未命中时以 force=True 再同步一次。
+        """
+        now = time.monotonic()
+        if not force and self.registry.loaded and now - self._checked_at < self.refresh_interval:
+            return
+
+        versions = get_table_versions(db, CATALOG_TABLES)
+        with self._lock:
+            self._checked_at = now
+            if versions is None:
+                # 尚无版本记录（未执行初始化），退回为只加载一次
+                self.registry.ensure_loaded(db)
+                return
+
+            stale = [name for name in CATALOG_TABLES if versions[name] != self._versions.get(name)]
+            if any(name in stale for name in REGISTRY_TABLES) or not self.registry.loaded:
+                self.registry.load(db)
+            if "models" in stale or not self._models_loaded:
+                self._load_models(db)
+            if stale:
+                logger.debug(f"目录快照已刷新: {stale}")
+            # 先读版本再读数据，加载期间的并发写入会在下次比对时再次刷新
+            self._versions.update(versions)
+
+    def queue_registry_update(self, db: Session, method: str, *args):
+        """
+        登记本事务提交成功后要应用的注册表更新（如 "upsert_root", 词根ID, ...）
+
+        在 commit 之前调用：提交回调中先应用更新再推进快照版本，事务回滚则丢弃。
+        """
+        db.info.setdefault("registry_updates", []).append((method, args))
+
+    def note_commit(self, versions: Dict[str, Tuple[int, int]], registry_updates: Iterable[Tuple[str, tuple]] = ()):
+        """
+        本进程提交了带版本号递增的事务
+
+        Args:
+            versions: {表名: (递增前版本, 递增后版本)}
+            registry_updates: 本事务登记的注册表更新
+
+        先应用注册表更新：递增前版本与快照一致说明期间没有其他进程写入，可直接记为已同步；
+        更新失败时不推进，下次访问重新加载。模型名称不做增量维护，标记为待重新加载。
+        """
+        with self._lock:
+            applied = True
+            for method, args in registry_updates:
+                try:
+                    getattr(self.registry, method)(*args)
+                except Exception as e:
+                    applied = False
+                    logger.error(f"注册表增量更新失败，将重新加载: {method}{args}: {e}")
+            for name, (previous, version) in versions.items():
+                if name in REGISTRY_TABLES and applied and self._versions.get(name) == previous:
+                    self._versions[name] = version
+            if "models" in versions:
+                self._models_loaded = False
+                self._checked_at = 0.0
+
+    def invalidate(self):
+        """清空快照，下次访问时全部重新加载"""
+        with self._lock:
+            self._versions.clear()
+            self._models_loaded = False
+            self._checked_at = 0.0
+
+    # ---- 查询（调用前先 sync） ----
+
+    def find_model(self, model_name: str) -> Optional[int]:
+        """按名称查找模型ID"""
+        return self._model_ids.get(model_name)
+
+    def model_name(self, model_id: int) -> Optional[str]:
+        return self._models.get(model_id)
+
+    def root_names(self, root_ids: Iterable[int]) -> Dict[int, str]:
+        """批量获取词根规范化名（不存在的ID不出现在结果中）"""
+        result = {}
+        for root_id in root_ids:
+            entry = self.registry.get_root(root_id)
+            if entry:
+                result[root_id] = entry[1]
+        return result
+
+    @property
+    def versions(self) -> Dict[str, int]:
+        return dict(self._versions)
+
+    # ---- 内部方法 ----
+
+    def _load_models(self, db: Session):
+        from app.models.model import Model
+
+        rows = db.query(Model.id, Model.model_name).all()
+        self._models = dict(rows)
+        self._model_ids = {name: model_id for model_id, name in rows}
+        self._models_loaded = True
+
+# 创建全局目录快照实例
+catalog = CatalogSnapshot(name_registry, refresh_interval=settings.CATALOG_REFRESH_INTERVAL)
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed_versions(session: Session):
+    """提交成功后应用登记的注册表更新，并把本事务递增的版本号通知目录快照"""
+    versions = session.info.pop("bumped_versions", None)
+    updates = session.info.pop("registry_updates", None)
+    if versions or updates:
+        catalog.note_commit(versions or {}, updates or ())
+
+@event.listens_for(Session, "after_rollback")
+def _discard_bumped_versions(session: Session):
+    session.info.pop("bumped_versions", None)
+    session.info.pop("registry_updates", None)
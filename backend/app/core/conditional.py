@@ -0,0 +1,50 @@
+import hashlib
+from typing import Iterable, Optional
+
+from fastapi import Request, Response
+from sqlalchemy.orm import Session
+
+from app.db.versions import get_table_versions
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 是否命中（弱比较）"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = etag[2:] if etag.startswith("W/") else etag
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if (tag[2:] if tag.startswith("W/") else tag) == target:
+            return True
+    return False
+
+def check_not_modified(
+    request: Request,
+    response: Response,
+    db: Session,
+    tables: Iterable[str]
+) -> Optional[Response]:
+    """
+    按表版本号做条件请求校验
+
+    ETag 由相关表的版本号与请求路径、查询参数计算，只需一次版本查询。
+    命中 If-None-Match 时返回 304 响应，路由直接返回即可；
+    否则把 ETag 写入响应头并返回 None，继续正常查询。
+    """
+    versions = get_table_versions(db, tables)
+    if versions is None:
+        return None
+
+    payload = f"{request.url.path}?{request.url.query}|" + ",".join(
+        f"{name}={version}" for name, version in sorted(versions.items())
+    )
+    etag = f'W/"{hashlib.sha1(payload.encode("utf-8")).hexdigest()[:20]}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from typing import Optional
+from urllib.parse import quote
 import os
 
 class Settings(BaseSettings):
@@ -15,6 +16,8 @@ class Settings(BaseSettings):
     DATABASE_TYPE: str = "sqlite"  # sqlite 或 postgresql
     DATABASE_URL: str = "sqlite:///./datatool.db"
     DATABASE_ECHO: bool = False
+    DATABASE_READ_ROUTING: bool = True  # 只读请求使用独立的只读连接池（SQLite mode=ro / PostgreSQL 只读副本）
+    DATABASE_ASYNC_ENABLED: bool = False  # 启用异步引擎及 /api/v1/async 路由（需安装 aiosqlite/asyncpg）
     
     # PostgreSQL 特定配置
     POSTGRES_HOST: str = "localhost"
@@ -26,9 +29,27 @@ class Settings(BaseSettings):
     POSTGRES_MAX_OVERFLOW: int = 20
     POSTGRES_POOL_TIMEOUT: int = 30
     POSTGRES_POOL_RECYCLE: int = 3600
+    POSTGRES_READ_URL: str = ""  # 只读副本连接URL，留空时读写共用主库
     
     # SQLite 特定配置
     SQLITE_DB_PATH: str = "./datatool.db"
+    SQLITE_JOURNAL_MODE: str = "WAL"  # WAL 下读写互不阻塞
+    SQLITE_SYNCHRONOUS: str = "NORMAL"  # WAL 模式下 NORMAL 足以保证一致性
+    SQLITE_CACHE_SIZE: int = -65536  # 负数单位为 KiB（64MB）
+    SQLITE_MMAP_SIZE: int = 268435456  # 内存映射读取上限（256MB）
+    SQLITE_BUSY_TIMEOUT: int = 5000  # 等待写锁的毫秒数
+    SQLITE_TEMP_STORE: str = "MEMORY"
+    SQLITE_POOL_SIZE: int = 10
+    SQLITE_MAX_OVERFLOW: int = 20
+    SQLITE_POOL_TIMEOUT: int = 30
+    
+    # 目录快照：只读访问时最多每隔多少秒比对一次表版本号（写操作前总是比对）
+    CATALOG_REFRESH_INTERVAL: float = 1.0
+    
+    # 导出缓存配置
+    EXPORT_CACHE_ENABLED: bool = True
+    EXPORT_CACHE_DIR: str = "./export_cache"
+    EXPORT_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
     
     # 安全配置
     SECRET_KEY: str = "your-secret-key-here"
@@ -50,6 +71,21 @@ class Settings(BaseSettings):
             # 默认使用SQLite
             return f"sqlite:///{self.SQLITE_DB_PATH}"
     
+    def get_read_database_url(self) -> Optional[str]:
+        """获取只读连接URL，无独立只读库时返回 None"""
+        if self.DATABASE_TYPE.lower() == "postgresql":
+            return self.POSTGRES_READ_URL or None
+        else:
+            # SQLite 以只读URI打开同一文件，读连接不会获取写锁
+            return f"sqlite:///file:{quote(os.path.abspath(self.SQLITE_DB_PATH))}?mode=ro&uri=true"
+    
+    def get_async_database_url(self) -> str:
+        """获取异步驱动的数据库连接URL"""
+        if self.DATABASE_TYPE.lower() == "postgresql":
+            return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+        else:
+            return f"sqlite+aiosqlite:///{self.SQLITE_DB_PATH}"
+    
     def get_database_config(self) -> dict:
         """获取数据库配置参数"""
         if self.DATABASE_TYPE.lower() == "postgresql":
@@ -63,9 +99,37 @@ class Settings(BaseSettings):
         else:
             # SQLite配置
             return {
+                "pool_size": self.SQLITE_POOL_SIZE,
+                "max_overflow": self.SQLITE_MAX_OVERFLOW,
+                "pool_timeout": self.SQLITE_POOL_TIMEOUT,
                 "echo": self.DATABASE_ECHO,
-                "connect_args": {"check_same_thread": False}
+                "connect_args": {
+                    "check_same_thread": False,
+                    "timeout": self.SQLITE_BUSY_TIMEOUT / 1000
+                },
+                "pragmas": self.get_sqlite_pragmas()
             }
+    
+    def get_sqlite_pragmas(self) -> dict:
+        """获取SQLite连接参数（PRAGMA），枚举值校验后才会拼入语句"""
+        journal_mode = self.SQLITE_JOURNAL_MODE.upper()
+        if journal_mode not in ("WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "OFF"):
+            raise ValueError(f"无效的 SQLITE_JOURNAL_MODE: {self.SQLITE_JOURNAL_MODE}")
+        synchronous = self.SQLITE_SYNCHRONOUS.upper()
+        if synchronous not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+            raise ValueError(f"无效的 SQLITE_SYNCHRONOUS: {self.SQLITE_SYNCHRONOUS}")
+        temp_store = self.SQLITE_TEMP_STORE.upper()
+        if temp_store not in ("DEFAULT", "FILE", "MEMORY"):
+            raise ValueError(f"无效的 SQLITE_TEMP_STORE: {self.SQLITE_TEMP_STORE}")
+        
+        return {
+            "journal_mode": journal_mode,
+            "synchronous": synchronous,
+            "cache_size": int(self.SQLITE_CACHE_SIZE),
+            "mmap_size": int(self.SQLITE_MMAP_SIZE),
+            "busy_timeout": int(self.SQLITE_BUSY_TIMEOUT),
+            "temp_store": temp_store
+        }
 
 # 创建全局配置实例
 settings = Settings()
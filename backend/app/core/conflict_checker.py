@@ -1,10 +1,14 @@
-from typing import List, Dict, Tuple, Optional
+from typing import Container, List, Dict, Tuple, Optional
 from app.core.normalization import normalize_name, validate_name
+from app.core.name_registry import NameRegistry, name_registry
+from app.core.suffix_allocator import SuffixAllocator, suffix_allocator
 
 class ConflictChecker:
-    """冲突检测器"""
+    """冲突检测器（基于名称注册表，O(1)查找）"""
     
-    def __init__(self):
+    def __init__(self, registry: Optional[NameRegistry] = None, allocator: Optional[SuffixAllocator] = None):
+        self.registry = registry or name_registry
+        self.allocator = allocator or suffix_allocator
         self.conflict_priority = {
             "naming_invalid": 1,      # 命名非法（最高优先级）
             "root_conflict": 2,        # 词根冲突
@@ -14,16 +18,14 @@ class ConflictChecker:
     def check_root_conflicts(
         self, 
         name: str, 
-        existing_roots: List[Dict], 
-        existing_fields: List[Dict]
+        exclude_root_id: Optional[int] = None
     ) -> Tuple[bool, List[str], Optional[str]]:
         """
         检查词根冲突
         
         Args:
             name: 要检查的词根名
-            existing_roots: 已存在的词根列表
-            existing_fields: 已存在的字段列表
+            exclude_root_id: 排除的词根ID（更新自身时使用）
             
         Returns:
             (是否有冲突, 冲突列表, 替代建议)
@@ -36,38 +38,41 @@ class ConflictChecker:
         if not is_valid:
             return True, [f"命名非法: {error_msg}"], None
         
-        # 2. 检查词根冲突
-        for root in existing_roots:
-            if root.get("normalized_name") == normalized_name:
-                conflicts.append(f"词根名冲突: {root.get('name')} (ID: {root.get('id')})")
-            elif root.get("name") == name:
-                conflicts.append(f"词根名冲突: {root.get('name')} (ID: {root.get('id')})")
+        # 2. 检查词根冲突（含别名）
+        for candidate in {normalized_name, name}:
+            root = self.registry.find_root(candidate)
+            if root and root[0] != exclude_root_id:
+                conflicts.append(f"词根名冲突: {root[1]} (ID: {root[0]})")
+                break
+        
+        alias_owner = self.registry.find_alias(normalized_name)
+        if alias_owner and alias_owner[0] != exclude_root_id:
+            conflicts.append(f"别名冲突: {normalized_name} -> {alias_owner[1]} (ID: {alias_owner[0]})")
         
         # 3. 检查字段冲突
-        for field in existing_fields:
-            if field.get("normalized_name") == normalized_name:
-                conflicts.append(f"字段名冲突: {field.get('field_name')} (ID: {field.get('id')})")
+        field = self.registry.find_field(normalized_name)
+        if field:
+            conflicts.append(f"字段名冲突: {field[1]} (ID: {field[0]})")
         
         # 4. 生成替代建议
         alternative = None
         if conflicts:
             # 尝试添加后缀
-            existing_names = [r.get("normalized_name") for r in existing_roots] + [f.get("normalized_name") for f in existing_fields]
-            alternative = self._generate_alternative_name(normalized_name, existing_names)
+            alternative = self._generate_alternative_name(normalized_name)
         
         return len(conflicts) > 0, conflicts, alternative
     
     def check_field_conflicts(
         self, 
         field_name: str, 
-        existing_fields: List[Dict]
+        exclude_field_id: Optional[int] = None
     ) -> Tuple[bool, List[str], List[str]]:
         """
         检查字段冲突
         
         Args:
             field_name: 要检查的字段名
-            existing_fields: 已存在的字段列表
+            exclude_field_id: 排除的字段ID（更新自身时使用）
             
         Returns:
             (是否有冲突, 冲突列表, 替代建议列表)
@@ -81,33 +86,22 @@ class ConflictChecker:
             return True, [f"命名非法: {error_msg}"], []
         
         # 2. 检查字段冲突
-        for field in existing_fields:
-            if field.get("normalized_name") == normalized_name:
-                conflicts.append(f"字段名冲突: {field.get('field_name')} (ID: {field.get('id')})")
+        field = self.registry.find_field(normalized_name)
+        if field and field[0] != exclude_field_id:
+            conflicts.append(f"字段名冲突: {field[1]} (ID: {field[0]})")
         
         # 3. 生成替代建议
         alternatives = []
         if conflicts:
-            existing_names = [f.get("normalized_name") for f in existing_fields]
-            alternatives = self._generate_field_alternatives(normalized_name, existing_names)
+            alternatives = self._generate_field_alternatives(normalized_name, self.registry.field_names)
         
         return len(conflicts) > 0, conflicts, alternatives
     
-    def _generate_alternative_name(self, base_name: str, existing_names: List[str]) -> str:
-        """生成词根替代名称"""
-        import time
-        
-        # 尝试添加数字后缀
-        for i in range(1, 100):
-            alternative = f"{base_name}_{i}"
-            if alternative not in existing_names:
-                return alternative
-        
-        # 如果还是冲突，使用时间戳
-        timestamp = int(time.time() % 10000)
-        return f"{base_name}_{timestamp}"
+    def _generate_alternative_name(self, base_name: str) -> str:
+        """生成词根替代名称（第一个空闲数字后缀）"""
+        return self.allocator.next_free(base_name, 1, max_length=64)[0]
     
-    def _generate_field_alternatives(self, base_name: str, existing_names: List[str]) -> List[str]:
+    def _generate_field_alternatives(self, base_name: str, existing_names: Container[str]) -> List[str]:
         """生成字段替代名称列表"""
         alternatives = []
         
@@ -121,14 +115,11 @@ class ConflictChecker:
                 if len(alternatives) >= 3:  # 最多返回3个建议
                     break
         
-        # 如果后缀不够，添加数字
+        # 如果后缀不够，一次取足所需的数字后缀
         if len(alternatives) < 3:
-            for i in range(1, 10):
-                alternative = f"{base_name}_{i}"
-                if alternative not in existing_names and alternative not in alternatives:
-                    alternatives.append(alternative)
-                    if len(alternatives) >= 3:
-                        break
+            alternatives.extend(self.allocator.next_free(
+                base_name, 3 - len(alternatives), max_length=128, exclude=alternatives
+            ))
         
         return alternatives
     
@@ -0,0 +1,96 @@
+import codecs
+import csv
+from typing import AsyncIterator, Dict, List, Tuple
+
+from app.core.exceptions import ValidationException
+from app.core.response import ErrorCodes
+
+async def iter_csv_records(chunks: AsyncIterator[bytes], encoding: str = "utf-8-sig") -> AsyncIterator[Tuple[int, List[str]]]:
+    """
+    流式解析CSV
+
+    按块增量解码，凑齐完整记录（引号成对）后立即解析，
+    无需把整个请求体读入内存；带引号的多行字段按一条记录处理。
+
+    Yields:
+        (记录起始行号, 字段值列表)
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    buffer = ""
+    pending = ""
+    line_no = 0
+    start_line = 1
+
+    def complete(record: str) -> bool:
+        return record.count('"') % 2 == 0
+
+    try:
+        async for chunk in chunks:
+            buffer += decoder.decode(chunk)
+            *lines, buffer = buffer.split("\n")
+            # 最后一段可能不完整，留到下一块
+            for line in lines:
+                line += "\n"
+                line_no += 1
+                if not pending:
+                    start_line = line_no
+                pending += line
+                if complete(pending):
+                    values = next(csv.reader([pending]), [])
+                    pending = ""
+                    if values:
+                        yield start_line, values
+        buffer += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as e:
+        raise ValidationException(
+            error_code=ErrorCodes.INVALID_PARAMETER,
+            message="CSV编码错误",
+            errors=[f"第{line_no + 1}行无法按{encoding}解码: {e.reason}"]
+        )
+
+    if buffer:
+        line_no += 1
+        if not pending:
+            start_line = line_no
+        pending += buffer
+    if pending:
+        if not complete(pending):
+            raise ValidationException(
+                error_code=ErrorCodes.INVALID_PARAMETER,
+                message="CSV格式错误",
+                errors=[f"第{start_line}行引号未闭合"]
+            )
+        values = next(csv.reader([pending]), [])
+        if values:
+            yield start_line, values
+
+async def iter_csv_rows(chunks: AsyncIterator[bytes], required: Tuple[str, ...] = ()) -> AsyncIterator[Tuple[int, Dict[str, str]]]:
+    """
+    流式解析带表头的CSV，表头列名不区分大小写
+
+    Yields:
+        (行号, {列名: 值})
+
+    Raises:
+        ValidationException: 缺少表头或必需列
+    """
+    header = None
+    async for line_no, values in iter_csv_records(chunks):
+        if header is None:
+            header = [value.strip().lower() for value in values]
+            missing = [column for column in required if column not in header]
+            if missing:
+                raise ValidationException(
+                    error_code=ErrorCodes.INVALID_PARAMETER,
+                    message="CSV表头缺少必需列",
+                    errors=[f"缺少列: {', '.join(missing)}"]
+                )
+            continue
+        yield line_no, {column: value.strip() for column, value in zip(header, values)}
+
+    if header is None:
+        raise ValidationException(
+            error_code=ErrorCodes.INVALID_PARAMETER,
+            message="CSV内容为空",
+            errors=["CSV必须包含表头行"]
+        )
@@ -0,0 +1,223 @@
+import json
+import logging
+import threading
+from typing import Dict, KeysView, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+class RegistryListener:
+    """
+    名称注册表监听器
+
+    依赖词根/字段名称的内存索引（相似推荐、前缀补全等）继承此类并注册到注册表，
+    随注册表全量加载与增量更新同步维护，无需各自查询数据库。回调在注册表锁内执行。
+    """
+
+    def on_load(self, roots: Dict[int, Tuple[str, str, Set[str]]], fields: Dict[int, Tuple[str, str]]):
+        """全量加载：roots 为 {词根ID: (原始名, 规范化名, 别名集合)}，fields 为 {字段ID: (字段名, 规范化名)}"""
+        pass
+
+    def on_root_upsert(self, root_id: int, name: str, normalized_name: str, aliases: Set[str]):
+        pass
+
+    def on_root_remove(self, root_id: int):
+        pass
+
+    def on_field_upsert(self, field_id: int, field_name: str, normalized_name: str):
+        pass
+
+    def on_field_remove(self, field_id: int):
+        pass
+
+class NameRegistry:
+    """
+    名称注册表
+
+    进程内维护词根名、别名、字段名的哈希索引，启动时全量加载一次，
+    之后由服务层在每次提交成功后增量更新，冲突检测无需再扫描全表。
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._roots: Dict[str, int] = {}           # 词根规范化名 -> 词根ID
+        self._root_names: Dict[str, int] = {}      # 词根原始名 -> 词根ID
+        self._aliases: Dict[str, int] = {}         # 别名 -> 词根ID
+        self._fields: Dict[str, int] = {}          # 字段规范化名 -> 字段ID
+        self._root_by_id: Dict[int, Tuple[str, str, Set[str]]] = {}  # 词根ID -> (原始名, 规范化名, 别名集合)
+        self._field_by_id: Dict[int, Tuple[str, str]] = {}           # 字段ID -> (字段名, 规范化名)
+        self._listeners: List[RegistryListener] = []
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def load(self, db: Session):
+        """从数据库全量加载注册表"""
+        from app.models.root import Root
+        from app.models.field import Field
+
+        roots = db.query(Root.id, Root.name, Root.normalized_name, Root.aliases).all()
+        fields = db.query(Field.id, Field.field_name, Field.normalized_name).all()
+
+        with self._lock:
+            self._clear()
+            for root_id, name, normalized_name, aliases in roots:
+                self._put_root(root_id, name, normalized_name, _parse_aliases(aliases))
+            for field_id, field_name, normalized_name in fields:
+                self._put_field(field_id, field_name, normalized_name)
+            self._loaded = True
+            for listener in self._listeners:
+                listener.on_load(dict(self._root_by_id), dict(self._field_by_id))
+
+        logger.info(f"名称注册表加载完成: 词根{len(roots)}个, 字段{len(fields)}个")
+
+    def add_listener(self, listener: RegistryListener):
+        """注册监听器；注册表已加载时立即回放当前快照"""
+        with self._lock:
+            self._listeners.append(listener)
+            if self._loaded:
+                listener.on_load(dict(self._root_by_id), dict(self._field_by_id))
+
+    def ensure_loaded(self, db: Session):
+        """未加载时从数据库加载"""
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self.load(db)
+
+    def reset(self):
+        """清空注册表，下次使用时重新加载"""
+        with self._lock:
+            self._clear()
+            self._loaded = False
+
+    # ---- 增量更新 ----
+
+    def upsert_root(self, root_id: int, name: str, normalized_name: str, aliases: Optional[List[str]] = None):
+        """新增或更新词根（包括重命名与别名变更）"""
+        with self._lock:
+            self._drop_root(root_id)
+            self._put_root(root_id, name, normalized_name, set(aliases or []))
+            for listener in self._listeners:
+                listener.on_root_upsert(root_id, name, normalized_name, set(aliases or []))
+
+    def remove_root(self, root_id: int):
+        """移除词根及其别名"""
+        with self._lock:
+            self._drop_root(root_id)
+            for listener in self._listeners:
+                listener.on_root_remove(root_id)
+
+    def upsert_field(self, field_id: int, field_name: str, normalized_name: str):
+        """新增或更新字段"""
+        with self._lock:
+            self._drop_field(field_id)
+            self._put_field(field_id, field_name, normalized_name)
+            for listener in self._listeners:
+                listener.on_field_upsert(field_id, field_name, normalized_name)
+
+    def remove_field(self, field_id: int):
+        """移除字段"""
+        with self._lock:
+            self._drop_field(field_id)
+            for listener in self._listeners:
+                listener.on_field_remove(field_id)
+
+    # ---- 查询 ----
+
+    def find_root(self, name: str) -> Optional[Tuple[int, str]]:
+        """按规范化名或原始名查找词根，返回 (词根ID, 词根名)"""
+        root_id = self._roots.get(name)
+        if root_id is None:
+            root_id = self._root_names.get(name)
+        return self._root_ref(root_id)
+
+    def get_root(self, root_id: int) -> Optional[Tuple[str, str, Set[str]]]:
+        """按ID获取词根，返回 (原始名, 规范化名, 别名集合)"""
+        return self._root_by_id.get(root_id)
+
+    def find_alias(self, alias: str) -> Optional[Tuple[int, str]]:
+        """查找别名所属词根，返回 (词根ID, 词根名)"""
+        return self._root_ref(self._aliases.get(alias))
+
+    def find_field(self, normalized_name: str) -> Optional[Tuple[int, str]]:
+        """按规范化名查找字段，返回 (字段ID, 字段名)"""
+        field_id = self._fields.get(normalized_name)
+        if field_id is None:
+            return None
+        entry = self._field_by_id.get(field_id)
+        return (field_id, entry[0]) if entry else None
+
+    def has_field(self, normalized_name: str) -> bool:
+        return normalized_name in self._fields
+
+    @property
+    def field_names(self) -> KeysView[str]:
+        """已占用的字段规范化名（只读视图）"""
+        return self._fields.keys()
+
+    def __contains__(self, name: str) -> bool:
+        """名称是否已被词根、别名或字段占用"""
+        return name in self._roots or name in self._aliases or name in self._fields
+
+    # ---- 内部方法（调用方持有锁） ----
+
+    def _root_ref(self, root_id: Optional[int]) -> Optional[Tuple[int, str]]:
+        if root_id is None:
+            return None
+        entry = self._root_by_id.get(root_id)
+        return (root_id, entry[0]) if entry else None
+
+    def _clear(self):
+        self._roots.clear()
+        self._root_names.clear()
+        self._aliases.clear()
+        self._fields.clear()
+        self._root_by_id.clear()
+        self._field_by_id.clear()
+
+    def _put_root(self, root_id: int, name: str, normalized_name: str, aliases: Set[str]):
+        self._root_by_id[root_id] = (name, normalized_name, aliases)
+        self._roots[normalized_name] = root_id
+        self._root_names[name] = root_id
+        for alias in aliases:
+            self._aliases[alias] = root_id
+
+    def _drop_root(self, root_id: int):
+        entry = self._root_by_id.pop(root_id, None)
+        if not entry:
+            return
+        name, normalized_name, aliases = entry
+        if self._roots.get(normalized_name) == root_id:
+            del self._roots[normalized_name]
+        if self._root_names.get(name) == root_id:
+            del self._root_names[name]
+        for alias in aliases:
+            if self._aliases.get(alias) == root_id:
+                del self._aliases[alias]
+
+    def _put_field(self, field_id: int, field_name: str, normalized_name: str):
+        self._field_by_id[field_id] = (field_name, normalized_name)
+        self._fields[normalized_name] = field_id
+
+    def _drop_field(self, field_id: int):
+        entry = self._field_by_id.pop(field_id, None)
+        if entry and self._fields.get(entry[1]) == field_id:
+            del self._fields[entry[1]]
+
+def _parse_aliases(aliases) -> Set[str]:
+    """解析JSON格式的别名列表"""
+    if not aliases:
+        return set()
+    if isinstance(aliases, list):
+        return set(aliases)
+    try:
+        return set(json.loads(aliases))
+    except (ValueError, TypeError):
+        return set()
+
+# 创建全局名称注册表实例
+name_registry = NameRegistry()
@@ -1,11 +1,26 @@
 import re
 import unicodedata
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+# 预编译正则
+_WHITESPACE = re.compile(r'\s+')
+_INVALID_CHARS = re.compile(r'[^a-z0-9_]')
+_MULTI_UNDERSCORE = re.compile(r'_+')
+_STARTS_WITH_LETTER = re.compile(r'^[a-z]')
+_VALID_CHARS = re.compile(r'^[a-z0-9_]+$')
+# 已是规范 snake_case 的名称（ASCII 快速路径）：规范化结果即自身，且必然通过校验
+_SNAKE_CASE = re.compile(r'[a-z][a-z0-9]*(?:_[a-z0-9]+)*')
+
+# 规范化结果缓存上限（按名称条目计）
+NORMALIZE_CACHE_SIZE = 65536
 
 def normalize_name(name: str) -> str:
     """
     规范化名称：转换为snake_case标准格式
     
+    结果按输入缓存（有上限的LRU），重复名称无需再次计算。
+    
     Args:
         name: 输入的名称
         
@@ -14,27 +29,48 @@ def normalize_name(name: str) -> str:
     """
     if not name:
         return ""
+    return _normalize_cached(name)
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_cached(name: str) -> str:
+    # 快速路径：已是规范名称
+    if _SNAKE_CASE.fullmatch(name):
+        return name
     
-    # 1. 全角转半角
-    name = unicodedata.normalize('NFKC', name)
+    # 1. 全角转半角（纯ASCII输入NFKC不变，跳过）
+    if not name.isascii():
+        name = unicodedata.normalize('NFKC', name)
     
     # 2. 转换为小写
     name = name.lower()
     
     # 3. 处理空白字符
-    name = re.sub(r'\s+', '_', name.strip())
+    name = _WHITESPACE.sub('_', name.strip())
     
     # 4. 处理特殊字符，只保留字母、数字、下划线
-    name = re.sub(r'[^a-z0-9_]', '', name)
+    name = _INVALID_CHARS.sub('', name)
     
     # 5. 处理连续下划线
-    name = re.sub(r'_+', '_', name)
+    name = _MULTI_UNDERSCORE.sub('_', name)
     
     # 6. 去除首尾下划线
     name = name.strip('_')
     
     return name
 
+def normalize_many(names: Iterable[str]) -> List[str]:
+    """
+    批量规范化名称（批量导入、全量重新校验）
+    
+    Args:
+        names: 输入的名称序列
+        
+    Returns:
+        与输入一一对应的规范化名称列表
+    """
+    normalize = _normalize_cached
+    return [normalize(name) if name else "" for name in names]
+
 def validate_name(name: str, max_length: int = 64) -> tuple[bool, Optional[str]]:
     """
     验证名称是否符合规范
@@ -53,11 +89,11 @@ def validate_name(name: str, max_length: int = 64) -> tuple[bool, Optional[str]]
         return False, f"名称长度不能超过{max_length}个字符"
     
     # 检查是否以字母开头
-    if not re.match(r'^[a-z]', name):
+    if not _STARTS_WITH_LETTER.match(name):
         return False, "名称必须以小写字母开头"
     
     # 检查是否只包含合法字符
-    if not re.match(r'^[a-z0-9_]+$', name):
+    if not _VALID_CHARS.match(name):
         return False, "名称只能包含小写字母、数字和下划线"
     
     # 检查连续下划线
@@ -70,13 +106,38 @@ def validate_name(name: str, max_length: int = 64) -> tuple[bool, Optional[str]]
     
     return True, None
 
-def generate_normalized_name(base_name: str, existing_names: list[str], max_length: int = 64) -> str:
+def validate_many(names: Iterable[str], max_length: int = 64) -> List[Tuple[bool, Optional[str]]]:
+    """
+    批量验证名称，规范 snake_case 名称只做一次正则匹配，其余逐项给出具体错误
+    
+    Args:
+        names: 要验证的名称序列
+        max_length: 最大长度限制
+        
+    Returns:
+        与输入一一对应的 (是否有效, 错误信息) 列表
+    """
+    valid = (True, None)
+    snake_case = _SNAKE_CASE.fullmatch
+    return [
+        valid if name and len(name) <= max_length and snake_case(name) else validate_name(name, max_length)
+        for name in names
+    ]
+
+def suffixed_name(base: str, suffix: int, max_length: int = 64) -> str:
+    """拼接数字后缀（base_N），超长时截断基础名并去掉截断处的下划线"""
+    tail = f"_{suffix}"
+    if len(base) + len(tail) > max_length:
+        base = base[:max_length - len(tail)].rstrip('_')
+    return base + tail
+
+def generate_normalized_name(base_name: str, existing_names: Iterable[str], max_length: int = 64) -> str:
     """
     生成规范化的名称，如果冲突则自动添加后缀
     
     Args:
         base_name: 基础名称
-        existing_names: 已存在的名称列表
+        existing_names: 已存在的名称（集合或列表，列表会先转为集合）
         max_length: 最大长度限制
         
     Returns:
@@ -87,26 +148,17 @@ def generate_normalized_name(base_name: str, existing_names: list[str], max_leng
     if not normalized:
         normalized = "unnamed"
     
+    taken = existing_names if isinstance(existing_names, (set, frozenset, dict)) else set(existing_names)
+    
     # 如果名称可用，直接返回
-    if normalized not in existing_names:
+    if normalized not in taken:
         return normalized
     
-    # 生成带后缀的名称
-    counter = 1
-    while counter < 1000:  # 防止无限循环
-        suffix = f"_{counter}"
-        new_name = normalized + suffix
-        
-        # 检查长度限制
-        if len(new_name) <= max_length and new_name not in existing_names:
-            return new_name
-        
-        counter += 1
-    
-    # 如果还是冲突，使用时间戳后缀
-    import time
-    timestamp = int(time.time() % 10000)
-    return f"{normalized}_{timestamp}"
+    # 取第一个空闲的数字后缀（超长时截断基础名，不再退回时间戳后缀）
+    suffix = 1
+    while suffixed_name(normalized, suffix, max_length) in taken:
+        suffix += 1
+    return suffixed_name(normalized, suffix, max_length)
 
 def is_atomic_root(name: str) -> bool:
     """
@@ -0,0 +1,183 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import DateTime, String, and_, or_, type_coerce
+from sqlalchemy.orm import Query
+
+from app.core.exceptions import ValidationException
+from app.core.response import ErrorCodes
+
+# 排序方向
+SORT_ORDERS = ("asc", "desc")
+
+def page_window(page: Optional[int], page_size: int) -> Tuple[int, Optional[int]]:
+    """页码转换为 (偏移量, 条数)；页码为空时返回全部"""
+    if page is None:
+        return 0, None
+    return (page - 1) * page_size, page_size
+
+def encode_cursor(sort: str, order: str, value: Any, last_id: int) -> str:
+    """
+    生成不透明的分页游标
+
+    Args:
+        sort: 排序字段名
+        order: 排序方向
+        value: 当前页最后一条记录的排序值
+        last_id: 当前页最后一条记录的ID
+
+    Returns:
+        URL安全的游标字符串
+    """
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps({"s": sort, "o": order, "v": value, "i": last_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str, sort: str, order: str, is_datetime: bool = False) -> Tuple[Any, int]:
+    """
+    解析分页游标
+
+    Returns:
+        (排序值, 记录ID)
+
+    Raises:
+        ValidationException: 游标无效或与当前排序不一致
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if payload["s"] != sort or payload["o"] != order:
+            raise ValueError("cursor sort mismatch")
+        value = payload["v"]
+        if is_datetime and value is not None:
+            value = datetime.fromisoformat(value)
+        return value, int(payload["i"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValidationException(
+            error_code=ErrorCodes.INVALID_PARAMETER,
+            message="无效的分页游标",
+            errors=[f"无效的分页游标: {e}"]
+        )
+
+def _datetime_bind_value(query: Query, value: datetime):
+    """
+    生成与存储格式一致的时间比较值
+
+    SQLite 以文本存储时间，server_default 写入的 CURRENT_TIMESTAMP 不带微秒，
+    而 DateTime 绑定参数总是带微秒，直接比较会错位，这里按存储格式绑定文本。
+    """
+    if query.session.get_bind().dialect.name != "sqlite":
+        return value
+    text = value.strftime("%Y-%m-%d %H:%M:%S")
+    if value.microsecond:
+        text += f".{value.microsecond:06d}"
+    return type_coerce(text, String)
+
+def paginate_query(
+    query: Query,
+    sort_column,
+    id_column,
+    sort: str = "id",
+    order: str = "asc",
+    skip: int = 0,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    include_total: bool = True
+) -> Tuple[List[Any], Optional[int], Optional[str]]:
+    """
+    按 (排序字段, ID) 稳定排序分页，支持页码与游标两种方式
+
+    传入 cursor 时使用键集分页（忽略 skip），每页代价与页深无关；
+    总数仅在首页（无游标）且 include_total 为真时统计。
+
+    Returns:
+        (记录列表, 总数或None, 下一页游标或None)
+    """
+    if order not in SORT_ORDERS:
+        raise ValidationException(
+            error_code=ErrorCodes.INVALID_PARAMETER,
+            message="无效的排序方向",
+            errors=[f"排序方向必须为: {', '.join(SORT_ORDERS)}"]
+        )
+
+    descending = order == "desc"
+    is_datetime = isinstance(sort_column.type, DateTime)
+
+    total = None
+    if include_total and not cursor:
+        total = query.order_by(None).count()
+
+    if cursor:
+        value, last_id = decode_cursor(cursor, sort, order, is_datetime)
+        if is_datetime and value is not None:
+            value = _datetime_bind_value(query, value)
+        if sort_column is id_column:
+            query = query.filter(id_column < last_id if descending else id_column > last_id)
+        elif descending:
+            query = query.filter(or_(
+                sort_column < value,
+                and_(sort_column == value, id_column < last_id)
+            ))
+        else:
+            query = query.filter(or_(
+                sort_column > value,
+                and_(sort_column == value, id_column > last_id)
+            ))
+
+    if sort_column is id_column:
+        ordering = [id_column.desc() if descending else id_column.asc()]
+    else:
+        ordering = [
+            sort_column.desc() if descending else sort_column.asc(),
+            id_column.desc() if descending else id_column.asc()
+        ]
+    query = query.order_by(*ordering)
+    if skip and not cursor:
+        query = query.offset(skip)
+
+    # 多取一条用于判断是否还有下一页
+    items = query.limit(limit + 1).all()
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor(sort, order, getattr(last, sort_column.key), getattr(last, id_column.key))
+
+    return items, total, next_cursor
+
+def paginate_ranked(
+    query: Query,
+    ordering: List[Any],
+    sort: str = "relevance",
+    skip: int = 0,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    include_total: bool = True
+) -> Tuple[List[Any], Optional[int], Optional[str]]:
+    """
+    按相关度等计算表达式排序分页
+
+    相关度不是可索引列，无法做键集分页，游标中记录的是偏移量，
+    对客户端仍是同样的不透明游标。
+
+    Returns:
+        (记录列表, 总数或None, 下一页游标或None)
+    """
+    total = None
+    if include_total and not cursor:
+        total = query.order_by(None).count()
+
+    offset = skip
+    if cursor:
+        _, offset = decode_cursor(cursor, sort, "rank")
+
+    items = query.order_by(*ordering).offset(offset).limit(limit + 1).all()
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(sort, "rank", None, offset + limit)
+
+    return items, total, next_cursor
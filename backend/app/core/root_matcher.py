@@ -0,0 +1,273 @@
+import logging
+import threading
+import unicodedata
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.core.name_registry import RegistryListener, name_registry
+
+logger = logging.getLogger(__name__)
+
+_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+
+def prepare_text(text: str) -> Tuple[str, List[int]]:
+    """
+    把任意文本转换为与规范化名同形的串，并记录每个字符在原文中的位置
+
+    小写化；驼峰处插入下划线；非字母数字（空白、标点、中文等）折叠为单个下划线。
+    "客户UserType 注册" -> "_user_type_"
+    """
+    chars: List[str] = []
+    positions: List[int] = []
+    previous_lower = False
+    for index, char in enumerate(text):
+        expanded = char if char.isascii() else unicodedata.normalize('NFKC', char)
+        for part in expanded:
+            lower = part.lower()
+            if lower in _WORD_CHARS and part.isascii():
+                if part.isupper() and previous_lower:
+                    chars.append("_")
+                    positions.append(index)
+                chars.append(lower)
+                positions.append(index)
+                previous_lower = part.islower() or part.isdigit()
+            else:
+                if not chars or chars[-1] != "_":
+                    chars.append("_")
+                    positions.append(index)
+                previous_lower = False
+    return "".join(chars), positions
+
+class _Automaton:
+    """Aho–Corasick 自动机（构建后只读，可在锁外并发查询）"""
+
+    __slots__ = ("goto", "fail", "output", "dict_link")
+
+    def __init__(self, keys):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.output: List[Optional[str]] = [None]   # 以该状态结尾的词项
+        for key in keys:
+            state = 0
+            for char in key:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.output.append(None)
+                state = next_state
+            self.output[state] = key
+
+        # 广度优先计算失败指针与输出链接（指向最近的有输出的后缀状态）
+        self.fail = [0] * len(self.goto)
+        self.dict_link = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                link = self.fail[next_state]
+                self.dict_link[next_state] = link if self.output[link] is not None else self.dict_link[link]
+
+    def scan(self, text: str):
+        """单次扫描，逐个产出 (结束位置, 词项)"""
+        goto, fail, output, dict_link = self.goto, self.fail, self.output, self.dict_link
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            hit = state if output[state] is not None else dict_link[state]
+            while hit:
+                yield end, output[hit]
+                hit = dict_link[hit]
+
+class RootMatcher(RegistryListener):
+    """
+    多词根匹配
+
+    对所有词根规范化名与别名构建 Aho–Corasick 自动机，单次扫描即可找出业务描述、
+    中英文/拼音混排文本中出现的全部词根，耗时与文本长度及命中数成正比，与词根总数无关。
+
+    自动机的失败指针依赖全体词项，词根变更后在后台线程中重建（短暂合并连续变更）。
+    重建完成前继续使用旧自动机，同时对期间新增的词项另建一个小自动机一并扫描（增量部分），
+    命中结果按当前词根表过滤，已删除的词根不会返回。
+    """
+
+    # 增量词项超过此数量时直接同步重建
+    MAX_DELTA_KEYS = 256
+
+    def __init__(self, rebuild_delay: float = 0.2):
+        self.rebuild_delay = rebuild_delay
+        self._lock = threading.RLock()
+        self._automaton: Optional[_Automaton] = None
+        self._keys: Dict[str, Set[int]] = {}                          # 词项 -> 词根ID集合
+        self._roots: Dict[int, Tuple[str, str, Set[str]]] = {}       # 词根ID -> (原始名, 规范化名, 别名集合)
+        self._generation = 0          # 词项变更计数
+        self._built_generation = -1   # 当前自动机对应的变更计数
+        self._rebuild_pending = False
+        self._built_keys: Set[str] = set()          # 当前自动机包含的词项
+        self._delta_keys: Set[str] = set()          # 自动机构建后新增的词项
+        self._delta: Optional[Tuple[int, _Automaton]] = None  # (变更计数, 增量自动机)
+
+    # ---- 注册表回调 ----
+
+    def on_load(self, roots, fields):
+        with self._lock:
+            self._keys.clear()
+            self._roots.clear()
+            for root_id, (name, normalized_name, aliases) in roots.items():
+                self._add_root(root_id, name, normalized_name, aliases)
+            self._generation += 1
+            self._build()
+
+    def on_root_upsert(self, root_id, name, normalized_name, aliases):
+        with self._lock:
+            self._remove_root(root_id)
+            self._add_root(root_id, name, normalized_name, set(aliases))
+            self._schedule_rebuild()
+
+    def on_root_remove(self, root_id):
+        with self._lock:
+            self._remove_root(root_id)
+            self._schedule_rebuild()
+
+    # ---- 匹配 ----
+
+    def match(self, text: str, whole_word: bool = True, longest_only: bool = True) -> Dict:
+        """
+        扫描文本中出现的词根
+
+        Args:
+            text: 业务描述等任意文本
+            whole_word: 只匹配完整单词（两侧为边界），否则允许匹配单词内部
+            longest_only: 去掉被更长命中完全包含的命中（如 user_type 中的 user、type）
+
+        Returns:
+            {"matches": [按出现位置排列的命中], "roots": [按命中次数排列的词根汇总]}
+        """
+        prepared, positions = prepare_text(text)
+        with self._lock:
+            if (
+                self._automaton is None
+                or len(self._delta_keys) > self.MAX_DELTA_KEYS
+                or (self._built_generation != self._generation and not self._rebuild_pending)
+            ):
+                self._build()
+            automata = [self._automaton]
+            if self._delta_keys:
+                if self._delta is None or self._delta[0] != self._generation:
+                    self._delta = (self._generation, _Automaton(sorted(self._delta_keys)))
+                automata.append(self._delta[1])
+
+        hits = set()
+        for automaton in automata:
+            for end, key in automaton.scan(prepared):
+                start = end - len(key)
+                if whole_word and not (
+                    (start == 0 or prepared[start - 1] == "_") and (end == len(prepared) or prepared[end] == "_")
+                ):
+                    continue
+                hits.add((start, end, key))
+        hits = list(hits)
+
+        if longest_only:
+            hits.sort(key=lambda hit: (hit[0], hit[0] - hit[1]))
+            kept, covered_until = [], -1
+            for hit in hits:
+                if hit[1] > covered_until:
+                    kept.append(hit)
+                    covered_until = hit[1]
+            hits = kept
+        else:
+            hits.sort(key=lambda hit: (hit[0], hit[0] - hit[1]))
+
+        matches, counts = [], {}
+        with self._lock:
+            for start, end, key in hits:
+                # 自动机可能尚未重建，按当前词根表核对
+                for root_id in sorted(self._keys.get(key, ())):
+                    name, normalized_name, _ = self._roots[root_id]
+                    matches.append({
+                        "root_id": root_id,
+                        "name": name,
+                        "matched": key,
+                        "is_alias": key != normalized_name,
+                        "start": positions[start],
+                        "end": positions[end - 1] + 1
+                    })
+                    counts[root_id] = counts.get(root_id, 0) + 1
+            roots = [
+                {"root_id": root_id, "name": self._roots[root_id][0], "count": count}
+                for root_id, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+            ]
+        return {"matches": matches, "roots": roots}
+
+    # ---- 内部方法 ----
+
+    def _add_root(self, root_id: int, name: str, normalized_name: str, aliases: Set[str]):
+        self._roots[root_id] = (name, normalized_name, aliases)
+        for key in {normalized_name, *aliases}:
+            if key:
+                self._keys.setdefault(key, set()).add(root_id)
+                if key not in self._built_keys:
+                    self._delta_keys.add(key)
+
+    def _remove_root(self, root_id: int):
+        entry = self._roots.pop(root_id, None)
+        if not entry:
+            return
+        _, normalized_name, aliases = entry
+        for key in {normalized_name, *aliases}:
+            owners = self._keys.get(key)
+            if owners is not None:
+                owners.discard(root_id)
+                if not owners:
+                    del self._keys[key]
+
+    def _build(self):
+        """在当前线程中重建（调用方持有锁）"""
+        self._install(_Automaton(list(self._keys)), set(self._keys), self._generation)
+
+    def _install(self, automaton: _Automaton, keys: Set[str], generation: int):
+        """换入新自动机，增量词项只保留其中没有的部分（调用方持有锁）"""
+        self._automaton = automaton
+        self._built_keys = keys
+        self._built_generation = generation
+        self._delta_keys = {key for key in self._delta_keys if key not in keys and key in self._keys}
+        self._delta = None
+
+    def _schedule_rebuild(self):
+        self._generation += 1
+        if self._automaton is None or self._rebuild_pending:
+            return
+        self._rebuild_pending = True
+        timer = threading.Timer(self.rebuild_delay, self._rebuild_in_background)
+        timer.daemon = True
+        timer.start()
+
+    def _rebuild_in_background(self):
+        try:
+            while True:
+                with self._lock:
+                    generation = self._generation
+                    keys = set(self._keys)
+                automaton = _Automaton(list(keys))
+                with self._lock:
+                    self._install(automaton, keys, generation)
+                    if self._generation == generation:
+                        return
+        except Exception as e:
+            logger.error(f"词根匹配自动机重建失败: {e}")
+        finally:
+            with self._lock:
+                self._rebuild_pending = False
+
+# 创建全局词根匹配实例
+root_matcher = RootMatcher()
+name_registry.add_listener(root_matcher)
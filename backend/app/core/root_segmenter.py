@@ -0,0 +1,200 @@
+import re
+import threading
+import unicodedata
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from app.core.name_registry import RegistryListener, name_registry
+
+# 拆分驼峰、下划线、数字等原始单词边界
+_WORDS = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+')
+
+_TERMINAL = ""  # 前缀树中标记词项结尾的键
+
+def split_identifier(name: str) -> Tuple[str, Set[int]]:
+    """
+    把任意标识符转换为小写字母数字串，并记录原始单词边界
+
+    "CustomerRegisterTime" -> ("customerregistertime", {0, 8, 16, 20})
+    """
+    if not name.isascii():
+        name = unicodedata.normalize('NFKC', name)
+    text, boundaries = "", {0}
+    for word in _WORDS.findall(name):
+        text += word.lower()
+        boundaries.add(len(text))
+    return text, boundaries
+
+class RootSegmenter(RegistryListener):
+    """
+    词根切分
+
+    对词根规范化名与别名（去掉下划线，以便 user_type 匹配 UserType）建立字符前缀树，
+    在输入串上做动态规划：每个位置只沿前缀树向后匹配不超过最长词项的长度，
+    整体耗时与输入长度成线性。每个位置保留前若干个最优切分，按以下顺序比较：
+    覆盖字符数 > 切分点落在原始单词边界的个数 > 词根数更少 > 词根使用次数之和。
+    只差在未匹配字符位置的切分会拼出相同的字段名，结果按字段名去重。
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._trie: Dict = {}
+        self._max_length = 0
+        self._root_terms: Dict[int, List[str]] = {}   # 词根ID -> 前缀树中的键
+        self._root_names: Dict[int, str] = {}         # 词根ID -> 规范化名
+
+    # ---- 注册表回调 ----
+
+    def on_load(self, roots, fields):
+        with self._lock:
+            self._trie = {}
+            self._max_length = 0
+            self._root_terms.clear()
+            self._root_names.clear()
+            for root_id, (name, normalized_name, aliases) in roots.items():
+                self._add_root(root_id, normalized_name, aliases)
+
+    def on_root_upsert(self, root_id, name, normalized_name, aliases):
+        with self._lock:
+            self._remove_root(root_id)
+            self._add_root(root_id, normalized_name, aliases)
+
+    def on_root_remove(self, root_id):
+        with self._lock:
+            self._remove_root(root_id)
+
+    # ---- 切分 ----
+
+    def segment(self, name: str, top_k: int = 3, weight: Callable[[int], int] = lambda root_id: 0) -> List[Dict]:
+        """
+        把标识符切分为已知词根序列
+
+        Args:
+            name: 任意格式的标识符（custregts、CustomerRegisterTime、cust_reg_ts 等）
+            top_k: 返回的候选切分数
+            weight: 词根ID -> 使用次数
+
+        Returns:
+            按排序规则从优到劣的候选切分列表
+        """
+        text, boundaries = split_identifier(name)
+        if not text:
+            return []
+
+        # 多保留几个候选，抵消去重后的损失
+        beam = top_k + 2
+        with self._lock:
+            trie, max_length = self._trie, self._max_length
+            n = len(text)
+            # best[i]: 切分 text[:i] 的前 k 个候选，元素为 (得分, 回溯链)
+            # 得分 = (覆盖字符数, 边界对齐切分点数, -词根数, 使用次数)；回溯链 = (上一条链, 起点, 终点, 词根ID或None)
+            best: List[List[Tuple[Tuple[int, int, int, int], Optional[tuple]]]] = [[] for _ in range(n + 1)]
+            best[0] = [((0, 0, 0, 0), None)]
+            for start in range(n):
+                if not best[start]:
+                    continue
+                aligned = 1 if start in boundaries else 0
+                # 无法匹配时跳过一个字符（未覆盖）
+                self._extend(best[start + 1], best[start], (0, 0, 0, 0), start, start + 1, None, beam)
+                node = trie
+                for end in range(start + 1, min(n, start + max_length) + 1):
+                    node = node.get(text[end - 1])
+                    if node is None:
+                        break
+                    owners = node.get(_TERMINAL)
+                    if not owners:
+                        continue
+                    root_id = max(owners, key=lambda owner: (weight(owner), -owner))
+                    gain = (end - start, aligned + (1 if end in boundaries else 0), -1, weight(root_id))
+                    self._extend(best[end], best[start], gain, start, end, root_id, beam)
+
+            results, seen = [], set()
+            for score, chain in sorted(best[n], key=lambda item: item[0], reverse=True):
+                if score[0] == 0:
+                    continue
+                result = self._build_result(text, score, chain, weight)
+                if result["field_name"] not in seen:
+                    seen.add(result["field_name"])
+                    results.append(result)
+                    if len(results) >= top_k:
+                        break
+            return results
+
+    # ---- 内部方法 ----
+
+    @staticmethod
+    def _extend(target: List, source: List, gain: Tuple[int, int, int, int], start: int, end: int, root_id: Optional[int], beam: int):
+        """把 source 中的候选延伸一段后并入 target，保留前 beam 个"""
+        for score, chain in source:
+            new_score = tuple(a + b for a, b in zip(score, gain))
+            target.append((new_score, (chain, start, end, root_id)))
+        if len(target) > beam:
+            target.sort(key=lambda item: item[0], reverse=True)
+            del target[beam:]
+
+    def _build_result(self, text: str, score: Tuple[int, int, int, int], chain, weight) -> Dict:
+        pieces = []
+        while chain is not None:
+            chain, start, end, root_id = chain
+            pieces.append((start, end, root_id))
+        pieces.reverse()
+
+        # 合并连续未匹配字符
+        segments = []
+        for start, end, root_id in pieces:
+            if root_id is None and segments and segments[-1]["root_id"] is None:
+                segments[-1]["end"] = end
+                segments[-1]["text"] = text[segments[-1]["start"]:end]
+                continue
+            segments.append({
+                "text": text[start:end],
+                "start": start,
+                "end": end,
+                "root_id": root_id,
+                "root_name": self._root_names.get(root_id) if root_id is not None else None,
+                "usage_count": weight(root_id) if root_id is not None else 0
+            })
+
+        covered = score[0]
+        return {
+            "segments": segments,
+            "coverage": round(covered / len(text), 4),
+            "usage_count": score[3],
+            "field_name": "_".join(segment["root_name"] or segment["text"] for segment in segments)
+        }
+
+    def _add_root(self, root_id: int, normalized_name: str, aliases: Set[str]):
+        keys = list(dict.fromkeys(term.replace("_", "") for term in (normalized_name, *aliases)))
+        keys = [key for key in keys if key]
+        self._root_terms[root_id] = keys
+        self._root_names[root_id] = normalized_name
+        for key in keys:
+            node = self._trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node.setdefault(_TERMINAL, set()).add(root_id)
+            self._max_length = max(self._max_length, len(key))
+
+    def _remove_root(self, root_id: int):
+        self._root_names.pop(root_id, None)
+        for key in self._root_terms.pop(root_id, ()):
+            path = [self._trie]
+            for char in key:
+                node = path[-1].get(char)
+                if node is None:
+                    break
+                path.append(node)
+            else:
+                owners = path[-1].get(_TERMINAL)
+                if owners:
+                    owners.discard(root_id)
+                    if not owners:
+                        del path[-1][_TERMINAL]
+                # 自底向上清理空节点
+                for depth in range(len(key), 0, -1):
+                    if path[depth]:
+                        break
+                    del path[depth - 1][key[depth - 1]]
+
+# 创建全局词根切分实例
+root_segmenter = RootSegmenter()
+name_registry.add_listener(root_segmenter)
@@ -0,0 +1,155 @@
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.core.name_registry import RegistryListener, name_registry
+
+def trigrams(term: str) -> Set[str]:
+    """生成带边界填充的三元组（短词也至少有3个）"""
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def bounded_levenshtein(a: str, b: str, max_distance: int) -> Optional[int]:
+    """
+    计算编辑距离，超过 max_distance 时提前返回 None
+
+    Returns:
+        编辑距离，或 None（超出阈值）
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    if a == b:
+        return 0
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, char_b in enumerate(b, 1):
+            cost = 0 if char_a == char_b else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            current.append(value)
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return None
+        previous = current
+
+    distance = previous[-1]
+    return distance if distance <= max_distance else None
+
+class RootSuggester(RegistryListener):
+    """
+    相似词根推荐
+
+    对词根规范化名与别名建立三元组倒排索引：先按共享三元组数筛选候选，
+    再用带阈值的编辑距离校验，避免对全部词根逐一计算。
+    每次编辑最多破坏3个三元组，因此距离不超过 d 的词至少共享 |grams(q)| - 3d 个三元组。
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._terms: Dict[str, Tuple[int, bool]] = {}      # 词项 -> (词根ID, 是否别名)
+        self._grams: Dict[str, Set[str]] = {}               # 三元组 -> 词项集合
+        self._root_terms: Dict[int, List[str]] = {}         # 词根ID -> 词项列表
+        self._root_names: Dict[int, str] = {}               # 词根ID -> 词根名
+
+    # ---- 注册表回调 ----
+
+    def on_load(self, roots, fields):
+        with self._lock:
+            self._terms.clear()
+            self._grams.clear()
+            self._root_terms.clear()
+            self._root_names.clear()
+            for root_id, (name, normalized_name, aliases) in roots.items():
+                self._add_root(root_id, name, normalized_name, aliases)
+
+    def on_root_upsert(self, root_id, name, normalized_name, aliases):
+        with self._lock:
+            self._remove_root(root_id)
+            self._add_root(root_id, name, normalized_name, aliases)
+
+    def on_root_remove(self, root_id):
+        with self._lock:
+            self._remove_root(root_id)
+
+    # ---- 查询 ----
+
+    def suggest(self, query: str, limit: int = 5, max_distance: int = 2) -> List[Dict]:
+        """
+        查找与输入最相近的词根
+
+        Args:
+            query: 规范化后的输入
+            limit: 最多返回数量
+            max_distance: 最大编辑距离
+
+        Returns:
+            按编辑距离升序的推荐列表，每个词根只出现一次
+        """
+        if not query:
+            return []
+
+        query_grams = trigrams(query)
+        threshold = max(1, len(query_grams) - 3 * max_distance)
+
+        with self._lock:
+            overlap = Counter()
+            for gram in query_grams:
+                terms = self._grams.get(gram)
+                if terms:
+                    overlap.update(terms)
+
+            best: Dict[int, Tuple[int, int, str, bool]] = {}
+            for term, shared in overlap.items():
+                if shared < threshold:
+                    continue
+                distance = bounded_levenshtein(query, term, max_distance)
+                if distance is None:
+                    continue
+                root_id, is_alias = self._terms[term]
+                candidate = (distance, -shared, term, is_alias)
+                if root_id not in best or candidate < best[root_id]:
+                    best[root_id] = candidate
+
+            ranked = sorted(best.items(), key=lambda item: item[1])[:limit]
+            return [
+                {
+                    "root_id": root_id,
+                    "name": self._root_names[root_id],
+                    "matched": term,
+                    "is_alias": is_alias,
+                    "distance": distance
+                }
+                for root_id, (distance, _, term, is_alias) in ranked
+            ]
+
+    # ---- 内部方法（调用方持有锁） ----
+
+    def _add_root(self, root_id: int, name: str, normalized_name: str, aliases: Set[str]):
+        self._root_names[root_id] = name
+        terms = [(normalized_name, False)] + [(alias, True) for alias in sorted(aliases)]
+        self._root_terms[root_id] = []
+        for term, is_alias in terms:
+            if term in self._terms:
+                continue
+            self._terms[term] = (root_id, is_alias)
+            self._root_terms[root_id].append(term)
+            for gram in trigrams(term):
+                self._grams.setdefault(gram, set()).add(term)
+
+    def _remove_root(self, root_id: int):
+        self._root_names.pop(root_id, None)
+        for term in self._root_terms.pop(root_id, []):
+            self._terms.pop(term, None)
+            for gram in trigrams(term):
+                terms = self._grams.get(gram)
+                if terms is not None:
+                    terms.discard(term)
+                    if not terms:
+                        del self._grams[gram]
+
+# 创建全局相似词根推荐实例，随名称注册表增量维护
+root_suggester = RootSuggester()
+name_registry.add_listener(root_suggester)
@@ -0,0 +1,208 @@
+import re
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.name_registry import RegistryListener, name_registry
+from app.core.normalization import suffixed_name
+
+_NUMBERED = re.compile(r'(.+)_([1-9][0-9]*)')
+
+def split_suffix(name: str) -> Tuple[str, Optional[int]]:
+    """拆分数字后缀：user_id_3 -> ("user_id", 3)，无后缀时返回 (name, None)"""
+    match = _NUMBERED.fullmatch(name)
+    if not match:
+        return name, None
+    return match.group(1), int(match.group(2))
+
+class SuffixAllocator(RegistryListener):
+    """
+    名称数字后缀分配器
+
+    按基础名维护已占用的数字后缀（词根规范化名、别名与字段规范化名统一计入），
+    一次查找即可给出前 k 个空闲后缀，无需逐个探测 base_1、base_2……
+
+    建议名称只读不预留。真正的创建在事务内通过 claim 预留要写入的名称，
+    并发的其他创建与建议都会跳过这些名称；事务提交或回滚后释放，
+    超时只作为会话异常退出时的兜底。
+    """
+
+    def __init__(self, reservation_ttl: float = 60.0):
+        self.reservation_ttl = reservation_ttl
+        self._lock = threading.RLock()
+        self._names: Dict[str, int] = {}                   # 名称 -> 引用计数
+        self._suffixes: Dict[str, Set[int]] = {}           # 基础名 -> 已占用后缀
+        self._owners: Dict[Tuple[str, int], List[str]] = {}  # ("root"/"field", ID) -> 名称列表
+        self._reserved: Dict[str, Tuple[int, float]] = {}  # 预留名称 -> (会话标识, 过期时间)
+        self._next_prune = 0.0
+
+    # ---- 注册表回调 ----
+
+    def on_load(self, roots, fields):
+        with self._lock:
+            self._names.clear()
+            self._suffixes.clear()
+            self._owners.clear()
+            for root_id, (name, normalized_name, aliases) in roots.items():
+                self._add_owner(("root", root_id), [normalized_name, *aliases])
+            for field_id, (field_name, normalized_name) in fields.items():
+                self._add_owner(("field", field_id), [normalized_name])
+
+    def on_root_upsert(self, root_id, name, normalized_name, aliases):
+        with self._lock:
+            self._remove_owner(("root", root_id))
+            self._add_owner(("root", root_id), [normalized_name, *aliases])
+
+    def on_root_remove(self, root_id):
+        with self._lock:
+            self._remove_owner(("root", root_id))
+
+    def on_field_upsert(self, field_id, field_name, normalized_name):
+        with self._lock:
+            self._remove_owner(("field", field_id))
+            self._add_owner(("field", field_id), [normalized_name])
+
+    def on_field_remove(self, field_id):
+        with self._lock:
+            self._remove_owner(("field", field_id))
+
+    # ---- 分配 ----
+
+    def next_free(
+        self,
+        base: str,
+        count: int = 1,
+        max_length: int = 64,
+        exclude: Iterable[str] = ()
+    ) -> List[str]:
+        """
+        返回基础名的前 count 个空闲带后缀名称（base_1、base_2……），跳过进行中的创建已预留的名称
+
+        Args:
+            base: 规范化后的基础名
+            count: 需要的名称数量
+            max_length: 名称最大长度，超长时截断基础名
+            exclude: 额外视为已占用的名称（如同一批次内已使用的名称）
+        """
+        excluded = set(exclude)
+        result = []
+        with self._lock:
+            now = time.monotonic()
+            used = self._suffixes.get(base, ())
+            suffix = 0
+            while len(result) < count:
+                suffix += 1
+                candidate = suffixed_name(base, suffix, max_length)
+                if candidate.startswith(base + "_"):
+                    # 未截断：直接查该基础名的已占用后缀
+                    taken = suffix in used or self._is_reserved(candidate, now)
+                else:
+                    taken = self._is_taken(candidate, now)
+                if not taken and candidate not in excluded:
+                    result.append(candidate)
+        return result
+
+    def claim(self, db: Session, names: Iterable[str]) -> List[str]:
+        """
+        为当前事务预留即将写入的名称，提交或回滚后自动释放
+
+        全部成功或全部不预留：任一名称已被其他进行中的事务预留时，本次不预留任何名称。
+
+        Returns:
+            已被其他进行中的事务预留的名称（非空时调用方应放弃写入）
+        """
+        owner = id(db)
+        names = list(dict.fromkeys(names))
+        with self._lock:
+            now = time.monotonic()
+            if now >= self._next_prune:
+                # 过期预留不影响判断，定期清理即可（逐行导入时每行都会调用）
+                self._prune(now)
+                self._next_prune = now + 1.0
+            conflicts = [
+                name for name in names
+                if self._is_reserved(name, now) and self._reserved[name][0] != owner
+            ]
+            if conflicts:
+                return conflicts
+            # 确保会话已开启事务，预留随该事务结束释放
+            db.connection()
+            expires_at = now + self.reservation_ttl
+            for name in names:
+                self._reserved[name] = (owner, expires_at)
+            db.info.setdefault("claimed_names", set()).update(names)
+        return []
+
+    def release(self, db: Session, names: Iterable[str]):
+        """释放该会话预留的名称"""
+        owner = id(db)
+        with self._lock:
+            for name in names:
+                entry = self._reserved.get(name)
+                if entry is not None and entry[0] == owner:
+                    del self._reserved[name]
+
+    def is_taken(self, name: str) -> bool:
+        """名称是否已被占用或预留"""
+        with self._lock:
+            return self._is_taken(name, time.monotonic())
+
+    # ---- 内部方法（调用方持有锁） ----
+
+    def _is_taken(self, name: str, now: float) -> bool:
+        base, suffix = split_suffix(name)
+        if suffix is None:
+            if name in self._names:
+                return True
+        elif suffix in self._suffixes.get(base, ()):
+            return True
+        return self._is_reserved(name, now)
+
+    def _is_reserved(self, name: str, now: float) -> bool:
+        entry = self._reserved.get(name)
+        return entry is not None and entry[1] > now
+
+    def _prune(self, now: float):
+        expired = [name for name, (_, expires_at) in self._reserved.items() if expires_at <= now]
+        for name in expired:
+            del self._reserved[name]
+
+    def _add_owner(self, owner: Tuple[str, int], names: List[str]):
+        names = [name for name in dict.fromkeys(names) if name]
+        self._owners[owner] = names
+        for name in names:
+            self._names[name] = self._names.get(name, 0) + 1
+            base, suffix = split_suffix(name)
+            if suffix is not None:
+                self._suffixes.setdefault(base, set()).add(suffix)
+
+    def _remove_owner(self, owner: Tuple[str, int]):
+        for name in self._owners.pop(owner, ()):
+            count = self._names.get(name, 0) - 1
+            if count > 0:
+                self._names[name] = count
+                continue
+            self._names.pop(name, None)
+            base, suffix = split_suffix(name)
+            if suffix is not None:
+                used = self._suffixes.get(base)
+                if used is not None:
+                    used.discard(suffix)
+                    if not used:
+                        del self._suffixes[base]
+
+# 创建全局后缀分配器实例
+suffix_allocator = SuffixAllocator()
+name_registry.add_listener(suffix_allocator)
+
+@event.listens_for(Session, "after_transaction_end")
+def _release_claimed_names(session: Session, transaction):
+    """最外层事务结束（提交、回滚或关闭会话）后释放本会话预留的名称"""
+    if transaction.parent is not None:
+        return
+    names = session.info.pop("claimed_names", None)
+    if names:
+        suffix_allocator.release(session, names)
@@ -0,0 +1,74 @@
+from typing import AsyncIterator, Optional
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from app.core.config import settings
+from app.db.database import register_sqlite_pragmas
+from app.db.search import register_search_functions
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 异步引擎按需创建：未启用异步模式时不要求安装 aiosqlite/asyncpg
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+
+def create_async_database_engine() -> AsyncEngine:
+    """创建异步数据库引擎"""
+    database_url = settings.get_async_database_url()
+    database_config = settings.get_database_config()
+
+    logger.info(f"连接异步数据库: {settings.DATABASE_TYPE}")
+
+    if settings.DATABASE_TYPE.lower() == "postgresql":
+        engine = create_async_engine(
+            database_url,
+            pool_size=database_config["pool_size"],
+            max_overflow=database_config["max_overflow"],
+            pool_timeout=database_config["pool_timeout"],
+            pool_recycle=database_config["pool_recycle"],
+            echo=database_config["echo"]
+        )
+        logger.info(f"PostgreSQL异步连接池配置: pool_size={database_config['pool_size']}, max_overflow={database_config['max_overflow']}")
+    else:
+        engine = create_async_engine(
+            database_url,
+            pool_size=database_config["pool_size"],
+            max_overflow=database_config["max_overflow"],
+            pool_timeout=database_config["pool_timeout"],
+            echo=database_config["echo"],
+            connect_args={"timeout": database_config["connect_args"]["timeout"]}
+        )
+        register_sqlite_pragmas(engine.sync_engine, database_config["pragmas"])
+        register_search_functions(engine.sync_engine)
+        logger.info("使用SQLite异步数据库")
+
+    return engine
+
+def get_async_engine() -> AsyncEngine:
+    """获取异步引擎（首次调用时创建）"""
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        _async_engine = create_async_database_engine()
+        # 提交后不过期对象：路由序列化响应时不能再触发懒加载IO
+        _async_session_factory = async_sessionmaker(
+            _async_engine, autoflush=False, expire_on_commit=False
+        )
+    return _async_engine
+
+def AsyncSessionLocal() -> AsyncSession:
+    """创建异步会话"""
+    get_async_engine()
+    return _async_session_factory()
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """获取异步数据库会话"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def close_async_database():
+    """关闭异步数据库连接"""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_session_factory = None
+        logger.info("异步数据库连接已关闭")
@@ -1,21 +1,32 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, insert, select
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import QueuePool
 from app.core.config import settings
+from app.db.pool_stats import PoolStats
+from app.db.search import register_search_functions
+from typing import Dict, Optional
+import json
 import logging
 
 # 配置日志
 logging.basicConfig(level=getattr(logging, settings.LOG_LEVEL))
 logger = logging.getLogger(__name__)
 
-def create_database_engine():
-    """创建数据库引擎"""
-    database_url = settings.get_database_url()
+def create_database_engine(database_url: Optional[str] = None, read_only: bool = False):
+    """
+    创建数据库引擎
+    
+    Args:
+        database_url: 连接URL，默认使用主库
+        read_only: 只读引擎（SQLite 只读连接不设置 journal_mode）
+    """
+    database_url = database_url or settings.get_database_url()
     database_config = settings.get_database_config()
     
-    logger.info(f"连接数据库: {settings.DATABASE_TYPE}")
-    logger.info(f"数据库URL: {database_url}")
+    logger.info(f"连接{'只读' if read_only else ''}数据库: {settings.DATABASE_TYPE}")
+    logger.info(f"数据库URL: {make_url(database_url).render_as_string(hide_password=True)}")
     
     if settings.DATABASE_TYPE.lower() == "postgresql":
         # PostgreSQL配置
@@ -33,18 +44,67 @@ def create_database_engine():
         # SQLite配置
         engine = create_engine(
             database_url,
+            poolclass=QueuePool,
+            pool_size=database_config["pool_size"],
+            max_overflow=database_config["max_overflow"],
+            pool_timeout=database_config["pool_timeout"],
             echo=database_config["echo"],
             connect_args=database_config["connect_args"]
         )
-        logger.info("使用SQLite数据库")
+        pragmas = database_config["pragmas"]
+        if read_only:
+            # 只读连接无法切换日志模式，沿用写连接设置的 WAL
+            pragmas = {name: value for name, value in pragmas.items() if name != "journal_mode"}
+        register_sqlite_pragmas(engine, pragmas)
+        register_search_functions(engine)
+        logger.info(f"使用SQLite数据库: pool_size={database_config['pool_size']}, max_overflow={database_config['max_overflow']}")
     
     return engine
 
-# 创建数据库引擎
+def register_sqlite_pragmas(engine, pragmas: dict):
+    """
+    注册连接事件：每个新建的SQLite连接执行 PRAGMA 配置
+    
+    首个连接建立后回读实际生效的值并记录日志（如只读文件、内存库无法切换到 WAL）。
+    """
+    state = {"logged": False}
+    
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            if not state["logged"]:
+                state["logged"] = True
+                effective = {}
+                for name in pragmas:
+                    cursor.execute(f"PRAGMA {name}")
+                    row = cursor.fetchone()
+                    effective[name] = row[0] if row else None
+                logger.info(f"SQLite PRAGMA 生效值: {effective}")
+        finally:
+            cursor.close()
+
+def create_read_engine(write_engine):
+    """创建只读引擎：未启用读写分离或没有独立只读库时复用写引擎"""
+    read_url = settings.get_read_database_url() if settings.DATABASE_READ_ROUTING else None
+    if not read_url:
+        return write_engine
+    return create_database_engine(read_url, read_only=True)
+
+# 创建数据库引擎（写）及只读引擎
 engine = create_database_engine()
+read_engine = create_read_engine(engine)
+
+# 连接池统计（读写共用引擎时只统计一份）
+pool_stats: Dict[str, PoolStats] = {"write": PoolStats("write").attach(engine)}
+if read_engine is not engine:
+    pool_stats["read"] = PoolStats("read").attach(read_engine)
 
 # 创建会话工厂
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 
 # 声明基类
 Base = declarative_base()
@@ -57,16 +117,51 @@ def get_db():
     finally:
         db.close()
 
+def get_read_db():
+    """获取只读数据库会话（查询类接口使用）"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def get_pool_stats() -> Dict[str, Dict]:
+    """各连接池的连接数与语句耗时统计"""
+    return {name: stats.snapshot() for name, stats in pool_stats.items()}
+
 def init_database():
     """初始化数据库"""
     try:
+        # 注册所有模型到 Base.metadata
+        import app.models  # noqa: F401
+        
         # 创建所有表
         Base.metadata.create_all(bind=engine)
         logger.info("数据库表创建成功")
         
+        # 已有表补建新增索引
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=engine, checkfirst=True)
+        
         # 如果是PostgreSQL，创建索引
         if settings.DATABASE_TYPE.lower() == "postgresql":
             create_postgresql_indexes()
+        
+        # 全文检索索引
+        from app.db.search import create_search_indexes
+        create_search_indexes(engine)
+        
+        # 数据迁移
+        migrate_field_roots()
+        
+        # 表版本记录（条件请求 ETag）
+        from app.db.versions import init_table_versions
+        db = SessionLocal()
+        try:
+            init_table_versions(db)
+        finally:
+            db.close()
             
     except Exception as e:
         logger.error(f"数据库初始化失败: {e}")
@@ -121,10 +216,55 @@ def create_postgresql_indexes():
     except Exception as e:
         logger.warning(f"PostgreSQL索引创建失败: {e}")
 
+def migrate_field_roots():
+    """
+    回填字段-词根关联表
+    
+    将 fields.root_list 中的JSON词根列表迁移到 field_roots，
+    仅处理尚无关联记录的字段，可重复执行。
+    """
+    from app.models import Root, Field, FieldRoot
+    
+    db = SessionLocal()
+    try:
+        root_ids = dict(db.query(Root.normalized_name, Root.id).all())
+        migrated_field_ids = select(FieldRoot.field_id).distinct()
+        pending_fields = db.query(Field.id, Field.root_list).filter(
+            ~Field.id.in_(migrated_field_ids)
+        ).all()
+        
+        rows = []
+        for field_id, root_list in pending_fields:
+            try:
+                root_names = json.loads(root_list) if root_list else []
+            except ValueError:
+                logger.warning(f"字段词根列表解析失败，跳过: field_id={field_id}")
+                continue
+            
+            for position, root_name in enumerate(root_names):
+                root_id = root_ids.get(root_name)
+                if root_id is None:
+                    logger.warning(f"词根不存在，跳过: field_id={field_id}, root={root_name}")
+                    continue
+                rows.append({"field_id": field_id, "root_id": root_id, "position": position})
+        
+        if rows:
+            db.execute(insert(FieldRoot), rows)
+        db.commit()
+        logger.info(f"字段词根关联回填完成: 字段{len(pending_fields)}个, 关联{len(rows)}条")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"字段词根关联回填失败: {e}")
+        raise
+    finally:
+        db.close()
+
 def close_database():
     """关闭数据库连接"""
     try:
         engine.dispose()
+        if read_engine is not engine:
+            read_engine.dispose()
         logger.info("数据库连接已关闭")
     except Exception as e:
         logger.error(f"关闭数据库连接失败: {e}")
@@ -0,0 +1,88 @@
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+class PoolStats:
+    """
+    连接池统计
+
+    通过连接池事件记录连接建立/借出/归还次数，通过游标执行事件记录语句耗时，
+    用于对比读写连接池的负载。
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._engine = None
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.statements = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def attach(self, engine: Engine) -> "PoolStats":
+        """注册引擎事件"""
+        self._engine = engine
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine, "after_cursor_execute", self._after_execute)
+        return self
+
+    def snapshot(self) -> Dict:
+        """当前统计快照"""
+        pool = self._engine.pool if self._engine is not None else None
+        with self._lock:
+            return {
+                "name": self.name,
+                "url": self._engine.url.render_as_string(hide_password=True) if self._engine is not None else None,
+                "pool_size": pool.size() if hasattr(pool, "size") else None,
+                "checked_out": pool.checkedout() if hasattr(pool, "checkedout") else None,
+                "overflow": pool.overflow() if hasattr(pool, "overflow") else None,
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "statements": self.statements,
+                "avg_ms": round(self.total_ms / self.statements, 3) if self.statements else 0.0,
+                "max_ms": round(self.max_ms, 3)
+            }
+
+    def reset(self):
+        with self._lock:
+            self.connects = self.checkouts = self.checkins = self.statements = 0
+            self.total_ms = self.max_ms = 0.0
+
+    # ---- 事件回调 ----
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self.checkouts += 1
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.checkins += 1
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # 开始时间记在本次执行的上下文上：语句出错时不触发 after 事件，上下文随之丢弃，不会残留
+        if context is not None:
+            context._pool_stats_start = time.perf_counter()
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_pool_stats_start", None)
+        if started is None:
+            return
+        elapsed = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self.statements += 1
+            self.total_ms += elapsed
+            if elapsed > self.max_ms:
+                self.max_ms = elapsed
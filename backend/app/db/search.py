@@ -0,0 +1,247 @@
+"""
+全文检索索引
+
+SQLite 使用 FTS5（trigram 分词，支持中文子串），通过触发器与主表保持同步。
+trigram 无法检索不足3个字符的词（中文词多为2个字），另建一张短词索引表：
+每行存检索列中所有单字与相邻双字（unicode61 分词），由触发器调用连接上注册的
+search_grams 函数维护，因此只能通过本应用的连接写入这几张表。
+
+PostgreSQL 使用 pg_trgm 的 GIN 三元组索引，随主表写入自动维护。
+已知限制：不足3个字符的词无法提取三元组，ILIKE 只能扫描整个 GIN 索引，词越短越慢。
+"""
+
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event, func, literal_column, or_, select, text
+from sqlalchemy.orm import Query
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 参与检索的表及列
+SEARCH_COLUMNS: Dict[str, List[str]] = {
+    "roots": ["name", "normalized_name", "remark"],
+    "fields": ["field_name", "normalized_name", "meaning", "remark"],
+    "models": ["model_name", "description", "remark"],
+}
+
+# trigram 分词要求每个检索词至少3个字符
+MIN_TRIGRAM_LENGTH = 3
+
+# 短词索引表使用的 SQL 函数名
+GRAMS_FUNCTION = "search_grams"
+
+# 已确认存在的检索索引表（进程内缓存）
+_available_indexes: Dict[str, bool] = {}
+
+def _is_postgresql() -> bool:
+    return settings.DATABASE_TYPE.lower() == "postgresql"
+
+def _search_expression_sql(table: str) -> str:
+    """拼接检索列（PostgreSQL 索引表达式，需与查询表达式一致）"""
+    return " || ' ' || ".join(f"coalesce({column}, '')" for column in SEARCH_COLUMNS[table])
+
+def search_grams(*values: Optional[str]) -> str:
+    """
+    提取文本中的单字与相邻双字（空格分隔、去重），写入短词索引表
+
+    只取字母、数字与中文等文字字符，标点与空白处断开："客户ID" -> "d i id 客 客户 户 户i"
+    """
+    grams = set()
+    for value in values:
+        if not value:
+            continue
+        previous = None
+        for char in str(value).lower():
+            if char.isalnum():
+                grams.add(char)
+                if previous:
+                    grams.add(previous + char)
+                previous = char
+            else:
+                previous = None
+    return " ".join(sorted(grams))
+
+def register_search_functions(engine):
+    """注册连接事件：每个新建的SQLite连接注册短词索引触发器使用的函数"""
+    @event.listens_for(engine, "connect")
+    def set_search_functions(dbapi_connection, connection_record):
+        dbapi_connection.create_function(GRAMS_FUNCTION, -1, search_grams, deterministic=True)
+
+def _table_exists(conn, name: str) -> bool:
+    return conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": name}
+    ).first() is not None
+
+def _create_short_term_index(conn, table: str, columns: List[str]):
+    """创建短词索引表（无内容表，只存单字/双字）及同步触发器"""
+    grams = f"{table}_grams"
+    exists = _table_exists(conn, grams)
+    new_grams = f"{GRAMS_FUNCTION}({', '.join(f'new.{column}' for column in columns)})"
+    old_grams = f"{GRAMS_FUNCTION}({', '.join(f'old.{column}' for column in columns)})"
+
+    conn.execute(text(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {grams} USING fts5("
+        f"grams, content='', tokenize='unicode61 remove_diacritics 0')"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER IF NOT EXISTS {grams}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {grams}(rowid, grams) VALUES (new.id, {new_grams}); END"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER IF NOT EXISTS {grams}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {grams}({grams}, rowid, grams) VALUES ('delete', old.id, {old_grams}); END"
+    ))
+    # 只在检索列变化时重建（词根使用次数等高频更新不触发）
+    conn.execute(text(
+        f"CREATE TRIGGER IF NOT EXISTS {grams}_au AFTER UPDATE OF {', '.join(columns)} ON {table} BEGIN "
+        f"INSERT INTO {grams}({grams}, rowid, grams) VALUES ('delete', old.id, {old_grams}); "
+        f"INSERT INTO {grams}(rowid, grams) VALUES (new.id, {new_grams}); END"
+    ))
+
+    # 新建索引时从主表回填
+    if not exists:
+        conn.execute(text(
+            f"INSERT INTO {grams}(rowid, grams) "
+            f"SELECT id, {GRAMS_FUNCTION}({', '.join(columns)}) FROM {table}"
+        ))
+        logger.info(f"短词检索索引已创建: {grams}")
+
+def create_search_indexes(engine):
+    """创建全文检索索引（可重复执行）"""
+    with engine.begin() as conn:
+        if _is_postgresql():
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            for table in SEARCH_COLUMNS:
+                conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS idx_{table}_search_trgm ON {table} "
+                    f"USING gin (({_search_expression_sql(table)}) gin_trgm_ops)"
+                ))
+        else:
+            for table, columns in SEARCH_COLUMNS.items():
+                fts = f"{table}_fts"
+                exists = _table_exists(conn, fts)
+
+                column_list = ", ".join(columns)
+                new_values = ", ".join(f"new.{column}" for column in columns)
+                old_values = ", ".join(f"old.{column}" for column in columns)
+
+                conn.execute(text(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+                    f"{column_list}, content='{table}', content_rowid='id', tokenize='trigram')"
+                ))
+                conn.execute(text(
+                    f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+                    f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values}); END"
+                ))
+                conn.execute(text(
+                    f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+                    f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values}); END"
+                ))
+                # 只在检索列变化时重建（词根使用次数等高频更新不触发）；
+                # 先删除旧库中不带列清单的同名触发器
+                conn.execute(text(f"DROP TRIGGER IF EXISTS {fts}_au"))
+                conn.execute(text(
+                    f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {column_list} ON {table} BEGIN "
+                    f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values}); "
+                    f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values}); END"
+                ))
+
+                # 新建索引时从主表回填
+                if not exists:
+                    conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+                    logger.info(f"全文检索索引已创建: {fts}")
+
+                _create_short_term_index(conn, table, columns)
+
+    _available_indexes.clear()
+
+def _index_available(query: Query, name: str) -> bool:
+    """检查检索索引表是否已创建（未执行初始化的旧库回退到 LIKE 查询）"""
+    if name not in _available_indexes:
+        if _is_postgresql():
+            _available_indexes[name] = True
+        else:
+            row = query.session.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": name}
+            ).first()
+            _available_indexes[name] = row is not None
+    return _available_indexes[name]
+
+def _escape_like(term: str) -> str:
+    """转义 LIKE 通配符，使 % 与 _ 按字面匹配"""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def _like_filter(model_cls, search: str):
+    """回退方案：对检索列做子串匹配"""
+    columns = [getattr(model_cls, column) for column in SEARCH_COLUMNS[model_cls.__tablename__]]
+    return or_(*[column.contains(search, autoescape=True) for column in columns])
+
+def _match_subquery(fts: str, match_query: str):
+    """FTS5 检索子查询：(rowid, rank)"""
+    return select(
+        literal_column("rowid").label("rowid"),
+        literal_column(f"bm25({fts})").label("rank")
+    ).select_from(text(fts)).where(literal_column(fts).op("MATCH")(match_query)).subquery()
+
+def _quote_terms(terms: List[str]) -> str:
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+def apply_search(query: Query, model_cls, search: str) -> Tuple[Query, Optional[object]]:
+    """
+    为查询添加全文检索条件
+
+    Args:
+        query: 基础查询
+        model_cls: 检索的模型类（Root/Field/Model）
+        search: 检索关键词，空白分隔的多个词按 AND 匹配
+
+    Returns:
+        (过滤后的查询, 相关度排序表达式；无法使用索引时为 None)
+    """
+    table = model_cls.__tablename__
+    terms = search.split()
+    if not terms:
+        return query, None
+
+    if not _index_available(query, f"{table}_fts"):
+        return query.filter(_like_filter(model_cls, search)), None
+
+    if _is_postgresql():
+        expression = literal_column(f"({_search_expression_sql(table)})")
+        for term in terms:
+            query = query.filter(expression.ilike(f"%{_escape_like(term)}%", escape="\\"))
+        return query, func.similarity(expression, search).desc()
+
+    long_terms = [term for term in terms if len(term) >= MIN_TRIGRAM_LENGTH]
+    short_terms = [term for term in terms if len(term) < MIN_TRIGRAM_LENGTH]
+    rank = None
+
+    if long_terms:
+        matches = _match_subquery(f"{table}_fts", _quote_terms(long_terms))
+        query = query.join(matches, matches.c.rowid == model_cls.id)
+        rank = matches.c.rank.asc()
+
+    if short_terms:
+        # 短词用单字/双字索引缩小范围；含标点的词索引只能粗筛，再用子串匹配精确过滤
+        grams = f"{table}_grams"
+        indexed = _index_available(query, grams)
+        gram_terms = []
+        for term in short_terms:
+            term_grams = search_grams(term).split()
+            longest = [gram for gram in term_grams if len(gram) == max(map(len, term_grams))] if term_grams else []
+            if indexed and longest:
+                gram_terms.extend(longest)
+            if not indexed or not term.isalnum():
+                query = query.filter(_like_filter(model_cls, term))
+        if gram_terms:
+            matches = _match_subquery(grams, _quote_terms(list(dict.fromkeys(gram_terms))))
+            query = query.join(matches, matches.c.rowid == model_cls.id)
+            if rank is None:
+                rank = matches.c.rank.asc()
+
+    return query, rank
@@ -0,0 +1,60 @@
+from typing import Dict, Iterable, Optional
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 参与版本计数的表
+VERSIONED_TABLES = ("roots", "fields", "models", "model_fields")
+
+def bump_table_versions(db: Session, *tables: str):
+    """
+    递增表版本号
+    
+    在写操作的同一事务中调用（提交前），版本号与数据一起提交或回滚；
+    不提交事务。递增后的版本号记录在 db.info["bumped_versions"]（{表名: (递增前, 递增后)}），
+    提交成功后由目录快照读取。
+    """
+    from app.models.table_version import TableVersion
+    
+    names = sorted(set(tables))
+    bumped = dict(db.execute(
+        update(TableVersion)
+        .where(TableVersion.name.in_(names))
+        .values(version=TableVersion.version + 1)
+        .returning(TableVersion.name, TableVersion.version)
+        .execution_options(synchronize_session=False)
+    ).all())
+    missing = [name for name in names if name not in bumped]
+    if missing:
+        db.execute(insert(TableVersion), [{"name": name, "version": 1} for name in missing])
+        bumped.update({name: 1 for name in missing})
+    
+    pending = db.info.setdefault("bumped_versions", {})
+    for name, version in bumped.items():
+        previous = pending[name][0] if name in pending else version - 1
+        pending[name] = (previous, version)
+
+def get_table_versions(db: Session, tables: Iterable[str]) -> Optional[Dict[str, int]]:
+    """读取表版本号，任一表尚无版本记录时返回 None（不可用于缓存校验）"""
+    from app.models.table_version import TableVersion
+    
+    names = sorted(set(tables))
+    versions = dict(db.execute(
+        select(TableVersion.name, TableVersion.version).where(TableVersion.name.in_(names))
+    ).all())
+    if len(versions) != len(names):
+        return None
+    return versions
+
+def init_table_versions(db: Session):
+    """补建缺失的版本记录，可重复执行"""
+    from app.models.table_version import TableVersion
+    
+    existing = set(db.execute(select(TableVersion.name)).scalars())
+    missing = [name for name in VERSIONED_TABLES if name not in existing]
+    if missing:
+        db.execute(insert(TableVersion), [{"name": name, "version": 0} for name in missing])
+    db.commit()
+    logger.info(f"表版本记录初始化完成: 新增{len(missing)}个")
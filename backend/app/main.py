@@ -1,5 +1,8 @@
 from fastapi import FastAPI
 from app.v1.router import api_v1_router
+from app.db.database import SessionLocal, get_pool_stats
+from app.core.config import settings
+from app.core.catalog import catalog
 from app.core.exceptions import (
     DataDictException,
     data_dict_exception_handler,
@@ -9,6 +12,9 @@ from app.core.exceptions import (
 )
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
+import logging
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="Data Dict Tool API", 
@@ -22,11 +28,28 @@ app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(StarletteHTTPException, http_exception_handler)
 app.add_exception_handler(Exception, general_exception_handler)
 
+@app.on_event("startup")
+def load_catalog():
+    """启动时加载目录快照（名称注册表与模型名称）"""
+    db = SessionLocal()
+    try:
+        catalog.sync(db, force=True)
+    except Exception as e:
+        # 数据库尚未初始化时延迟到首次写入再加载
+        logger.warning(f"目录快照加载失败: {e}")
+    finally:
+        db.close()
+
 @app.get("/health", tags=["system"]) 
 def health_check():
     """健康检查接口"""
     return {"status": "ok", "message": "Data Dict Tool API is running"}
 
+@app.get("/health/pools", tags=["system"])
+def pool_stats():
+    """读写连接池统计（连接数、借出次数、语句耗时）"""
+    return get_pool_stats()
+
 @app.get("/", tags=["system"])
 def root():
     """根路径"""
@@ -38,4 +61,12 @@ def root():
     }
 
 # 注册API路由
-app.include_router(api_v1_router, prefix="/api/v1") 
\ No newline at end of file
+app.include_router(api_v1_router, prefix="/api/v1")
+
+# 异步模式（可选）：异步引擎及 /api/v1/async 路由
+if settings.DATABASE_ASYNC_ENABLED:
+    from app.v1.async_router import async_api_v1_router
+    from app.db.async_database import close_async_database
+    
+    app.include_router(async_api_v1_router, prefix="/api/v1/async")
+    app.router.on_event("shutdown")(close_async_database) 
\ No newline at end of file
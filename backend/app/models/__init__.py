@@ -4,6 +4,8 @@ from app.models.field import Field
 from app.models.model import Model
 from app.models.model_field import ModelField
 from app.models.lineage import Lineage
+from app.models.field_root import FieldRoot
+from app.models.table_version import TableVersion
 
 # 导出所有模型，用于数据库迁移
-__all__ = ["Base", "Root", "Field", "Model", "ModelField", "Lineage"] 
\ No newline at end of file
+__all__ = ["Base", "Root", "Field", "Model", "ModelField", "Lineage", "FieldRoot", "TableVersion"] 
\ No newline at end of file
@@ -1,9 +1,12 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Index
 from sqlalchemy.sql import func
 from app.db.database import Base
 
 class Field(Base):
     __tablename__ = "fields"
+    __table_args__ = (
+        Index("ix_fields_created_at_id", "created_at", "id"),  # 列表按创建时间排序/游标分页
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     field_name = Column(String(128), unique=True, nullable=False, index=True)  # 字段名
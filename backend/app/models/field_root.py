@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, ForeignKey, Index, UniqueConstraint
+from app.db.database import Base
+
+class FieldRoot(Base):
+    __tablename__ = "field_roots"
+    __table_args__ = (
+        UniqueConstraint("field_id", "position", name="uq_field_roots_field_position"),
+        Index("ix_field_roots_root_field", "root_id", "field_id"),  # 按词根查字段（过滤、影响面、组合交集）
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    field_id = Column(Integer, ForeignKey("fields.id"), nullable=False, index=True)  # 字段ID
+    root_id = Column(Integer, ForeignKey("roots.id"), nullable=False)  # 词根ID
+    position = Column(Integer, nullable=False, default=0)  # 词根在字段名中的位置
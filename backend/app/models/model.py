@@ -1,9 +1,12 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
 from sqlalchemy.sql import func
 from app.db.database import Base
 
 class Model(Base):
     __tablename__ = "models"
+    __table_args__ = (
+        Index("ix_models_created_at_id", "created_at", "id"),  # 列表按创建时间排序/游标分页
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     model_name = Column(String(128), unique=True, nullable=False, index=True)  # 模型名
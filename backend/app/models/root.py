@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Index
 from sqlalchemy.sql import func
 from app.db.database import Base
 
 class Root(Base):
     __tablename__ = "roots"
+    __table_args__ = (
+        Index("ix_roots_usage_count_id", "usage_count", "id"),  # 列表按使用次数排序/游标分页
+        Index("ix_roots_created_at_id", "created_at", "id"),    # 列表按创建时间排序/游标分页
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(64), unique=True, nullable=False, index=True)  # 词根名
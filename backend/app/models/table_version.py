@@ -0,0 +1,10 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from app.db.database import Base
+
+class TableVersion(Base):
+    __tablename__ = "table_versions"
+    
+    name = Column(String(64), primary_key=True)  # 表名
+    version = Column(Integer, nullable=False, default=0)  # 版本号，表数据每次提交变更时递增
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,26 +1,46 @@
 from app.schemas.root import (
     RootBase, RootCreate, RootUpdate, RootResponse, 
-    RootListResponse, AliasCreate, AliasResponse, RootImpactResponse
+    RootListResponse, AliasCreate, AliasResponse, RootImpactResponse,
+    RootImpactBatchRequest, RootImpactItem, RootImpactBatchResponse,
+    RootSuggestion, RootSuggestResponse, RootImportRowError, RootImportResponse,
+    RootCompletion, RootAutocompleteResponse,
+    RootSegmentRequest, RootSegment, RootSegmentation, RootSegmentItem, RootSegmentResponse,
+    RootMatchRequest, RootMatchBatchRequest, RootMatch, RootMatchSummary, RootMatchResponse,
+    RootMatchBatchResponse
 )
 from app.schemas.field import (
     FieldBase, FieldCreate, FieldUpdate, FieldResponse,
-    FieldListResponse, FieldStatusUpdate, FieldUniqueCheck, FieldUniqueResponse
+    FieldListResponse, FieldStatusUpdate, FieldUniqueCheck, FieldUniqueResponse,
+    FieldBatchCreate, FieldBatchItem, FieldBatchCreateResponse,
+    FieldCompletion, FieldAutocompleteResponse
 )
 from app.schemas.model import (
     ModelBase, ModelCreate, ModelUpdate, ModelResponse,
     ModelListResponse, ModelDetailResponse, ModelFieldBinding,
-    ModelFieldUnbinding, ModelFieldResponse, ExportFormat, ExportResponse
+    ModelFieldUnbinding, ModelFieldResponse, ModelFieldListResponse,
+    ModelFieldBatchBinding, ModelFieldBatchResponse,
+    ExportFormat, ExportResponse, ModelExportRequest
 )
 
 __all__ = [
     # Root schemas
     "RootBase", "RootCreate", "RootUpdate", "RootResponse", 
     "RootListResponse", "AliasCreate", "AliasResponse", "RootImpactResponse",
+    "RootImpactBatchRequest", "RootImpactItem", "RootImpactBatchResponse",
+    "RootSuggestion", "RootSuggestResponse", "RootImportRowError", "RootImportResponse",
+    "RootCompletion", "RootAutocompleteResponse",
+    "RootSegmentRequest", "RootSegment", "RootSegmentation", "RootSegmentItem", "RootSegmentResponse",
+    "RootMatchRequest", "RootMatchBatchRequest", "RootMatch", "RootMatchSummary", "RootMatchResponse",
+    "RootMatchBatchResponse",
     # Field schemas
     "FieldBase", "FieldCreate", "FieldUpdate", "FieldResponse",
     "FieldListResponse", "FieldStatusUpdate", "FieldUniqueCheck", "FieldUniqueResponse",
+    "FieldBatchCreate", "FieldBatchItem", "FieldBatchCreateResponse",
+    "FieldCompletion", "FieldAutocompleteResponse",
     # Model schemas
     "ModelBase", "ModelCreate", "ModelUpdate", "ModelResponse",
     "ModelListResponse", "ModelDetailResponse", "ModelFieldBinding",
-    "ModelFieldUnbinding", "ModelFieldResponse", "ExportFormat", "ExportResponse"
+    "ModelFieldUnbinding", "ModelFieldResponse", "ModelFieldListResponse",
+    "ModelFieldBatchBinding", "ModelFieldBatchResponse",
+    "ExportFormat", "ExportResponse", "ModelExportRequest"
 ] 
\ No newline at end of file
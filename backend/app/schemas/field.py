@@ -36,9 +36,10 @@ class FieldResponse(FieldBase):
 class FieldListResponse(BaseModel):
     """字段列表响应模型"""
     list: List[FieldResponse]
-    total: int
+    total: Optional[int] = None
     page: int
     pageSize: int
+    next_cursor: Optional[str] = Field(None, description="下一页游标，为空表示没有更多数据")
 
 class FieldStatusUpdate(BaseModel):
     """字段状态更新请求模型"""
@@ -52,4 +53,44 @@ class FieldUniqueResponse(BaseModel):
     """字段唯一性检查响应模型"""
     unique: bool
     message: Optional[str] = None
-    alternatives: Optional[List[str]] = None 
\ No newline at end of file
+    alternatives: Optional[List[str]] = None
+
+class FieldBatchCreate(BaseModel):
+    """文本批量创建字段请求模型"""
+    text: str = Field(..., description="批量文本，每行一个字段：词根1 词根2 | 业务含义 | 数据类型 | 备注", min_length=1)
+    data_type: str = Field("VARCHAR", description="行内未指定时的默认数据类型", max_length=20)
+    dry_run: bool = Field(False, description="仅预览，不写入")
+    atomic: bool = Field(False, description="任一行有误时整批不创建")
+
+class FieldBatchItem(BaseModel):
+    """批量创建的单行结果"""
+    line: int = Field(..., description="行号")
+    source: str = Field(..., description="原始文本")
+    field_name: str
+    normalized_name: str
+    root_list: List[str]
+    meaning: str
+    data_type: str
+    remark: Optional[str] = None
+    id: Optional[int] = Field(None, description="创建后的字段ID")
+    errors: List[str]
+
+class FieldBatchCreateResponse(BaseModel):
+    """文本批量创建字段响应模型"""
+    total: int
+    created: int
+    failed: int
+    dry_run: bool
+    items: List[FieldBatchItem]
+
+class FieldCompletion(BaseModel):
+    """字段补全项"""
+    field_id: int
+    field_name: str
+    normalized_name: str
+    usage_count: int = Field(..., description="被模型引用次数")
+
+class FieldAutocompleteResponse(BaseModel):
+    """字段补全响应模型"""
+    query: str = Field(..., description="规范化后的前缀")
+    items: List[FieldCompletion]
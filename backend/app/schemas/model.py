@@ -31,9 +31,10 @@ class ModelResponse(ModelBase):
 class ModelListResponse(BaseModel):
     """模型列表响应模型"""
     list: List[ModelResponse]
-    total: int
+    total: Optional[int] = None
     page: int
     pageSize: int
+    next_cursor: Optional[str] = Field(None, description="下一页游标，为空表示没有更多数据")
 
 class ModelFieldBinding(BaseModel):
     """模型字段绑定请求模型"""
@@ -61,6 +62,13 @@ class ModelFieldResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class ModelFieldListResponse(BaseModel):
+    """模型字段分页响应模型"""
+    list: List[ModelFieldResponse]
+    total: int
+    page: int
+    pageSize: int
+
 class ModelDetailResponse(ModelResponse):
     """模型详情响应模型（包含字段信息）"""
     fields: List[ModelFieldResponse] = []
@@ -68,6 +76,7 @@ class ModelDetailResponse(ModelResponse):
 class ExportFormat(BaseModel):
     """导出格式请求模型"""
     format: str = Field(..., description="导出格式", pattern="^(sql|excel)$")
+    dialect: str = Field("mysql", description="SQL方言", pattern="^(mysql|oracle|postgresql)$")
     include_ddl: bool = Field(True, description="是否包含DDL语句")
     include_data: bool = Field(False, description="是否包含示例数据")
 
@@ -75,4 +84,23 @@ class ExportResponse(BaseModel):
     """导出响应模型"""
     content: str
     filename: str
-    format: str 
\ No newline at end of file
+    format: str
+
+class ModelFieldBatchBinding(BaseModel):
+    """模型字段批量绑定请求模型"""
+    bindings: List[ModelFieldBinding] = Field(..., description="字段绑定列表", min_length=1, max_length=2000)
+    skip_bound: bool = Field(False, description="跳过已绑定的字段（否则整批失败）")
+
+class ModelFieldBatchResponse(BaseModel):
+    """模型字段批量绑定响应模型"""
+    bound: List[int] = Field(..., description="本次绑定的字段ID")
+    skipped: List[int] = Field(..., description="已绑定而跳过的字段ID")
+
+class ModelExportRequest(BaseModel):
+    """模型流式导出请求模型"""
+    model_ids: Optional[List[int]] = Field(None, description="模型ID列表，为空时导出全部模型", max_length=1000)
+    format: str = Field("csv", description="导出格式", pattern="^(sql|csv|xlsx)$")
+    dialect: str = Field("mysql", description="SQL方言（仅sql）", pattern="^(mysql|oracle|postgresql)$")
+    include_ddl: bool = Field(True, description="是否包含DDL语句（仅sql）")
+    include_data: bool = Field(False, description="是否包含示例数据（仅sql）")
+    sheet_layout: str = Field("per_model", description="xlsx工作表布局：每个模型一个工作表或合并为一个", pattern="^(per_model|combined)$")
@@ -34,9 +34,10 @@ class RootResponse(RootBase):
 class RootListResponse(BaseModel):
     """词根列表响应模型"""
     list: List[RootResponse]
-    total: int
+    total: Optional[int] = None
     page: int
     pageSize: int
+    next_cursor: Optional[str] = Field(None, description="下一页游标，为空表示没有更多数据")
 
 class AliasCreate(BaseModel):
     """创建别名请求模型"""
@@ -53,4 +54,130 @@ class AliasResponse(BaseModel):
 class RootImpactResponse(BaseModel):
     """词根影响面响应模型"""
     fields: List[dict] = Field(..., description="受影响的字段列表")
-    models: List[dict] = Field(..., description="受影响的模型列表") 
\ No newline at end of file
+    models: List[dict] = Field(..., description="受影响的模型列表")
+    field_total: int = Field(0, description="受影响的字段总数")
+    model_total: int = Field(0, description="受影响的模型总数")
+
+class RootImpactBatchRequest(BaseModel):
+    """批量词根影响面请求模型"""
+    root_ids: List[int] = Field(..., description="词根ID列表", min_length=1, max_length=1000)
+    include_details: bool = Field(False, description="是否返回受影响的字段与模型明细")
+
+class RootImpactItem(BaseModel):
+    """单个词根的影响面"""
+    root_id: int
+    normalized_name: str
+    field_total: int
+    model_total: int
+    fields: Optional[List[dict]] = None
+    models: Optional[List[dict]] = None
+
+class RootImpactBatchResponse(BaseModel):
+    """批量词根影响面响应模型"""
+    items: List[RootImpactItem]
+    missing: List[int] = Field(..., description="不存在的词根ID")
+
+class RootSuggestion(BaseModel):
+    """相似词根推荐项"""
+    root_id: int
+    name: str
+    matched: str = Field(..., description="命中的规范化名或别名")
+    is_alias: bool = Field(..., description="是否通过别名命中")
+    distance: int = Field(..., description="编辑距离")
+
+class RootSuggestResponse(BaseModel):
+    """相似词根推荐响应模型"""
+    query: str = Field(..., description="规范化后的查询词")
+    suggestions: List[RootSuggestion]
+
+class RootCompletion(BaseModel):
+    """词根补全项"""
+    root_id: int
+    name: str
+    matched: str = Field(..., description="命中的规范化名或别名")
+    is_alias: bool = Field(..., description="是否通过别名命中")
+    usage_count: int = Field(..., description="使用次数")
+
+class RootAutocompleteResponse(BaseModel):
+    """词根补全响应模型"""
+    query: str = Field(..., description="规范化后的前缀")
+    items: List[RootCompletion]
+
+class RootSegmentRequest(BaseModel):
+    """词根切分请求模型"""
+    names: List[str] = Field(..., description="待切分的标识符（如历史字段名）", min_length=1, max_length=5000)
+    top_k: int = Field(1, description="每个标识符返回的候选切分数", ge=1, le=5)
+
+class RootSegment(BaseModel):
+    """切分片段"""
+    text: str = Field(..., description="片段文本（小写）")
+    start: int
+    end: int
+    root_id: Optional[int] = Field(None, description="匹配的词根ID，未匹配时为空")
+    root_name: Optional[str] = None
+    usage_count: int = 0
+
+class RootSegmentation(BaseModel):
+    """一种切分方案"""
+    segments: List[RootSegment]
+    coverage: float = Field(..., description="词根覆盖的字符比例")
+    usage_count: int = Field(..., description="所用词根的使用次数之和")
+    field_name: str = Field(..., description="按切分结果拼接的字段名")
+
+class RootSegmentItem(BaseModel):
+    """单个标识符的切分结果"""
+    input: str
+    candidates: List[RootSegmentation]
+
+class RootSegmentResponse(BaseModel):
+    """词根切分响应模型"""
+    items: List[RootSegmentItem]
+
+class RootMatchRequest(BaseModel):
+    """词根匹配请求模型"""
+    text: str = Field(..., description="业务描述等待分析文本", min_length=1, max_length=100000)
+    whole_word: bool = Field(True, description="只匹配完整单词")
+    longest_only: bool = Field(True, description="去掉被更长命中包含的命中")
+
+class RootMatchBatchRequest(BaseModel):
+    """批量词根匹配请求模型"""
+    texts: List[str] = Field(..., description="待分析文本列表", min_length=1, max_length=1000)
+    whole_word: bool = Field(True, description="只匹配完整单词")
+    longest_only: bool = Field(True, description="去掉被更长命中包含的命中")
+
+class RootMatch(BaseModel):
+    """单次命中"""
+    root_id: int
+    name: str
+    matched: str = Field(..., description="命中的规范化名或别名")
+    is_alias: bool = Field(..., description="是否通过别名命中")
+    start: int = Field(..., description="在原文中的起始位置")
+    end: int = Field(..., description="在原文中的结束位置（不含）")
+
+class RootMatchSummary(BaseModel):
+    """命中词根汇总"""
+    root_id: int
+    name: str
+    count: int = Field(..., description="命中次数")
+
+class RootMatchResponse(BaseModel):
+    """词根匹配响应模型"""
+    matches: List[RootMatch]
+    roots: List[RootMatchSummary]
+
+class RootMatchBatchResponse(BaseModel):
+    """批量词根匹配响应模型"""
+    items: List[RootMatchResponse]
+
+class RootImportRowError(BaseModel):
+    """导入失败的行"""
+    row: int = Field(..., description="CSV行号")
+    name: str
+    errors: List[str]
+
+class RootImportResponse(BaseModel):
+    """词根导入报告"""
+    total: int = Field(..., description="数据行数")
+    created: int = Field(..., description="成功导入数")
+    failed: int = Field(..., description="失败行数")
+    errors: List[RootImportRowError]
@@ -1,9 +1,19 @@
 from app.services.root_service import RootService
 from app.services.field_service import FieldService
 from app.services.model_service import ModelService
+from app.services.ddl_generator import DDLDialect, DDLGenerator, DDL_DIALECTS, get_ddl_generator
+from app.services.xlsx_writer import XlsxStreamWriter
+from app.services.export_cache import ExportCache, export_cache
 
 __all__ = [
     "RootService",
     "FieldService",
-    "ModelService"
+    "ModelService",
+    "DDLDialect",
+    "DDLGenerator",
+    "DDL_DIALECTS",
+    "get_ddl_generator",
+    "XlsxStreamWriter",
+    "ExportCache",
+    "export_cache"
 ] 
\ No newline at end of file
@@ -0,0 +1,98 @@
+# 依赖 sqlalchemy[asyncio]（greenlet），仅在启用异步模式时导入，不从 app.services 包导出
+from functools import partial
+from typing import Any, Dict
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import ReadSessionLocal, SessionLocal
+from app.services.root_service import RootService
+from app.services.field_service import FieldService
+from app.services.model_service import ModelService
+
+class AsyncService:
+    """
+    异步服务基类
+
+    业务规则只在同步服务中维护一份，调用签名与同步服务相同（第一个参数换成 AsyncSession）。
+    只做简短 ORM 操作的方法通过 AsyncSession.run_sync 执行，数据库IO不占用线程池；
+    threaded_methods 中的方法 CPU 密集，或要获取进程内索引、目录快照、导出缓存的锁
+    （锁内可能有数据库或文件IO），放在事件循环线程上会阻塞所有请求，同一线程上的
+    可重入锁也挡不住交错执行的协程，因此改用同步会话在线程池中执行。
+    返回生成器的方法（如流式导出）不适用，仍走同步路径。
+    """
+
+    service_class = None
+
+    # 在线程池中执行的方法 -> 是否只读（只读方法使用只读连接池）
+    threaded_methods: Dict[str, bool] = {}
+
+    def __init__(self):
+        self.service = self.service_class()
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self.service, name)
+        if not callable(method):
+            return method
+
+        if name in self.threaded_methods:
+            factory = ReadSessionLocal if self.threaded_methods[name] else SessionLocal
+
+            async def call(db: AsyncSession, *args, **kwargs):
+                return await run_in_threadpool(_call_in_thread, factory, method, args, kwargs)
+        else:
+            async def call(db: AsyncSession, *args, **kwargs):
+                return await db.run_sync(partial(_call_with_session, method, args, kwargs))
+
+        call.__name__ = name
+        call.__doc__ = method.__doc__
+        return call
+
+def _call_with_session(method, args, kwargs, session):
+    return method(session, *args, **kwargs)
+
+def _call_in_thread(factory, method, args, kwargs):
+    """使用独立的同步会话执行，提交后不过期对象，会话关闭后路由仍可序列化返回的对象"""
+    db = factory(expire_on_commit=False)
+    try:
+        return method(db, *args, **kwargs)
+    finally:
+        db.close()
+
+class AsyncRootService(AsyncService):
+    """词根异步服务"""
+    service_class = RootService
+    threaded_methods = {
+        "create_root": False,
+        "update_root": False,
+        "delete_root": False,
+        "add_alias": False,
+        "get_roots_impact": True,
+        "suggest_roots": True,
+        "autocomplete_roots": True,
+        "segment_names": True,
+        "match_roots": True,
+    }
+
+class AsyncFieldService(AsyncService):
+    """字段异步服务"""
+    service_class = FieldService
+    threaded_methods = {
+        "create_field": False,
+        "update_field": False,
+        "delete_field": False,
+        "batch_create_fields": False,
+        "check_field_unique": True,
+        "autocomplete_fields": True,
+    }
+
+class AsyncModelService(AsyncService):
+    """模型异步服务"""
+    service_class = ModelService
+    threaded_methods = {
+        "update_model": False,
+        "delete_model": False,
+        "bind_field": False,
+        "bind_fields": False,
+        "unbind_field": False,
+    }
@@ -0,0 +1,329 @@
+import re
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+# 解析数据类型，如 VARCHAR(64)、DECIMAL(18, 2)
+_TYPE_PATTERN = re.compile(r"^\s*([A-Za-z][A-Za-z0-9_ ]*?)\s*(?:\(\s*([0-9 ,]+)\s*\))?\s*$")
+_NUMERIC_LITERAL = re.compile(r"^-?\d+(\.\d+)?$")
+
+# 按字段类型族生成示例值/默认值
+_INTEGER_TYPES = frozenset({"INT", "INTEGER", "BIGINT", "SMALLINT", "TINYINT"})
+_DECIMAL_TYPES = frozenset({"DECIMAL", "NUMERIC", "FLOAT", "DOUBLE", "REAL"})
+_STRING_TYPES = frozenset({"VARCHAR", "CHAR", "TEXT", "STRING"})
+_TIME_TYPES = frozenset({"DATETIME", "TIMESTAMP"})
+_BOOLEAN_TYPES = frozenset({"BOOLEAN", "BOOL"})
+
+class DDLDialect:
+    """
+    DDL方言
+
+    子类只需声明类型映射、标识符长度上限、保留字与注释方式，
+    生成逻辑由 DDLGenerator 统一处理。类型映射值中的 {args} 为原类型参数，
+    未给出参数时使用 default_args 中的默认值。
+    """
+
+    name = ""
+    max_identifier_length = 64
+    inline_comment = False
+    current_timestamp = "CURRENT_TIMESTAMP"
+    boolean_literals = ("1", "0")
+    type_map: Dict[str, str] = {}
+    default_args: Dict[str, str] = {}
+    reserved_words: FrozenSet[str] = frozenset()
+
+    def quote(self, identifier: str) -> str:
+        return f'"{identifier}"'
+
+    def escape_literal(self, value: str) -> str:
+        """转义为SQL字符串字面量"""
+        return "'" + value.replace("'", "''") + "'"
+
+class MySQLDialect(DDLDialect):
+    name = "mysql"
+    max_identifier_length = 64
+    inline_comment = True
+    type_map = {
+        "VARCHAR": "VARCHAR({args})",
+        "CHAR": "CHAR({args})",
+        "TEXT": "TEXT",
+        "STRING": "VARCHAR({args})",
+        "INT": "INT",
+        "INTEGER": "INT",
+        "BIGINT": "BIGINT",
+        "SMALLINT": "SMALLINT",
+        "TINYINT": "TINYINT",
+        "DECIMAL": "DECIMAL({args})",
+        "NUMERIC": "DECIMAL({args})",
+        "FLOAT": "FLOAT",
+        "DOUBLE": "DOUBLE",
+        "REAL": "DOUBLE",
+        "DATE": "DATE",
+        "DATETIME": "DATETIME",
+        "TIMESTAMP": "TIMESTAMP",
+        "BOOLEAN": "TINYINT(1)",
+        "BOOL": "TINYINT(1)",
+    }
+    default_args = {"VARCHAR": "255", "CHAR": "1", "STRING": "255", "DECIMAL": "18,2", "NUMERIC": "18,2"}
+    reserved_words = frozenset({
+        "add", "all", "alter", "and", "as", "asc", "between", "by", "case", "check", "column",
+        "condition", "create", "cross", "database", "default", "delete", "desc", "distinct",
+        "drop", "else", "exists", "from", "group", "having", "in", "index", "insert", "interval",
+        "into", "is", "join", "key", "keys", "left", "like", "limit", "match", "not", "null",
+        "on", "or", "order", "primary", "range", "rank", "references", "right", "rows", "select",
+        "set", "show", "table", "then", "to", "union", "unique", "update", "usage", "use",
+        "using", "values", "when", "where", "with",
+    })
+
+    def quote(self, identifier: str) -> str:
+        return f"`{identifier}`"
+
+    def escape_literal(self, value: str) -> str:
+        # MySQL 默认把反斜杠视为转义符
+        return "'" + value.replace("\\", "\\\\").replace("'", "''") + "'"
+
+class OracleDialect(DDLDialect):
+    name = "oracle"
+    max_identifier_length = 30
+    current_timestamp = "SYSTIMESTAMP"
+    type_map = {
+        "VARCHAR": "VARCHAR2({args})",
+        "CHAR": "CHAR({args})",
+        "TEXT": "CLOB",
+        "STRING": "VARCHAR2({args})",
+        "INT": "NUMBER(10)",
+        "INTEGER": "NUMBER(10)",
+        "BIGINT": "NUMBER(19)",
+        "SMALLINT": "NUMBER(5)",
+        "TINYINT": "NUMBER(3)",
+        "DECIMAL": "NUMBER({args})",
+        "NUMERIC": "NUMBER({args})",
+        "FLOAT": "BINARY_FLOAT",
+        "DOUBLE": "BINARY_DOUBLE",
+        "REAL": "BINARY_DOUBLE",
+        "DATE": "DATE",
+        "DATETIME": "TIMESTAMP",
+        "TIMESTAMP": "TIMESTAMP",
+        "BOOLEAN": "NUMBER(1)",
+        "BOOL": "NUMBER(1)",
+    }
+    default_args = {"VARCHAR": "255", "CHAR": "1", "STRING": "255", "DECIMAL": "18,2", "NUMERIC": "18,2"}
+    reserved_words = frozenset({
+        "access", "add", "all", "alter", "and", "any", "as", "asc", "audit", "between", "by",
+        "char", "check", "cluster", "column", "comment", "compress", "connect", "create",
+        "current", "date", "decimal", "default", "delete", "desc", "distinct", "drop", "else",
+        "exclusive", "exists", "file", "float", "for", "from", "grant", "group", "having",
+        "identified", "immediate", "in", "increment", "index", "initial", "insert", "integer",
+        "intersect", "into", "is", "level", "like", "lock", "long", "maxextents", "minus",
+        "mode", "modify", "nocompress", "not", "nowait", "null", "number", "of", "offline",
+        "on", "online", "option", "or", "order", "pctfree", "prior", "public", "raw", "rename",
+        "resource", "revoke", "row", "rowid", "rownum", "rows", "select", "session", "set",
+        "share", "size", "smallint", "start", "successful", "synonym", "sysdate", "table",
+        "then", "to", "trigger", "uid", "union", "unique", "update", "user", "validate",
+        "values", "varchar", "varchar2", "view", "whenever", "where", "with",
+    })
+
+    def quote(self, identifier: str) -> str:
+        # Oracle 未加引号的标识符按大写存储，加引号时保持同样的大写形式
+        return f'"{identifier.upper()}"'
+
+class PostgreSQLDialect(DDLDialect):
+    name = "postgresql"
+    max_identifier_length = 63
+    boolean_literals = ("TRUE", "FALSE")
+    type_map = {
+        "VARCHAR": "VARCHAR({args})",
+        "CHAR": "CHAR({args})",
+        "TEXT": "TEXT",
+        "STRING": "VARCHAR({args})",
+        "INT": "INTEGER",
+        "INTEGER": "INTEGER",
+        "BIGINT": "BIGINT",
+        "SMALLINT": "SMALLINT",
+        "TINYINT": "SMALLINT",
+        "DECIMAL": "NUMERIC({args})",
+        "NUMERIC": "NUMERIC({args})",
+        "FLOAT": "REAL",
+        "DOUBLE": "DOUBLE PRECISION",
+        "REAL": "REAL",
+        "DATE": "DATE",
+        "DATETIME": "TIMESTAMP",
+        "TIMESTAMP": "TIMESTAMP",
+        "BOOLEAN": "BOOLEAN",
+        "BOOL": "BOOLEAN",
+    }
+    default_args = {"VARCHAR": "255", "CHAR": "1", "STRING": "255", "DECIMAL": "18,2", "NUMERIC": "18,2"}
+    reserved_words = frozenset({
+        "all", "analyse", "analyze", "and", "any", "array", "as", "asc", "both", "case", "cast",
+        "check", "collate", "column", "constraint", "create", "current_date", "current_time",
+        "current_timestamp", "current_user", "default", "deferrable", "desc", "distinct", "do",
+        "else", "end", "except", "false", "fetch", "for", "foreign", "from", "grant", "group",
+        "having", "in", "initially", "intersect", "into", "lateral", "leading", "limit",
+        "localtime", "localtimestamp", "not", "null", "offset", "on", "only", "or", "order",
+        "placing", "primary", "references", "returning", "select", "session_user", "some",
+        "symmetric", "table", "then", "to", "trailing", "true", "union", "unique", "user",
+        "using", "variadic", "when", "where", "window", "with",
+    })
+
+class DDLGenerator:
+    """
+    DDL生成器
+
+    每种方言一个实例（见 get_ddl_generator），类型解析结果按原始类型字符串缓存，
+    批量导出时同一类型只解析一次。
+    """
+
+    def __init__(self, dialect: DDLDialect):
+        self.dialect = dialect
+        self._type_cache: Dict[str, Tuple[str, str]] = {}
+
+    def check_identifiers(self, model_detail: Dict) -> List[str]:
+        """检查表名与列名长度是否超出方言限制"""
+        limit = self.dialect.max_identifier_length
+        names = [model_detail["model_name"]] + [field["field_name"] for field in model_detail["fields"]]
+        return [
+            f"标识符超过{self.dialect.name}的{limit}字符限制: {name} ({len(name)})"
+            for name in names if len(name) > limit
+        ]
+
+    def generate(self, model_detail: Dict, include_ddl: bool = True, include_data: bool = False) -> str:
+        """生成单个模型的DDL"""
+        return "\n".join(self.iter_lines(model_detail, include_ddl, include_data))
+
+    def iter_ddl(
+        self,
+        models: Iterable[Dict],
+        include_ddl: bool = True,
+        include_data: bool = False
+    ) -> Iterator[str]:
+        """逐个模型生成DDL，模型之间以空行分隔"""
+        for index, model_detail in enumerate(models):
+            if index:
+                yield "\n"
+            yield self.generate(model_detail, include_ddl, include_data) + "\n"
+
+    def iter_lines(self, model_detail: Dict, include_ddl: bool, include_data: bool) -> Iterator[str]:
+        dialect = self.dialect
+        table_name = model_detail["model_name"]
+        table = self.identifier(table_name)
+        fields = model_detail["fields"]
+        description = model_detail.get("description")
+
+        for warning in self.check_identifiers(model_detail):
+            yield f"-- 警告: {warning}"
+
+        if include_ddl:
+            yield f"-- 创建表: {table_name}"
+            yield f"-- 描述: {self._comment_line(description) or '无描述'}"
+            yield f"CREATE TABLE {table} ("
+            yield ",\n".join(self._column_definition(field) for field in fields)
+            if dialect.inline_comment and description:
+                yield f") COMMENT={dialect.escape_literal(description)};"
+            else:
+                yield ");"
+
+            if not dialect.inline_comment:
+                if description:
+                    yield f"COMMENT ON TABLE {table} IS {dialect.escape_literal(description)};"
+                for field in fields:
+                    if field["meaning"]:
+                        yield (
+                            f"COMMENT ON COLUMN {table}.{self.identifier(field['field_name'])} "
+                            f"IS {dialect.escape_literal(field['meaning'])};"
+                        )
+            yield ""
+
+        if include_data and fields:
+            yield "-- 示例数据"
+            yield f"INSERT INTO {table} ("
+            yield "    " + ", ".join(self.identifier(field["field_name"]) for field in fields)
+            yield ") VALUES ("
+            yield "    " + ", ".join(self._sample_value(field) for field in fields)
+            yield ");"
+
+    def identifier(self, name: str) -> str:
+        """标识符，遇到保留字时按方言加引号"""
+        return self.dialect.quote(name) if name.lower() in self.dialect.reserved_words else name
+
+    def column_type(self, data_type: str) -> str:
+        return self._resolve_type(data_type)[0]
+
+    # ---- 内部方法 ----
+
+    def _resolve_type(self, data_type: str) -> Tuple[str, str]:
+        """解析为 (方言类型, 基础类型名)，未知类型原样输出"""
+        cached = self._type_cache.get(data_type)
+        if cached is not None:
+            return cached
+
+        match = _TYPE_PATTERN.match(data_type or "")
+        if not match:
+            resolved = ((data_type or "").upper(), "")
+        else:
+            base = " ".join(match.group(1).upper().split())
+            args = (match.group(2) or "").replace(" ", "")
+            template = self.dialect.type_map.get(base)
+            if template is None:
+                resolved = (f"{base}({args})" if args else base, base)
+            elif "{args}" in template:
+                resolved = (template.format(args=args or self.dialect.default_args.get(base, "")), base)
+            else:
+                resolved = (template, base)
+
+        self._type_cache[data_type] = resolved
+        return resolved
+
+    def _column_definition(self, field: Dict) -> str:
+        column_type, base = self._resolve_type(field["data_type"])
+        parts = [f"    {self.identifier(field['field_name'])} {column_type}"]
+        if field["default_value"]:
+            parts.append(f"DEFAULT {self._literal(field['default_value'], base)}")
+        if field["required"] == "true":
+            parts.append("NOT NULL")
+        if self.dialect.inline_comment and field["meaning"]:
+            parts.append(f"COMMENT {self.dialect.escape_literal(field['meaning'])}")
+        return " ".join(parts)
+
+    def _literal(self, value: str, base: str) -> str:
+        """默认值字面量：数值与关键字原样输出，布尔值按方言转换，其余转义为字符串"""
+        upper = value.strip().upper()
+        if upper in ("NULL", "CURRENT_TIMESTAMP", "SYSTIMESTAMP", "SYSDATE", "NOW()"):
+            return self.dialect.current_timestamp if upper != "NULL" else "NULL"
+        if base in _BOOLEAN_TYPES and upper in ("TRUE", "FALSE", "1", "0"):
+            return self.dialect.boolean_literals[0 if upper in ("TRUE", "1") else 1]
+        if (base in _INTEGER_TYPES or base in _DECIMAL_TYPES) and _NUMERIC_LITERAL.match(value.strip()):
+            return value.strip()
+        return self.dialect.escape_literal(value)
+
+    def _sample_value(self, field: Dict) -> str:
+        _, base = self._resolve_type(field["data_type"])
+        if base in _INTEGER_TYPES or base in _DECIMAL_TYPES:
+            return "1"
+        if base in _STRING_TYPES:
+            return self.dialect.escape_literal(field["meaning"] or "")
+        if base in _TIME_TYPES:
+            return self.dialect.current_timestamp
+        if base in _BOOLEAN_TYPES:
+            return self.dialect.boolean_literals[0]
+        return "NULL"
+
+    def _comment_line(self, text: Optional[str]) -> str:
+        """SQL单行注释中不能出现换行"""
+        return " ".join(text.split()) if text else ""
+
+# 支持的方言，每种方言的生成器全局只创建一次
+DDL_DIALECTS: Dict[str, DDLDialect] = {
+    dialect.name: dialect
+    for dialect in (MySQLDialect(), OracleDialect(), PostgreSQLDialect())
+}
+_generators: Dict[str, DDLGenerator] = {name: DDLGenerator(dialect) for name, dialect in DDL_DIALECTS.items()}
+
+def get_ddl_generator(dialect: str = "mysql") -> DDLGenerator:
+    """
+    获取方言对应的DDL生成器
+
+    Raises:
+        ValueError: 不支持的方言
+    """
+    generator = _generators.get(dialect.lower())
+    if generator is None:
+        raise ValueError(f"不支持的数据库方言: {dialect}")
+    return generator
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, BinaryIO, Iterable, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+class ExportCache:
+    """
+    导出文件缓存
+
+    文件名由内容指纹（模型元数据、字段绑定及各字段 updated_at、导出参数）的哈希构成，
+    指纹不变即可直接返回磁盘文件；模型或字段变更后旧文件不会再被命中，
+    由服务层在绑定/解绑/更新字段时主动清理。总大小超过上限时按最近使用时间淘汰。
+
+    缓存目录由多个 worker 进程共用：以目录内容为准，文件修改时间即使用顺序（命中时更新），
+    写入与清理前重新扫描目录，上限针对整个目录而非单个进程。
+    命中与写入返回已打开的文件，之后即使文件被其他请求淘汰或清理，仍可完整发送。
+    """
+
+    # 临时文件超过此时长（秒）仍未完成视为写入进程已退出，可以清理
+    TEMP_GRACE_SECONDS = 3600
+
+    def __init__(self, directory: str, max_bytes: int, enabled: bool = True):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # 文件名 -> 大小（按最近使用排序）
+        self._size = 0
+
+    def make_key(self, model_id: int, fingerprint: Any, format: str, options: dict) -> str:
+        """生成缓存键（同时用作 ETag）"""
+        payload = json.dumps([fingerprint, format, options], sort_keys=True, default=str, ensure_ascii=False)
+        return f"m{model_id}-{hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]}"
+
+    def get(self, key: str, extension: str) -> Optional[BinaryIO]:
+        """命中时返回已打开的文件（调用方负责关闭）并更新使用顺序"""
+        filename = f"{key}.{extension}"
+        path = os.path.join(self.directory, filename)
+        with self._lock:
+            try:
+                file = open(path, "rb")
+            except FileNotFoundError:
+                self._size -= self._entries.pop(filename, 0)
+                return None
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                pass
+            if filename in self._entries:
+                self._entries.move_to_end(filename)
+        return file
+
+    def put(self, key: str, extension: str, chunks: Iterable[bytes]) -> BinaryIO:
+        """写入缓存文件（先写临时文件再原子替换），返回已打开的文件（调用方负责关闭）"""
+        filename = f"{key}.{extension}"
+        path = os.path.join(self.directory, filename)
+        os.makedirs(self.directory, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                for chunk in chunks:
+                    temp_file.write(chunk)
+            file = open(temp_path, "rb")
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        with self._lock:
+            self._rescan()
+            self._evict(keep=filename)
+        return file
+
+    def invalidate_models(self, model_ids: Iterable[int]) -> int:
+        """删除指定模型的全部缓存文件，返回删除数量"""
+        prefixes = tuple(f"m{model_id}-" for model_id in set(model_ids))
+        if not prefixes:
+            return 0
+        with self._lock:
+            self._rescan()
+            stale = [filename for filename in self._entries if filename.startswith(prefixes)]
+            for filename in stale:
+                self._remove(filename)
+        return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._rescan()
+            for filename in list(self._entries):
+                self._remove(filename)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    # ---- 内部方法（调用方持有锁） ----
+
+    def _rescan(self):
+        """扫描缓存目录，按修改时间恢复使用顺序，并清理超时的临时文件"""
+        self._entries.clear()
+        self._size = 0
+        if not os.path.isdir(self.directory):
+            return
+        now = time.time()
+        files = []
+        for entry in os.scandir(self.directory):
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+                if entry.name.startswith(".tmp-"):
+                    # 其他 worker 可能正在写入，只清理超时未完成的
+                    if now - stat.st_mtime > self.TEMP_GRACE_SECONDS:
+                        os.remove(entry.path)
+                    continue
+            except FileNotFoundError:
+                # 扫描期间已被其他 worker 替换或删除
+                continue
+            files.append((stat.st_mtime, entry.name, stat.st_size))
+        for _, filename, size in sorted(files):
+            self._entries[filename] = size
+            self._size += size
+
+    def _evict(self, keep: Optional[str] = None):
+        while self._size > self.max_bytes and self._entries:
+            filename = next(iter(self._entries))
+            if filename == keep:
+                if len(self._entries) == 1:
+                    break
+                self._entries.move_to_end(filename)
+                continue
+            self._remove(filename)
+
+    def _remove(self, filename: str):
+        self._size -= self._entries.pop(filename, 0)
+        try:
+            os.remove(os.path.join(self.directory, filename))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"删除导出缓存失败: {filename}: {e}")
+
+# 创建全局导出缓存实例
+export_cache = ExportCache(
+    settings.EXPORT_CACHE_DIR,
+    settings.EXPORT_CACHE_MAX_BYTES,
+    enabled=settings.EXPORT_CACHE_ENABLED
+)
@@ -1,21 +1,41 @@
+from collections import Counter
 from typing import List, Optional, Dict, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, func, select, insert, update, case, distinct
+import re
 import json
 
 from app.models.field import Field
 from app.models.root import Root
 from app.models.model import Model
 from app.models.model_field import ModelField
-from app.core.normalization import normalize_name, validate_name
+from app.models.field_root import FieldRoot
+from app.core.normalization import normalize_name, normalize_many, validate_name
 from app.core.conflict_checker import ConflictChecker
+from app.core.name_registry import name_registry
+from app.core.catalog import catalog
+from app.core.autocomplete import name_autocomplete, normalize_prefix
+from app.core.root_suggester import root_suggester
+from app.core.suffix_allocator import suffix_allocator
+from app.core.pagination import paginate_query, paginate_ranked
+from app.db.search import apply_search
+from app.db.versions import bump_table_versions
+from app.services.export_cache import export_cache
 from app.schemas.field import FieldCreate, FieldUpdate, FieldStatusUpdate
 
 class FieldService:
     """字段服务"""
     
+    # 列表排序字段（均有索引支撑游标分页）
+    SORT_COLUMNS = {
+        "id": Field.id,
+        "name": Field.field_name,
+        "created_at": Field.created_at
+    }
+    
     def __init__(self):
-        self.conflict_checker = ConflictChecker()
+        self.registry = name_registry
+        self.conflict_checker = ConflictChecker(self.registry)
     
     def create_field(self, db: Session, field_data: FieldCreate) -> Tuple[Optional[Field], List[str]]:
         """
@@ -32,14 +52,12 @@ class FieldService:
             return None, errors
         
         # 2. 检查所有词根是否存在
-        missing_roots = []
-        for root_name in field_data.root_list:
-            root = db.query(Root).filter(Root.normalized_name == root_name).first()
-            if not root:
-                missing_roots.append(root_name)
+        root_ids = self._resolve_root_ids(db, field_data.root_list)
+        missing_roots = [r for r in field_data.root_list if r not in root_ids]
         
         if missing_roots:
             errors.append(f"以下词根不存在: {', '.join(missing_roots)}")
+            errors.extend(self._suggest_missing_roots(db, missing_roots))
             errors.append("请先创建缺失的词根")
             return None, errors
         
@@ -62,10 +80,8 @@ class FieldService:
             return None, errors
         
         # 6. 检查冲突
-        existing_fields = self._get_all_fields(db)
-        has_conflict, conflicts, alternative = self.conflict_checker.check_field_conflicts(
-            normalized_name, existing_fields
-        )
+        catalog.sync(db, force=True)
+        has_conflict, conflicts, alternative = self.conflict_checker.check_field_conflicts(normalized_name)
         
         if has_conflict:
             errors.extend(conflicts)
@@ -73,6 +89,11 @@ class FieldService:
                 errors.append(f"建议使用: {alternative}")
             return None, errors
         
+        # 预留名称直到事务结束，并发创建同名字段时直接拒绝
+        if suffix_allocator.claim(db, [normalized_name]):
+            errors.append(f"字段名正在被其他请求创建: {normalized_name}")
+            return None, errors
+        
         # 7. 创建字段
         try:
             db_field = Field(
@@ -85,18 +106,112 @@ class FieldService:
                 status="active"
             )
             db.add(db_field)
+            db.flush()
+            self._save_field_roots(db, db_field.id, field_data.root_list, root_ids)
+            
+            # 更新词根使用计数（与字段写入同一事务）
+            self._update_root_usage_count(db, added=field_data.root_list)
+            
+            catalog.queue_registry_update(db, "upsert_field", db_field.id, db_field.field_name, db_field.normalized_name)
+            bump_table_versions(db, "fields", "roots")
             db.commit()
             db.refresh(db_field)
             
-            # 更新词根使用计数
-            self._update_root_usage_count(db, field_data.root_list, increment=True)
-            
             return db_field, []
         except Exception as e:
             db.rollback()
             errors.append(f"创建字段失败: {str(e)}")
             return None, errors
     
+    def batch_create_fields(
+        self,
+        db: Session,
+        text: str,
+        data_type: str = "VARCHAR",
+        dry_run: bool = False,
+        atomic: bool = False
+    ) -> Tuple[Optional[Dict], List[str]]:
+        """
+        文本批量创建字段
+        
+        每行一个字段：`词根1 词根2 ... | 业务含义 | 数据类型 | 备注`，
+        词根以空格、逗号或加号分隔，数据类型与备注可省略，空行与 # 开头的行忽略。
+        全部词根一次 IN 查询解析；冲突检测覆盖现有字段与本批次其他行；
+        字段、词根关联与词根使用计数在同一事务中写入。
+        
+        Args:
+            text: 批量文本
+            data_type: 行内未指定时的默认数据类型
+            dry_run: 为真时只返回预览结果，不写入
+            atomic: 为真时任一行有误则整批不创建
+        
+        Returns:
+            (创建报告, 错误信息列表)
+        """
+        entries = self._parse_batch_lines(text, data_type)
+        
+        all_roots = {root for entry in entries for root in entry["root_list"]}
+        root_ids = self._resolve_root_ids(db, list(all_roots))
+        catalog.sync(db, force=True)
+        
+        claimed: Dict[str, int] = {}  # 本批次已占用的字段规范化名 -> 行号
+        for entry in entries:
+            entry["errors"] = self._check_batch_entry(db, entry, root_ids, claimed)
+            if not entry["errors"]:
+                claimed[entry["normalized_name"]] = entry["line"]
+        
+        valid = [entry for entry in entries if not entry["errors"]]
+        failed = len(entries) - len(valid)
+        report = {
+            "total": len(entries),
+            "created": 0,
+            "failed": failed,
+            "dry_run": dry_run,
+            "items": entries
+        }
+        if dry_run or not valid or (atomic and failed):
+            return report, []
+        
+        busy = suffix_allocator.claim(db, [entry["normalized_name"] for entry in valid])
+        if busy:
+            return None, [f"字段名正在被其他请求创建: {name}" for name in busy]
+        
+        try:
+            created = db.execute(
+                insert(Field).returning(Field.id, Field.normalized_name),
+                [
+                    {
+                        "field_name": entry["field_name"],
+                        "normalized_name": entry["normalized_name"],
+                        "meaning": entry["meaning"],
+                        "data_type": entry["data_type"],
+                        "root_list": json.dumps(entry["root_list"]),
+                        "remark": entry["remark"],
+                        "status": "active"
+                    }
+                    for entry in valid
+                ]
+            ).all()
+            field_ids = {normalized_name: field_id for field_id, normalized_name in created}
+            
+            field_roots = []
+            for entry in valid:
+                entry["id"] = field_ids[entry["normalized_name"]]
+                for position, root_name in enumerate(entry["root_list"]):
+                    field_roots.append({"field_id": entry["id"], "root_id": root_ids[root_name], "position": position})
+            db.execute(insert(FieldRoot), field_roots)
+            self._update_root_usage_count(db, added=[root for entry in valid for root in entry["root_list"]])
+            for entry in valid:
+                catalog.queue_registry_update(db, "upsert_field", entry["id"], entry["field_name"], entry["normalized_name"])
+            bump_table_versions(db, "fields", "roots")
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            return None, [f"批量创建字段失败: {str(e)}"]
+        
+        report["created"] = len(valid)
+        return report, []
+    
     def get_fields(
         self, 
         db: Session, 
@@ -104,32 +219,55 @@ class FieldService:
         limit: int = 20,
         search: Optional[str] = None,
         status: Optional[str] = None,
-        root_filter: Optional[str] = None
-    ) -> Tuple[List[Field], int]:
-        """获取字段列表"""
+        root_filter: Optional[str] = None,
+        sort: Optional[str] = None,
+        order: str = "asc",
+        cursor: Optional[str] = None,
+        include_total: bool = True
+    ) -> Tuple[List[Field], Optional[int], Optional[str]]:
+        """
+        获取字段列表
+        
+        有搜索词时默认按相关度排序，被模型引用次数作为次级排序。
+        
+        Returns:
+            (字段列表, 总数, 下一页游标)
+        """
         query = db.query(Field)
         
-        # 搜索过滤
+        # 搜索过滤（全文检索索引）
+        rank = None
         if search:
-            query = query.filter(
-                or_(
-                    Field.field_name.contains(search),
-                    Field.normalized_name.contains(search),
-                    Field.meaning.contains(search),
-                    Field.remark.contains(search)
-                )
-            )
+            query, rank = apply_search(query, Field, search)
         
         # 状态过滤
         if status:
             query = query.filter(Field.status == status)
         
-        # 词根过滤
+        # 词根过滤（精确匹配，走 field_roots 索引）
         if root_filter:
-            query = query.filter(Field.root_list.contains(root_filter))
-        
-        total = query.count()
-        fields = query.offset(skip).limit(limit).all()
+            query = query.filter(Field.id.in_(self._field_ids_with_roots([root_filter])))
+        
+        if sort is None:
+            sort = "relevance" if search else "id"
+        
+        if sort == "relevance":
+            usage_count = select(func.count(ModelField.id)).where(
+                ModelField.field_id == Field.id
+            ).correlate(Field).scalar_subquery()
+            ordering = [usage_count.desc(), Field.id.asc()]
+            if rank is not None:
+                ordering.insert(0, rank)
+            fields, total, next_cursor = paginate_ranked(
+                query, ordering, sort=sort, skip=skip, limit=limit,
+                cursor=cursor, include_total=include_total
+            )
+        else:
+            fields, total, next_cursor = paginate_query(
+                query, self.SORT_COLUMNS[sort], Field.id,
+                sort=sort, order=order, skip=skip, limit=limit,
+                cursor=cursor, include_total=include_total
+            )
         
         # 处理JSON字段
         for field in fields:
@@ -141,7 +279,7 @@ class FieldService:
             else:
                 field.root_list = []
         
-        return fields, total
+        return fields, total, next_cursor
     
     def get_field(self, db: Session, field_id: int) -> Optional[Field]:
         """获取单个字段"""
@@ -157,13 +295,13 @@ class FieldService:
         """更新字段"""
         errors = []
         
-        db_field = self.get_field(db, field_id)
+        db_field = db.query(Field).filter(Field.id == field_id).first()
         if not db_field:
             errors.append("字段不存在")
             return None, errors
         
         try:
-            old_root_list = db_field.root_list
+            old_root_list = self._parse_root_list(db_field.root_list)
             
             # 如果更新字段名，需要检查冲突
             if field_data.field_name and field_data.field_name != db_field.field_name:
@@ -174,9 +312,9 @@ class FieldService:
                     return None, errors
                 
                 # 检查冲突（排除自己）
-                existing_fields = [f for f in self._get_all_fields(db) if f.get("id") != field_id]
+                catalog.sync(db, force=True)
                 has_conflict, conflicts, alternative = self.conflict_checker.check_field_conflicts(
-                    normalized_name, existing_fields
+                    normalized_name, exclude_field_id=field_id
                 )
                 
                 if has_conflict:
@@ -199,25 +337,30 @@ class FieldService:
             # 如果更新词根列表，需要验证和更新计数
             if field_data.root_list is not None:
                 # 验证新词根列表
-                missing_roots = []
-                for root_name in field_data.root_list:
-                    root = db.query(Root).filter(Root.normalized_name == root_name).first()
-                    if not root:
-                        missing_roots.append(root_name)
+                root_ids = self._resolve_root_ids(db, field_data.root_list)
+                missing_roots = [r for r in field_data.root_list if r not in root_ids]
                 
                 if missing_roots:
                     errors.append(f"以下词根不存在: {', '.join(missing_roots)}")
+                    errors.extend(self._suggest_missing_roots(db, missing_roots))
                     return None, errors
                 
                 db_field.root_list = json.dumps(field_data.root_list)
+                self._save_field_roots(db, field_id, field_data.root_list, root_ids)
                 
-                # 更新词根使用计数
-                self._update_root_usage_count(db, old_root_list, increment=False)
-                self._update_root_usage_count(db, field_data.root_list, increment=True)
+                # 更新词根使用计数（按差额更新，与字段写入同一事务）
+                self._update_root_usage_count(db, added=field_data.root_list, removed=old_root_list)
             
+            catalog.queue_registry_update(db, "upsert_field", db_field.id, db_field.field_name, db_field.normalized_name)
+            bump_table_versions(db, "fields", "roots")
             db.commit()
             db.refresh(db_field)
             
+            # 清理引用该字段的模型导出缓存
+            export_cache.invalidate_models(
+                row[0] for row in db.query(ModelField.model_id).filter(ModelField.field_id == field_id).distinct()
+            )
+            
             # 重新获取并处理JSON字段
             return self.get_field(db, field_id), []
             
@@ -230,7 +373,7 @@ class FieldService:
         """删除字段"""
         errors = []
         
-        db_field = self.get_field(db, field_id)
+        db_field = db.query(Field).filter(Field.id == field_id).first()
         if not db_field:
             errors.append("字段不存在")
             return False, errors
@@ -245,9 +388,12 @@ class FieldService:
         try:
             # 更新词根使用计数
             if db_field.root_list:
-                self._update_root_usage_count(db, db_field.root_list, increment=False)
+                self._update_root_usage_count(db, removed=self._parse_root_list(db_field.root_list))
             
+            db.query(FieldRoot).filter(FieldRoot.field_id == field_id).delete()
             db.delete(db_field)
+            catalog.queue_registry_update(db, "remove_field", field_id)
+            bump_table_versions(db, "fields", "roots")
             db.commit()
             return True, []
         except Exception as e:
@@ -266,6 +412,7 @@ class FieldService:
         
         try:
             db_field.status = status_data.status
+            bump_table_versions(db, "fields")
             db.commit()
             return True, []
         except Exception as e:
@@ -273,6 +420,29 @@ class FieldService:
             errors.append(f"更新字段状态失败: {str(e)}")
             return False, errors
     
+    def autocomplete_fields(self, db: Session, q: str, limit: int = 10) -> Dict:
+        """
+        按前缀补全字段名，按被模型引用次数排序
+        
+        Returns:
+            {"query": 规范化后的前缀, "items": [...]}
+        """
+        prefix = normalize_prefix(q)
+        if not prefix:
+            return {"query": "", "items": []}
+        
+        catalog.sync(db)
+        items = [
+            {
+                "field_id": item["id"],
+                "field_name": item["name"],
+                "normalized_name": item["matched"],
+                "usage_count": item["weight"]
+            }
+            for item in name_autocomplete.complete_fields(db, prefix, limit=limit)
+        ]
+        return {"query": prefix, "items": items}
+    
     def check_field_unique(self, db: Session, field_name: str) -> Tuple[bool, Optional[str], List[str]]:
         """检查字段唯一性"""
         normalized_name = normalize_name(field_name)
@@ -287,7 +457,8 @@ class FieldService:
         # 检查是否已存在
         existing_field = db.query(Field).filter(Field.normalized_name == normalized_name).first()
         if existing_field:
-            alternatives = self.conflict_checker._generate_field_alternatives(normalized_name, [existing_field.normalized_name])
+            catalog.sync(db)
+            alternatives = self.conflict_checker._generate_field_alternatives(normalized_name, self.registry.field_names)
             return False, f"字段名已存在: {existing_field.field_name} (ID: {existing_field.id})", alternatives
         
         return True, "字段名可用", []
@@ -297,12 +468,10 @@ class FieldService:
         if not root_names:
             return []
         
-        # 构建查询条件：字段的词根列表包含所有指定的词根
-        query = db.query(Field)
-        for root_name in root_names:
-            query = query.filter(Field.root_list.contains(root_name))
-        
-        fields = query.all()
+        # 构建查询条件：字段的词根列表包含所有指定的词根（索引交集）
+        fields = db.query(Field).filter(
+            Field.id.in_(self._field_ids_with_roots(root_names))
+        ).all()
         
         # 处理JSON字段
         for field in fields:
@@ -316,32 +485,123 @@ class FieldService:
         
         return fields
     
-    def _update_root_usage_count(self, db: Session, root_names: List[str], increment: bool):
-        """更新词根使用计数"""
-        if not root_names:
+    def _update_root_usage_count(self, db: Session, added: List[str] = (), removed: List[str] = ()):
+        """
+        更新词根使用计数（不提交，由调用方与字段变更同一事务提交）
+        
+        按词根名汇总增减差额后执行单条 UPDATE ... WHERE normalized_name IN (...)，
+        计数不低于0。
+        """
+        deltas = Counter(added)
+        deltas.subtract(removed)
+        deltas = {name: delta for name, delta in deltas.items() if delta}
+        if not deltas:
             return
         
-        for root_name in root_names:
-            root = db.query(Root).filter(Root.normalized_name == root_name).first()
-            if root:
-                if increment:
-                    root.usage_count += 1
-                else:
-                    root.usage_count = max(0, root.usage_count - 1)
+        new_count = Root.usage_count + case(deltas, value=Root.normalized_name, else_=0)
+        db.execute(
+            update(Root)
+            .where(Root.normalized_name.in_(list(deltas)))
+            .values(usage_count=case((new_count < 0, 0), else_=new_count))
+            .execution_options(synchronize_session=False)
+        )
+    
+    def _parse_batch_lines(self, text: str, data_type: str) -> List[Dict]:
+        """解析批量文本，每个非空行生成一个字段条目"""
+        entries = []
+        for line_no, line in enumerate(text.splitlines(), 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            parts = [part.strip() for part in re.split(r"\s*[|\t]\s*", line)]
+            root_list = normalize_many(re.split(r"[\s,，+]+", parts[0]))
+            root_list = [root for root in root_list if root]
+            field_name = "_".join(root_list)
+            entries.append({
+                "line": line_no,
+                "source": line,
+                "root_list": root_list,
+                "field_name": field_name,
+                "normalized_name": normalize_name(field_name),
+                "meaning": parts[1] if len(parts) > 1 else "",
+                "data_type": (parts[2] if len(parts) > 2 and parts[2] else data_type).upper(),
+                "remark": parts[3] if len(parts) > 3 and parts[3] else None,
+                "id": None
+            })
+        return entries
+    
+    def _check_batch_entry(self, db: Session, entry: Dict, root_ids: Dict[str, int], claimed: Dict[str, int]) -> List[str]:
+        """校验批量条目：词根存在性、业务含义、命名合法性、与现有字段及本批次冲突"""
+        if not entry["root_list"]:
+            return ["字段必须基于词根组合创建"]
         
-        try:
-            db.commit()
-        except:
-            db.rollback()
+        errors = []
+        missing_roots = [root for root in entry["root_list"] if root not in root_ids]
+        if missing_roots:
+            errors.append(f"以下词根不存在: {', '.join(missing_roots)}")
+            errors.extend(self._suggest_missing_roots(db, missing_roots))
+        if not entry["meaning"]:
+            errors.append("缺少业务含义")
+        if len(entry["data_type"]) > 20:
+            errors.append("数据类型长度不能超过20个字符")
+        
+        normalized_name = entry["normalized_name"]
+        if normalized_name in claimed:
+            errors.append(f"与第{claimed[normalized_name]}行重复: {normalized_name}")
+        else:
+            has_conflict, conflicts, alternatives = self.conflict_checker.check_field_conflicts(normalized_name)
+            if has_conflict:
+                errors.extend(conflicts)
+                alternatives = [name for name in alternatives if name not in claimed]
+                if alternatives:
+                    errors.append(f"建议使用: {alternatives[0]}")
+        return errors
     
-    def _get_all_fields(self, db: Session) -> List[Dict]:
-        """获取所有字段（用于冲突检测）"""
-        fields = db.query(Field).all()
-        return [
-            {
-                "id": f.id,
-                "field_name": f.field_name,
-                "normalized_name": f.normalized_name
-            }
-            for f in fields
-        ] 
\ No newline at end of file
+    def _resolve_root_ids(self, db: Session, root_names: List[str]) -> Dict[str, int]:
+        """批量解析词根ID，返回 {规范化名: 词根ID}"""
+        if not root_names:
+            return {}
+        rows = db.query(Root.normalized_name, Root.id).filter(
+            Root.normalized_name.in_(set(root_names))
+        ).all()
+        return dict(rows)
+    
+    def _suggest_missing_roots(self, db: Session, missing_roots: List[str]) -> List[str]:
+        """为缺失的词根给出相似词根提示"""
+        catalog.sync(db)
+        hints = []
+        for name in missing_roots:
+            suggestions = root_suggester.suggest(normalize_name(name), limit=3)
+            if suggestions:
+                hints.append(f"词根 {name} 不存在，您是否要找: {', '.join(s['name'] for s in suggestions)}")
+        return hints
+    
+    def _save_field_roots(self, db: Session, field_id: int, root_names: List[str], root_ids: Dict[str, int]):
+        """重建字段的词根关联（与字段写入同一事务）"""
+        db.query(FieldRoot).filter(FieldRoot.field_id == field_id).delete()
+        rows = [
+            {"field_id": field_id, "root_id": root_ids[name], "position": position}
+            for position, name in enumerate(root_names)
+        ]
+        if rows:
+            db.execute(insert(FieldRoot), rows)
+    
+    def _field_ids_with_roots(self, root_names: List[str]):
+        """包含全部指定词根的字段ID子查询"""
+        names = set(root_names)
+        return (
+            select(FieldRoot.field_id)
+            .join(Root, Root.id == FieldRoot.root_id)
+            .where(Root.normalized_name.in_(names))
+            .group_by(FieldRoot.field_id)
+            .having(func.count(distinct(FieldRoot.root_id)) == len(names))
+        )
+    
+    def _parse_root_list(self, root_list) -> List[str]:
+        """解析JSON格式的词根列表"""
+        if not root_list:
+            return []
+        try:
+            return json.loads(root_list)
+        except (ValueError, TypeError):
+            return []
@@ -1,18 +1,38 @@
-from typing import List, Optional, Dict, Tuple
+import csv
+import io
+from collections import Counter
+from itertools import groupby
+from typing import BinaryIO, Iterator, List, Optional, Dict, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
-import json
+from sqlalchemy import and_, func, insert
 
 from app.models.model import Model
 from app.models.field import Field
 from app.models.model_field import ModelField
 from app.models.lineage import Lineage
 from app.core.normalization import normalize_name, validate_name
-from app.schemas.model import ModelCreate, ModelUpdate, ModelFieldBinding, ModelFieldUnbinding, ExportFormat
+from app.core.catalog import catalog
+from app.core.pagination import paginate_query, paginate_ranked
+from app.db.search import apply_search
+from app.db.versions import bump_table_versions
+from app.services.ddl_generator import get_ddl_generator
+from app.services.xlsx_writer import XlsxStreamWriter
+from app.services.export_cache import export_cache
+from app.schemas.model import ModelCreate, ModelUpdate, ModelFieldBinding, ModelFieldBatchBinding, ModelFieldUnbinding, ExportFormat
+
+# 结构文档导出列
+EXPORT_HEADERS = ["字段名", "数据类型", "业务含义", "是否必填", "默认值", "备注"]
 
 class ModelService:
     """模型服务"""
     
+    # 列表排序字段（均有索引支撑游标分页）
+    SORT_COLUMNS = {
+        "id": Model.id,
+        "name": Model.model_name,
+        "created_at": Model.created_at
+    }
+    
     def create_model(self, db: Session, model_data: ModelCreate) -> Tuple[Optional[Model], List[str]]:
         """
         创建模型
@@ -49,6 +69,7 @@ class ModelService:
                 status="active"
             )
             db.add(db_model)
+            bump_table_versions(db, "models")
             db.commit()
             db.refresh(db_model)
             return db_model, []
@@ -63,29 +84,50 @@ class ModelService:
         skip: int = 0, 
         limit: int = 20,
         search: Optional[str] = None,
-        status: Optional[str] = None
-    ) -> Tuple[List[Model], int]:
-        """获取模型列表"""
+        status: Optional[str] = None,
+        sort: Optional[str] = None,
+        order: str = "asc",
+        cursor: Optional[str] = None,
+        include_total: bool = True
+    ) -> Tuple[List[Model], Optional[int], Optional[str]]:
+        """
+        获取模型列表
+        
+        有搜索词时默认按相关度排序。
+        
+        Returns:
+            (模型列表, 总数, 下一页游标)
+        """
         query = db.query(Model)
         
-        # 搜索过滤
+        # 搜索过滤（全文检索索引）
+        rank = None
         if search:
-            query = query.filter(
-                or_(
-                    Model.model_name.contains(search),
-                    Model.description.contains(search),
-                    Model.remark.contains(search)
-                )
-            )
+            query, rank = apply_search(query, Model, search)
         
         # 状态过滤
         if status:
             query = query.filter(Model.status == status)
         
-        total = query.count()
-        models = query.offset(skip).limit(limit).all()
+        if sort is None:
+            sort = "relevance" if search else "id"
         
-        return models, total
+        if sort == "relevance":
+            ordering = [Model.id.asc()]
+            if rank is not None:
+                ordering.insert(0, rank)
+            models, total, next_cursor = paginate_ranked(
+                query, ordering, sort=sort, skip=skip, limit=limit,
+                cursor=cursor, include_total=include_total
+            )
+        else:
+            models, total, next_cursor = paginate_query(
+                query, self.SORT_COLUMNS[sort], Model.id,
+                sort=sort, order=order, skip=skip, limit=limit,
+                cursor=cursor, include_total=include_total
+            )
+        
+        return models, total, next_cursor
     
     def get_model(self, db: Session, model_id: int) -> Optional[Model]:
         """获取单个模型"""
@@ -97,27 +139,8 @@ class ModelService:
         if not model:
             return None
         
-        # 获取模型字段
-        model_fields = db.query(ModelField).filter(
-            ModelField.model_id == model_id
-        ).order_by(ModelField.pos).all()
-        
-        # 获取字段详细信息
-        fields = []
-        for mf in model_fields:
-            field = db.query(Field).filter(Field.id == mf.field_id).first()
-            if field:
-                fields.append({
-                    "id": mf.id,
-                    "field_id": mf.field_id,
-                    "field_name": field.field_name,
-                    "meaning": field.meaning,
-                    "data_type": field.data_type,
-                    "pos": mf.pos,
-                    "required": mf.required,
-                    "default_value": mf.default_value,
-                    "created_at": mf.created_at
-                })
+        # 获取模型字段（单次关联查询）
+        fields = [self._model_field_row(row) for row in self._model_fields_query(db, model_id)]
         
         return {
             "id": model.id,
@@ -130,6 +153,52 @@ class ModelService:
             "fields": fields
         }
     
+    def get_model_fields(
+        self, 
+        db: Session, 
+        model_id: int, 
+        skip: int = 0, 
+        limit: int = 100
+    ) -> Tuple[List[Dict], int]:
+        """分页获取模型字段（适用于宽表）"""
+        total = db.query(func.count(ModelField.id)).join(
+            Field, Field.id == ModelField.field_id
+        ).filter(ModelField.model_id == model_id).scalar()
+        rows = self._model_fields_query(db, model_id).offset(skip).limit(limit).all()
+        return [self._model_field_row(row) for row in rows], total
+    
+    def _model_fields_query(self, db: Session, model_id: int):
+        """模型字段关联查询，按 pos 排序"""
+        return db.query(
+            ModelField.id,
+            ModelField.field_id,
+            Field.field_name,
+            Field.meaning,
+            Field.data_type,
+            ModelField.pos,
+            ModelField.required,
+            ModelField.default_value,
+            ModelField.created_at
+        ).join(
+            Field, Field.id == ModelField.field_id
+        ).filter(
+            ModelField.model_id == model_id
+        ).order_by(ModelField.pos, ModelField.id)
+    
+    def _model_field_row(self, row) -> Dict:
+        """将关联查询结果行转换为字段信息字典"""
+        return {
+            "id": row.id,
+            "field_id": row.field_id,
+            "field_name": row.field_name,
+            "meaning": row.meaning,
+            "data_type": row.data_type,
+            "pos": row.pos,
+            "required": row.required,
+            "default_value": row.default_value,
+            "created_at": row.created_at
+        }
+    
     def update_model(self, db: Session, model_id: int, model_data: ModelUpdate) -> Tuple[Optional[Model], List[str]]:
         """更新模型"""
         errors = []
@@ -167,8 +236,10 @@ class ModelService:
             if model_data.remark is not None:
                 db_model.remark = model_data.remark
             
+            bump_table_versions(db, "models")
             db.commit()
             db.refresh(db_model)
+            export_cache.invalidate_models([model_id])
             return db_model, []
             
         except Exception as e:
@@ -194,7 +265,9 @@ class ModelService:
             
             # 删除模型
             db.delete(db_model)
+            bump_table_versions(db, "models", "model_fields")
             db.commit()
+            export_cache.invalidate_models([model_id])
             return True, []
         except Exception as e:
             db.rollback()
@@ -247,7 +320,9 @@ class ModelService:
             )
             db.add(lineage)
             
+            bump_table_versions(db, "model_fields")
             db.commit()
+            export_cache.invalidate_models([model_id])
             return True, []
             
         except Exception as e:
@@ -255,6 +330,76 @@ class ModelService:
             errors.append(f"绑定字段失败: {str(e)}")
             return False, errors
     
+    def bind_fields(self, db: Session, model_id: int, batch_data: ModelFieldBatchBinding) -> Tuple[Optional[Dict], List[str]]:
+        """
+        批量绑定字段到模型
+        
+        字段存在性与已绑定检查各用一条集合查询，ModelField 与 Lineage 各一次批量插入，
+        整批在同一事务中提交；任一字段校验失败则整批不绑定。
+        
+        Returns:
+            ({"bound": 已绑定字段ID列表, "skipped": 跳过的字段ID列表}, 错误信息列表)
+        """
+        errors = []
+        
+        if not db.query(Model.id).filter(Model.id == model_id).first():
+            errors.append("模型不存在")
+            return None, errors
+        
+        bindings = batch_data.bindings
+        field_ids = [binding.field_id for binding in bindings]
+        duplicates = sorted(field_id for field_id, count in Counter(field_ids).items() if count > 1)
+        if duplicates:
+            errors.append(f"请求中字段重复: {', '.join(map(str, duplicates))}")
+        
+        existing = {row[0] for row in db.query(Field.id).filter(Field.id.in_(field_ids)).all()}
+        missing = [field_id for field_id in dict.fromkeys(field_ids) if field_id not in existing]
+        if missing:
+            errors.append(f"以下字段不存在: {', '.join(map(str, missing))}")
+        
+        bound = {
+            row[0] for row in db.query(ModelField.field_id).filter(
+                ModelField.model_id == model_id,
+                ModelField.field_id.in_(field_ids)
+            ).all()
+        }
+        if bound and not batch_data.skip_bound:
+            errors.append(f"以下字段已经绑定到该模型: {', '.join(map(str, sorted(bound)))}")
+        
+        if errors:
+            return None, errors
+        
+        new_bindings = [binding for binding in bindings if binding.field_id not in bound]
+        try:
+            if new_bindings:
+                db.execute(insert(ModelField), [
+                    {
+                        "model_id": model_id,
+                        "field_id": binding.field_id,
+                        "pos": binding.pos,
+                        "required": binding.required,
+                        "default_value": binding.default_value
+                    }
+                    for binding in new_bindings
+                ])
+                db.execute(insert(Lineage), [
+                    {"field_id": binding.field_id, "model_id": model_id}
+                    for binding in new_bindings
+                ])
+            bump_table_versions(db, "model_fields")
+            db.commit()
+            if new_bindings:
+                export_cache.invalidate_models([model_id])
+        except Exception as e:
+            db.rollback()
+            errors.append(f"批量绑定字段失败: {str(e)}")
+            return None, errors
+        
+        return {
+            "bound": [binding.field_id for binding in new_bindings],
+            "skipped": sorted(bound)
+        }, []
+    
     def unbind_field(self, db: Session, model_id: int, unbinding_data: ModelFieldUnbinding) -> Tuple[bool, List[str]]:
         """从模型解绑字段"""
         errors = []
@@ -286,7 +431,9 @@ class ModelService:
                 )
             ).delete()
             
+            bump_table_versions(db, "model_fields")
             db.commit()
+            export_cache.invalidate_models([model_id])
             return True, []
             
         except Exception as e:
@@ -295,7 +442,7 @@ class ModelService:
             return False, errors
     
     def export_model(self, db: Session, model_id: int, export_data: ExportFormat) -> Tuple[Optional[str], Optional[str], List[str]]:
-        """导出模型"""
+        """导出模型SQL（Excel 结构文档见 iter_export 的 xlsx 格式）"""
         errors = []
         
         model_detail = self.get_model_detail(db, model_id)
@@ -305,11 +452,12 @@ class ModelService:
         
         try:
             if export_data.format == "sql":
-                content = self._generate_sql_ddl(model_detail, export_data.include_ddl, export_data.include_data)
+                generator = get_ddl_generator(export_data.dialect)
+                identifier_errors = generator.check_identifiers(model_detail)
+                if identifier_errors:
+                    return None, None, identifier_errors
+                content = generator.generate(model_detail, export_data.include_ddl, export_data.include_data)
                 filename = f"{model_detail['model_name']}.sql"
-            elif export_data.format == "excel":
-                content = self._generate_excel_content(model_detail)
-                filename = f"{model_detail['model_name']}.csv"
             else:
                 errors.append("不支持的导出格式")
                 return None, None, errors
@@ -320,74 +468,201 @@ class ModelService:
             errors.append(f"导出失败: {str(e)}")
             return None, None, errors
     
-    def _generate_sql_ddl(self, model_detail: Dict, include_ddl: bool, include_data: bool) -> str:
-        """生成SQL DDL语句"""
-        lines = []
-        
-        if include_ddl:
-            # 创建表语句
-            lines.append(f"-- 创建表: {model_detail['model_name']}")
-            lines.append(f"-- 描述: {model_detail['description'] or '无描述'}")
-            lines.append(f"CREATE TABLE {model_detail['model_name']} (")
-            
-            # 字段定义
-            field_lines = []
-            for field in model_detail['fields']:
-                field_def = f"    {field['field_name']} {field['data_type'].upper()}"
-                if field['required'] == "true":
-                    field_def += " NOT NULL"
-                if field['default_value']:
-                    field_def += f" DEFAULT '{field['default_value']}'"
-                field_def += f" COMMENT '{field['meaning']}'"
-                field_lines.append(field_def)
-            
-            lines.append(",\n".join(field_lines))
-            lines.append(");")
-            lines.append("")
-        
-        if include_data:
-            # 插入示例数据
-            lines.append("-- 示例数据")
-            lines.append(f"INSERT INTO {model_detail['model_name']} (")
-            field_names = [field['field_name'] for field in model_detail['fields']]
-            lines.append("    " + ", ".join(field_names))
-            lines.append(") VALUES (")
-            
-            # 示例值
-            sample_values = []
-            for field in model_detail['fields']:
-                if field['data_type'].lower() in ['int', 'bigint', 'smallint']:
-                    sample_values.append("1")
-                elif field['data_type'].lower() in ['varchar', 'char', 'text']:
-                    sample_values.append(f"'{field['meaning']}'")
-                elif field['data_type'].lower() in ['datetime', 'timestamp']:
-                    sample_values.append("CURRENT_TIMESTAMP")
-                else:
-                    sample_values.append("NULL")
-            
-            lines.append("    " + ", ".join(sample_values))
-            lines.append(");")
+    def export_model_file(
+        self,
+        db: Session,
+        model_id: int,
+        format: str,
+        **options
+    ) -> Tuple[Optional[BinaryIO], Optional[str], Optional[str], List[str]]:
+        """
+        导出单个模型到缓存文件
         
-        return "\n".join(lines)
+        缓存键为模型绑定关系、各绑定字段 updated_at 及导出参数的哈希，
+        命中时直接返回已有文件，未命中时流式生成后写入缓存。
+        返回已打开的文件（调用方负责关闭），发送期间文件被淘汰也不影响读取。
+        
+        Returns:
+            (已打开的缓存文件, 缓存键/ETag, 模型名称, 错误信息列表)
+        """
+        errors = []
+        
+        model_name, fingerprint = self._export_fingerprint(db, model_id)
+        if model_name is None:
+            errors.append("模型不存在")
+            return None, None, None, errors
+        
+        key = export_cache.make_key(model_id, fingerprint, format, options)
+        file = export_cache.get(key, format)
+        if file is None:
+            try:
+                file = export_cache.put(key, format, self.iter_export(db, [model_id], format, **options))
+            except Exception as e:
+                errors.append(f"导出失败: {str(e)}")
+                return None, None, None, errors
+        return file, key, model_name, []
     
-    def _generate_excel_content(self, model_detail: Dict) -> str:
-        """生成Excel/CSV内容"""
-        lines = []
+    def _export_fingerprint(self, db: Session, model_id: int) -> Tuple[Optional[str], Optional[List]]:
+        """
+        计算模型导出内容指纹
         
-        # 表头
-        headers = ["字段名", "数据类型", "业务含义", "是否必填", "默认值", "备注"]
-        lines.append(",".join(headers))
+        除 updated_at 外还包含字段的导出列本身：SQLite 的时间戳只精确到秒，
+        同一秒内的两次修改仅凭 updated_at 无法区分。
+        """
+        model = db.query(
+            Model.model_name, Model.description, Model.updated_at
+        ).filter(Model.id == model_id).first()
+        if not model:
+            return None, None
         
-        # 数据行
-        for field in model_detail['fields']:
+        bindings = db.query(
+            ModelField.id,
+            ModelField.field_id,
+            ModelField.pos,
+            ModelField.required,
+            ModelField.default_value,
+            Field.updated_at,
+            Field.field_name,
+            Field.meaning,
+            Field.data_type,
+            Field.remark
+        ).join(
+            Field, Field.id == ModelField.field_id
+        ).filter(
+            ModelField.model_id == model_id
+        ).order_by(ModelField.id).all()
+        
+        return model.model_name, [list(model), [list(row) for row in bindings]]
+    
+    def find_missing_models(self, db: Session, model_ids: List[int]) -> List[int]:
+        """返回不存在的模型ID"""
+        catalog.sync(db)
+        missing = [model_id for model_id in dict.fromkeys(model_ids) if catalog.model_name(model_id) is None]
+        if missing:
+            # 快照未命中时可能是其他进程刚提交的模型，忽略检查间隔再确认一次
+            catalog.sync(db, force=True)
+            missing = [model_id for model_id in missing if catalog.model_name(model_id) is None]
+        return missing
+    
+    def iter_export(
+        self,
+        db: Session,
+        model_ids: Optional[List[int]],
+        format: str,
+        include_ddl: bool = True,
+        include_data: bool = False,
+        dialect: str = "mysql",
+        sheet_layout: str = "per_model"
+    ) -> Iterator[bytes]:
+        """
+        流式导出模型（单个、多个或全部）
+        
+        模型与字段通过一条关联查询分批读取（yield_per），逐个模型生成内容，
+        内存占用只与单个模型的字段数相关。
+        
+        Args:
+            model_ids: 模型ID列表，为 None 时导出全部模型
+            format: sql、csv 或 xlsx
+            dialect: sql 格式的目标数据库（mysql/oracle/postgresql）
+            sheet_layout: xlsx 格式每个模型一个工作表（per_model）或合并为一个（combined）
+        
+        Yields:
+            导出内容字节
+        """
+        models = self._iter_export_models(db, model_ids)
+        if format == "xlsx":
+            yield from self._iter_xlsx_export(models, sheet_layout)
+            return
+        
+        if format == "csv":
+            chunks = self._iter_csv_export(models)
+        else:
+            chunks = get_ddl_generator(dialect).iter_ddl(models, include_ddl, include_data)
+        for chunk in chunks:
+            yield chunk.encode("utf-8")
+    
+    def _iter_export_models(self, db: Session, model_ids: Optional[List[int]]) -> Iterator[Dict]:
+        """按模型ID顺序逐个产出模型及其字段（字段按 pos 排序）"""
+        query = db.query(
+            Model.id.label("model_id"),
+            Model.model_name,
+            Model.description,
+            Field.field_name,
+            Field.meaning,
+            Field.data_type,
+            Field.remark,
+            ModelField.required,
+            ModelField.default_value
+        ).outerjoin(
+            ModelField, ModelField.model_id == Model.id
+        ).outerjoin(
+            Field, Field.id == ModelField.field_id
+        )
+        if model_ids is not None:
+            query = query.filter(Model.id.in_(model_ids))
+        query = query.order_by(Model.id, ModelField.pos, ModelField.id).yield_per(1000)
+        
+        for _, rows in groupby(query, key=lambda row: row.model_id):
+            rows = list(rows)
+            yield {
+                "model_name": rows[0].model_name,
+                "description": rows[0].description,
+                "fields": [
+                    {
+                        "field_name": row.field_name,
+                        "meaning": row.meaning,
+                        "data_type": row.data_type,
+                        "remark": row.remark,
+                        "required": row.required,
+                        "default_value": row.default_value
+                    }
+                    for row in rows if row.field_name is not None
+                ]
+            }
+    
+    def _iter_csv_export(self, models: Iterator[Dict]) -> Iterator[str]:
+        """逐行生成CSV（csv.writer 负责转义），带BOM便于Excel识别UTF-8"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        
+        def flush() -> str:
+            content = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            return content
+        
+        writer.writerow(["模型名"] + EXPORT_HEADERS)
+        yield "\ufeff" + flush()
+        for model_detail in models:
+            writer.writerows(self._export_rows(model_detail, with_model_name=True))
+            yield flush()
+    
+    def _iter_xlsx_export(self, models: Iterator[Dict], sheet_layout: str) -> Iterator[bytes]:
+        """生成XLSX：每个模型一个工作表，或全部模型合并到一个工作表"""
+        writer = XlsxStreamWriter()
+        if sheet_layout == "combined":
+            rows = (
+                row
+                for model_detail in models
+                for row in self._export_rows(model_detail, with_model_name=True)
+            )
+            yield from writer.write_sheet("模型字段", ["模型名"] + EXPORT_HEADERS, rows)
+        else:
+            for model_detail in models:
+                yield from writer.write_sheet(
+                    model_detail["model_name"], EXPORT_HEADERS, self._export_rows(model_detail)
+                )
+        yield from writer.close()
+    
+    def _export_rows(self, model_detail: Dict, with_model_name: bool = False) -> Iterator[List[str]]:
+        """模型字段导出行（列与 EXPORT_HEADERS 对应）"""
+        for field in model_detail["fields"]:
             row = [
-                field['field_name'],
-                field['data_type'],
-                field['meaning'],
-                "是" if field['required'] == "true" else "否",
-                field['default_value'] or "",
-                ""
+                field["field_name"],
+                field["data_type"],
+                field["meaning"],
+                "是" if field["required"] == "true" else "否",
+                field["default_value"] or "",
+                field["remark"] or ""
             ]
-            lines.append(",".join(row))
-        
-        return "\n".join(lines) 
\ No newline at end of file
+            yield [model_detail["model_name"]] + row if with_model_name else row
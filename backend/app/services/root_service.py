@@ -1,21 +1,166 @@
-from typing import List, Optional, Dict, Tuple
+from typing import Iterable, List, Optional, Dict, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, func, distinct, insert, select, update
 import json
+import tempfile
 
 from app.models.root import Root
 from app.models.field import Field
 from app.models.model import Model
 from app.models.model_field import ModelField
-from app.core.normalization import normalize_name, validate_name
+from app.models.field_root import FieldRoot
+from app.core.normalization import normalize_name, normalize_many, validate_name
 from app.core.conflict_checker import ConflictChecker
+from app.core.name_registry import name_registry
+from app.core.catalog import catalog
+from app.core.autocomplete import name_autocomplete, normalize_prefix
+from app.core.root_segmenter import root_segmenter
+from app.core.root_matcher import root_matcher
+from app.core.suffix_allocator import suffix_allocator
+from app.core.root_suggester import root_suggester
+from app.core.pagination import paginate_query, paginate_ranked
+from app.db.search import apply_search
+from app.db.versions import bump_table_versions
 from app.schemas.root import RootCreate, RootUpdate
 
+class RootImport:
+    """
+    分块导入词根
+    
+    调用方按固定大小的块喂入行：每块经规范化与校验后，与注册表及本批次已出现的名称做冲突检测，
+    并预留合法行的名称；合法行暂存到临时文件，不在内存中保留整个文件。
+    请求体读完后 finish 在一个事务中分块 executemany 插入并提交，写事务不跨越上传过程。
+    原子模式下任一行有误则不插入。
+    """
+    
+    def __init__(self, service: "RootService", db: Session, atomic: bool = False):
+        self.service = service
+        self.db = db
+        self.atomic = atomic
+        self.claimed: Dict[str, int] = {}  # 本批次已占用的词根名/别名 -> 行号
+        self.row_errors: List[Dict] = []
+        self.total = 0
+        self.valid = 0
+        self._spool = tempfile.TemporaryFile(mode="w+", encoding="utf-8")
+    
+    def feed(self, rows: Iterable[Tuple[int, Dict[str, str]]]):
+        """校验一块行，合法行预留名称后暂存"""
+        for line_no, row in rows:
+            self.total += 1
+            name = row.get("name", "")
+            errors = self.service._check_import_row(name, row, self.claimed, line_no)
+            if errors:
+                self.row_errors.append({"row": line_no, "name": name, "errors": errors})
+                continue
+            
+            normalized_name = normalize_name(name)
+            aliases = self.service._split_import_list(row.get("aliases"), normalize=True)
+            aliases = [alias for alias in aliases if alias != normalized_name]
+            # 名称预留到事务结束；被其他进行中的创建占用时本行失败，也不计入本批次已占用的名称
+            busy = suffix_allocator.claim(self.db, [normalized_name, *aliases])
+            if busy:
+                self.row_errors.append({
+                    "row": line_no,
+                    "name": name,
+                    "errors": [f"词根名正在被其他请求创建: {item}" for item in busy]
+                })
+                continue
+            
+            self.claimed[normalized_name] = line_no
+            for alias in aliases:
+                self.claimed[alias] = line_no
+            self._spool.write(json.dumps({
+                "name": name,
+                "normalized_name": normalized_name,
+                "aliases": aliases,
+                "tags": self.service._split_import_list(row.get("tags")),
+                "remark": row.get("remark") or None
+            }, ensure_ascii=False) + "\n")
+            self.valid += 1
+    
+    def finish(self) -> Tuple[Optional[Dict], List[str]]:
+        """请求体读完后一次性写入，返回 (导入报告, 错误信息列表)"""
+        created = []
+        aliases_by_name: Dict[str, List[str]] = {}
+        try:
+            if self.valid and not (self.atomic and self.row_errors):
+                # 上传耗时可能超过预留时限，插入前续期；期间被其他请求占用则整批放弃
+                busy = suffix_allocator.claim(self.db, list(self.claimed))
+                if busy:
+                    self.db.rollback()
+                    return None, [f"词根名正在被其他请求创建: {name}" for name in busy]
+                self._spool.seek(0)
+                for chunk in self._read_chunks():
+                    created.extend(self.db.execute(
+                        insert(Root).returning(Root.id, Root.name, Root.normalized_name),
+                        [
+                            {
+                                "name": record["name"],
+                                "normalized_name": record["normalized_name"],
+                                "aliases": json.dumps(record["aliases"]),
+                                "tags": json.dumps(record["tags"]),
+                                "remark": record["remark"],
+                                "usage_count": 0,
+                                "status": "active"
+                            }
+                            for record in chunk
+                        ]
+                    ).all())
+                    aliases_by_name.update((record["normalized_name"], record["aliases"]) for record in chunk)
+                for root_id, name, normalized_name in created:
+                    catalog.queue_registry_update(
+                        self.db, "upsert_root", root_id, name, normalized_name, aliases_by_name[normalized_name]
+                    )
+                bump_table_versions(self.db, "roots")
+                self.db.commit()
+            else:
+                self.db.rollback()
+        except Exception as e:
+            self.db.rollback()
+            return None, [f"导入词根失败: {str(e)}"]
+        finally:
+            self._spool.close()
+        
+        self.row_errors.sort(key=lambda item: item["row"])
+        return {
+            "total": self.total,
+            "created": len(created),
+            "failed": len(self.row_errors),
+            "errors": self.row_errors
+        }, []
+    
+    def abort(self):
+        """放弃导入（请求体解析失败等）"""
+        self.db.rollback()
+        self._spool.close()
+    
+    def _read_chunks(self):
+        chunk = []
+        for line in self._spool:
+            chunk.append(json.loads(line))
+            if len(chunk) >= self.service.IMPORT_CHUNK_SIZE:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
 class RootService:
     """词根服务"""
     
+    # 列表排序字段（均有索引支撑游标分页）
+    SORT_COLUMNS = {
+        "id": Root.id,
+        "name": Root.name,
+        "created_at": Root.created_at,
+        "usage_count": Root.usage_count
+    }
+    
+    # 导入时每块的行数
+    IMPORT_CHUNK_SIZE = 1000
+    
     def __init__(self):
-        self.conflict_checker = ConflictChecker()
+        self.registry = name_registry
+        self.conflict_checker = ConflictChecker(self.registry)
     
     def create_root(self, db: Session, root_data: RootCreate) -> Tuple[Optional[Root], List[str]]:
         """
@@ -39,12 +184,8 @@ class RootService:
             return None, errors
         
         # 3. 检查冲突
-        existing_roots = self._get_all_roots(db)
-        existing_fields = self._get_all_fields(db)
-        
-        has_conflict, conflicts, alternative = self.conflict_checker.check_root_conflicts(
-            normalized_name, existing_roots, existing_fields
-        )
+        catalog.sync(db, force=True)
+        has_conflict, conflicts, alternative = self.conflict_checker.check_root_conflicts(normalized_name)
         
         if has_conflict:
             errors.extend(conflicts)
@@ -52,6 +193,11 @@ class RootService:
                 errors.append(f"建议使用: {alternative}")
             return None, errors
         
+        # 预留名称直到事务结束，并发创建同名词根时直接拒绝
+        if suffix_allocator.claim(db, [normalized_name]):
+            errors.append(f"词根名正在被其他请求创建: {normalized_name}")
+            return None, errors
+        
         # 4. 创建词根
         try:
             db_root = Root(
@@ -63,6 +209,9 @@ class RootService:
                 status="active"
             )
             db.add(db_root)
+            db.flush()
+            catalog.queue_registry_update(db, "upsert_root", db_root.id, db_root.name, db_root.normalized_name)
+            bump_table_versions(db, "roots")
             db.commit()
             db.refresh(db_root)
             return db_root, []
@@ -71,33 +220,89 @@ class RootService:
             errors.append(f"创建词根失败: {str(e)}")
             return None, errors
     
+    def start_import(self, db: Session, atomic: bool = False) -> "RootImport":
+        """开始分块导入词根，调用方逐块 feed 后调用 finish"""
+        catalog.sync(db, force=True)
+        return RootImport(self, db, atomic)
+    
+    def import_roots(
+        self,
+        db: Session,
+        rows: Iterable[Tuple[int, Dict[str, str]]],
+        atomic: bool = False
+    ) -> Tuple[Optional[Dict], List[str]]:
+        """
+        批量导入词根
+        
+        按 IMPORT_CHUNK_SIZE 行分块校验，全部读完后在一个事务中插入，见 RootImport。
+        
+        Args:
+            rows: (行号, {列名: 值}) 序列，列为 name/remark/tags/aliases，
+                  tags 与 aliases 以分号或竖线分隔
+            atomic: 为真时任一行有误则整批不导入
+        
+        Returns:
+            (导入报告, 错误信息列表)
+        """
+        job = self.start_import(db, atomic)
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= self.IMPORT_CHUNK_SIZE:
+                job.feed(chunk)
+                chunk = []
+        if chunk:
+            job.feed(chunk)
+        return job.finish()
+    
     def get_roots(
         self, 
         db: Session, 
         skip: int = 0, 
         limit: int = 20,
         search: Optional[str] = None,
-        status: Optional[str] = None
-    ) -> Tuple[List[Root], int]:
-        """获取词根列表"""
+        status: Optional[str] = None,
+        sort: Optional[str] = None,
+        order: str = "asc",
+        cursor: Optional[str] = None,
+        include_total: bool = True
+    ) -> Tuple[List[Root], Optional[int], Optional[str]]:
+        """
+        获取词根列表
+        
+        有搜索词时默认按相关度排序，使用次数作为次级排序。
+        
+        Returns:
+            (词根列表, 总数, 下一页游标)
+        """
         query = db.query(Root)
         
-        # 搜索过滤
+        # 搜索过滤（全文检索索引）
+        rank = None
         if search:
-            query = query.filter(
-                or_(
-                    Root.name.contains(search),
-                    Root.normalized_name.contains(search),
-                    Root.remark.contains(search)
-                )
-            )
+            query, rank = apply_search(query, Root, search)
         
         # 状态过滤
         if status:
             query = query.filter(Root.status == status)
         
-        total = query.count()
-        roots = query.offset(skip).limit(limit).all()
+        if sort is None:
+            sort = "relevance" if search else "id"
+        
+        if sort == "relevance":
+            ordering = [Root.usage_count.desc(), Root.id.asc()]
+            if rank is not None:
+                ordering.insert(0, rank)
+            roots, total, next_cursor = paginate_ranked(
+                query, ordering, sort=sort, skip=skip, limit=limit,
+                cursor=cursor, include_total=include_total
+            )
+        else:
+            roots, total, next_cursor = paginate_query(
+                query, self.SORT_COLUMNS[sort], Root.id,
+                sort=sort, order=order, skip=skip, limit=limit,
+                cursor=cursor, include_total=include_total
+            )
         
         # 处理JSON字段
         for root in roots:
@@ -117,7 +322,7 @@ class RootService:
             else:
                 root.tags = []
         
-        return roots, total
+        return roots, total, next_cursor
     
     def get_root(self, db: Session, root_id: int) -> Optional[Root]:
         """获取单个词根"""
@@ -146,7 +351,7 @@ class RootService:
         """更新词根"""
         errors = []
         
-        db_root = self.get_root(db, root_id)
+        db_root = db.query(Root).filter(Root.id == root_id).first()
         if not db_root:
             errors.append("词根不存在")
             return None, errors
@@ -161,11 +366,9 @@ class RootService:
                     return None, errors
                 
                 # 检查冲突（排除自己）
-                existing_roots = [r for r in self._get_all_roots(db) if r.get("id") != root_id]
-                existing_fields = self._get_all_fields(db)
-                
+                catalog.sync(db, force=True)
                 has_conflict, conflicts, alternative = self.conflict_checker.check_root_conflicts(
-                    normalized_name, existing_roots, existing_fields
+                    normalized_name, exclude_root_id=root_id
                 )
                 
                 if has_conflict:
@@ -183,6 +386,8 @@ class RootService:
             if root_data.tags is not None:
                 db_root.tags = json.dumps(root_data.tags)
             
+            self._queue_registry_sync(db, db_root)
+            bump_table_versions(db, "roots")
             db.commit()
             db.refresh(db_root)
             
@@ -204,15 +409,17 @@ class RootService:
             return False, errors
         
         # 检查是否被引用
-        impact = self.get_root_impact(db, root_id)
-        if impact["fields"] or impact["models"]:
+        field_total, model_total = self._count_root_impact(db, [root_id])[root_id]
+        if field_total or model_total:
             errors.append("词根正在被使用，无法删除")
-            errors.append(f"影响字段: {len(impact['fields'])}个")
-            errors.append(f"影响模型: {len(impact['models'])}个")
+            errors.append(f"影响字段: {field_total}个")
+            errors.append(f"影响模型: {model_total}个")
             return False, errors
         
         try:
             db.delete(db_root)
+            catalog.queue_registry_update(db, "remove_root", root_id)
+            bump_table_versions(db, "roots")
             db.commit()
             return True, []
         except Exception as e:
@@ -224,7 +431,7 @@ class RootService:
         """添加别名"""
         errors = []
         
-        db_root = self.get_root(db, root_id)
+        db_root = db.query(Root).filter(Root.id == root_id).first()
         if not db_root:
             errors.append("词根不存在")
             return None, errors
@@ -235,28 +442,27 @@ class RootService:
             errors.append("别名不能为空")
             return None, errors
         
-        # 检查别名是否与现有词根冲突
-        existing_roots = self._get_all_roots(db)
-        existing_fields = self._get_all_fields(db)
+        # 解析现有别名，已存在时直接返回
+        current_aliases = json.loads(db_root.aliases) if db_root.aliases else []
+        if normalized_alias in current_aliases:
+            return self.get_root(db, root_id), []
         
-        has_conflict, conflicts, _ = self.conflict_checker.check_root_conflicts(
-            normalized_alias, existing_roots, existing_fields
-        )
+        # 检查别名是否与现有词根、别名、字段冲突
+        catalog.sync(db, force=True)
+        has_conflict, conflicts, _ = self.conflict_checker.check_root_conflicts(normalized_alias)
         
         if has_conflict:
             errors.extend(conflicts)
             return None, errors
         
         try:
-            # 解析现有别名
-            current_aliases = json.loads(db_root.aliases) if db_root.aliases else []
-            
             # 添加新别名
-            if normalized_alias not in current_aliases:
-                current_aliases.append(normalized_alias)
-                db_root.aliases = json.dumps(current_aliases)
-                db.commit()
-                db.refresh(db_root)
+            current_aliases.append(normalized_alias)
+            db_root.aliases = json.dumps(current_aliases)
+            self._queue_registry_sync(db, db_root)
+            bump_table_versions(db, "roots")
+            db.commit()
+            db.refresh(db_root)
             
             return self.get_root(db, root_id), []
             
@@ -265,53 +471,270 @@ class RootService:
             errors.append(f"添加别名失败: {str(e)}")
             return None, errors
     
-    def get_root_impact(self, db: Session, root_id: int) -> Dict:
-        """获取词根影响面"""
-        db_root = self.get_root(db, root_id)
-        if not db_root:
-            return {"fields": [], "models": []}
+    def suggest_roots(self, db: Session, q: str, limit: int = 5, max_distance: int = 2) -> Dict:
+        """
+        按编辑距离推荐相似词根（匹配规范化名与别名）
+        
+        Returns:
+            {"query": 规范化后的查询词, "suggestions": [...]}
+        """
+        normalized = normalize_name(q)
+        if not normalized:
+            return {"query": "", "suggestions": []}
+        
+        catalog.sync(db)
+        return {
+            "query": normalized,
+            "suggestions": root_suggester.suggest(normalized, limit=limit, max_distance=max_distance)
+        }
+    
+    def autocomplete_roots(self, db: Session, q: str, limit: int = 10) -> Dict:
+        """
+        按前缀补全词根（匹配规范化名与别名），按使用次数排序
+        
+        Returns:
+            {"query": 规范化后的前缀, "items": [...]}
+        """
+        prefix = normalize_prefix(q)
+        if not prefix:
+            return {"query": "", "items": []}
+        
+        catalog.sync(db)
+        items = [
+            {
+                "root_id": item["id"],
+                "name": item["name"],
+                "matched": item["matched"],
+                "is_alias": item["is_alias"],
+                "usage_count": item["weight"]
+            }
+            for item in name_autocomplete.complete_roots(db, prefix, limit=limit)
+        ]
+        return {"query": prefix, "items": items}
+    
+    def segment_names(self, db: Session, names: List[str], top_k: int = 1) -> Dict:
+        """
+        把任意格式的标识符切分为已知词根（含别名）序列，按覆盖率与词根使用次数排序
+        
+        Returns:
+            {"items": [{"input": 原始标识符, "candidates": [...]}]}
+        """
+        catalog.sync(db)
+        name_autocomplete.sync_root_weights(db)
+        weight = name_autocomplete.root_weight
+        return {
+            "items": [
+                {"input": name, "candidates": root_segmenter.segment(name, top_k=top_k, weight=weight)}
+                for name in names
+            ]
+        }
+    
+    def match_roots(self, db: Session, texts: List[str], whole_word: bool = True, longest_only: bool = True) -> List[Dict]:
+        """
+        找出文本中出现的词根（含别名），每段文本单次扫描
+        
+        Returns:
+            与输入一一对应的 {"matches": [...], "roots": [...]} 列表
+        """
+        catalog.sync(db)
+        return [root_matcher.match(text, whole_word=whole_word, longest_only=longest_only) for text in texts]
+    
+    def get_root_impact(
+        self, 
+        db: Session, 
+        root_id: int,
+        field_skip: int = 0,
+        field_limit: Optional[int] = None,
+        model_skip: int = 0,
+        model_limit: Optional[int] = None
+    ) -> Dict:
+        """
+        获取词根影响面
+        
+        字段与模型各用一条关联查询获取，两个列表各自分页；field_total/model_total 为去重总数。
+        """
+        if not db.query(Root.id).filter(Root.id == root_id).first():
+            return {"fields": [], "models": [], "field_total": 0, "model_total": 0}
         
         # 查找使用该词根的字段
-        fields = db.query(Field).filter(
-            Field.root_list.contains(db_root.normalized_name)
-        ).all()
+        field_query = db.query(Field.id, Field.field_name).join(
+            FieldRoot, FieldRoot.field_id == Field.id
+        ).filter(FieldRoot.root_id == root_id).distinct().order_by(Field.id)
         
         # 查找使用这些字段的模型
-        model_ids = set()
-        for field in fields:
-            model_fields = db.query(ModelField).filter(ModelField.field_id == field.id).all()
-            for mf in model_fields:
-                model_ids.add(mf.model_id)
+        model_query = db.query(Model.id, Model.model_name).join(
+            ModelField, ModelField.model_id == Model.id
+        ).join(
+            FieldRoot, FieldRoot.field_id == ModelField.field_id
+        ).filter(FieldRoot.root_id == root_id).distinct().order_by(Model.id)
+        
+        if field_skip:
+            field_query = field_query.offset(field_skip)
+        if field_limit is not None:
+            field_query = field_query.limit(field_limit)
+        if model_skip:
+            model_query = model_query.offset(model_skip)
+        if model_limit is not None:
+            model_query = model_query.limit(model_limit)
         
-        models = []
-        if model_ids:
-            models = db.query(Model).filter(Model.id.in_(list(model_ids))).all()
+        counts = self._count_root_impact(db, [root_id]).get(root_id, (0, 0))
         
         return {
-            "fields": [{"id": f.id, "field_name": f.field_name} for f in fields],
-            "models": [{"id": m.id, "model_name": m.model_name} for m in models]
+            "fields": [{"id": f.id, "field_name": f.field_name} for f in field_query.all()],
+            "models": [{"id": m.id, "model_name": m.model_name} for m in model_query.all()],
+            "field_total": counts[0],
+            "model_total": counts[1]
         }
     
-    def _get_all_roots(self, db: Session) -> List[Dict]:
-        """获取所有词根（用于冲突检测）"""
-        roots = db.query(Root).all()
-        return [
-            {
-                "id": r.id,
-                "name": r.name,
-                "normalized_name": r.normalized_name
+    def get_roots_impact(self, db: Session, root_ids: List[int], include_details: bool = False) -> Dict:
+        """
+        批量获取词根影响面
+        
+        无论词根数量多少，统计与明细各只执行固定数量的分组查询。
+        
+        Returns:
+            {"items": [...], "missing": [不存在的词根ID]}
+        """
+        root_ids = list(dict.fromkeys(root_ids))
+        if not root_ids:
+            return {"items": [], "missing": []}
+        
+        catalog.sync(db)
+        roots = catalog.root_names(root_ids)
+        if len(roots) < len(root_ids):
+            # 快照未命中时可能是其他进程刚提交的词根，忽略检查间隔再确认一次
+            catalog.sync(db, force=True)
+            roots = catalog.root_names(root_ids)
+        existing_ids = [root_id for root_id in root_ids if root_id in roots]
+        counts = self._count_root_impact(db, existing_ids)
+        
+        fields_by_root: Dict[int, List[Dict]] = {}
+        models_by_root: Dict[int, List[Dict]] = {}
+        if include_details and existing_ids:
+            field_rows = db.query(FieldRoot.root_id, Field.id, Field.field_name).join(
+                Field, Field.id == FieldRoot.field_id
+            ).filter(FieldRoot.root_id.in_(existing_ids)).distinct().order_by(FieldRoot.root_id, Field.id)
+            for root_id, field_id, field_name in field_rows:
+                fields_by_root.setdefault(root_id, []).append({"id": field_id, "field_name": field_name})
+            
+            model_rows = db.query(FieldRoot.root_id, Model.id, Model.model_name).join(
+                ModelField, ModelField.field_id == FieldRoot.field_id
+            ).join(
+                Model, Model.id == ModelField.model_id
+            ).filter(FieldRoot.root_id.in_(existing_ids)).distinct().order_by(FieldRoot.root_id, Model.id)
+            for root_id, model_id, model_name in model_rows:
+                models_by_root.setdefault(root_id, []).append({"id": model_id, "model_name": model_name})
+        
+        items = []
+        for root_id in existing_ids:
+            field_total, model_total = counts.get(root_id, (0, 0))
+            item = {
+                "root_id": root_id,
+                "normalized_name": roots[root_id],
+                "field_total": field_total,
+                "model_total": model_total
             }
-            for r in roots
+            if include_details:
+                item["fields"] = fields_by_root.get(root_id, [])
+                item["models"] = models_by_root.get(root_id, [])
+            items.append(item)
+        
+        return {
+            "items": items,
+            "missing": [root_id for root_id in root_ids if root_id not in roots]
+        }
+    
+    def recompute_usage_counts(self, db: Session, chunk_size: int = 1000) -> Tuple[int, int]:
+        """
+        按词根关联表重算词根使用计数
+        
+        按ID区间分块，每块一条集合式 UPDATE 并立即提交，只改写计数不一致的行，
+        单个事务持锁时间与总数据量无关。
+        
+        Returns:
+            (检查的词根数, 修正的词根数)
+        """
+        bounds = db.query(func.min(Root.id), func.max(Root.id), func.count(Root.id)).one()
+        min_id, max_id, total = bounds
+        if not total:
+            return 0, 0
+        
+        actual = select(func.count(FieldRoot.id)).where(
+            FieldRoot.root_id == Root.id
+        ).correlate(Root).scalar_subquery()
+        
+        fixed = 0
+        for start in range(min_id, max_id + 1, chunk_size):
+            result = db.execute(
+                update(Root)
+                .where(Root.id >= start, Root.id < start + chunk_size, Root.usage_count != actual)
+                .values(usage_count=actual)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount:
+                bump_table_versions(db, "roots")
+            db.commit()
+            fixed += result.rowcount
+        
+        return total, fixed
+    
+    def _count_root_impact(self, db: Session, root_ids: List[int]) -> Dict[int, Tuple[int, int]]:
+        """按词根分组统计受影响的字段数与模型数，返回 {词根ID: (字段数, 模型数)}"""
+        if not root_ids:
+            return {}
+        
+        field_counts = dict(
+            db.query(FieldRoot.root_id, func.count(distinct(FieldRoot.field_id)))
+            .filter(FieldRoot.root_id.in_(root_ids))
+            .group_by(FieldRoot.root_id)
+            .all()
+        )
+        model_counts = dict(
+            db.query(FieldRoot.root_id, func.count(distinct(ModelField.model_id)))
+            .join(ModelField, ModelField.field_id == FieldRoot.field_id)
+            .filter(FieldRoot.root_id.in_(root_ids))
+            .group_by(FieldRoot.root_id)
+            .all()
+        )
+        return {
+            root_id: (field_counts.get(root_id, 0), model_counts.get(root_id, 0))
+            for root_id in root_ids
+        }
+    
+    def _check_import_row(self, name: str, row: Dict[str, str], claimed: Dict[str, int], line_no: int) -> List[str]:
+        """校验导入行：命名合法性、与现有数据冲突、与本批次其他行冲突"""
+        normalized_name = normalize_name(name)
+        if not normalized_name:
+            return ["词根名称不能为空"]
+        if len(name) > 64:
+            return ["词根名称长度不能超过64个字符"]
+        
+        errors = []
+        aliases = [
+            alias for alias in self._split_import_list(row.get("aliases"), normalize=True)
+            if alias != normalized_name
         ]
+        for candidate in [normalized_name] + aliases:
+            if candidate in claimed:
+                errors.append(f"与第{claimed[candidate]}行重复: {candidate}")
+                continue
+            has_conflict, conflicts, alternative = self.conflict_checker.check_root_conflicts(candidate)
+            if has_conflict:
+                errors.extend(conflicts)
+                if alternative and candidate == normalized_name:
+                    errors.append(f"建议使用: {alternative}")
+        return errors
     
-    def _get_all_fields(self, db: Session) -> List[Dict]:
-        """获取所有字段（用于冲突检测）"""
-        fields = db.query(Field).all()
-        return [
-            {
-                "id": f.id,
-                "field_name": f.field_name,
-                "normalized_name": f.normalized_name
-            }
-            for f in fields
-        ] 
\ No newline at end of file
+    def _split_import_list(self, value: Optional[str], normalize: bool = False) -> List[str]:
+        """拆分导入行中以分号或竖线分隔的列表"""
+        if not value:
+            return []
+        items = [item.strip() for item in value.replace("|", ";").split(";")]
+        if normalize:
+            items = normalize_many(items)
+        return list(dict.fromkeys(item for item in items if item))
+    
+    def _queue_registry_sync(self, db: Session, db_root: Root):
+        """登记提交成功后的名称注册表同步（在 commit 之前调用）"""
+        aliases = json.loads(db_root.aliases) if db_root.aliases else []
+        catalog.queue_registry_update(db, "upsert_root", db_root.id, db_root.name, db_root.normalized_name, aliases)
@@ -0,0 +1,238 @@
+import io
+import re
+import zipfile
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional, Sequence
+from xml.sax.saxutils import escape, quoteattr
+
+# Excel 单个工作表的行数上限
+MAX_SHEET_ROWS = 1048576
+# 工作表名长度上限及非法字符
+MAX_SHEET_NAME_LENGTH = 31
+_INVALID_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
+# XML 1.0 不允许的控制字符
+_INVALID_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+_SHEET_HEADER = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    b'<sheetData>'
+)
+_SHEET_FOOTER = b'</sheetData></worksheet>'
+_END = object()
+
+class _StreamSink(io.RawIOBase):
+    """只写、不可定位的输出缓冲，zipfile 写入后由生成器取走"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+class XlsxStreamWriter:
+    """
+    流式 XLSX 写入器
+
+    直接按 OOXML 结构写 zip：工作表逐行以内联字符串写入，不使用共享字符串表；
+    输出为不可定位流（zip 使用数据描述符），每写完一批行即可交给响应，
+    内存占用与行数无关。工作簿元数据在所有工作表之后写入，只需保留工作表名称。
+
+    用法:
+        writer = XlsxStreamWriter()
+        yield from writer.write_sheet("sheet", header, rows)
+        yield from writer.close()
+    """
+
+    def __init__(self, flush_rows: int = 500, compresslevel: int = 6):
+        self._sink = _StreamSink()
+        self._zip = zipfile.ZipFile(self._sink, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=compresslevel)
+        self._sheet_names: List[str] = []
+        self._used_names = set()
+        self._flush_rows = flush_rows
+
+    def write_sheet(self, name: str, header: Optional[Sequence], rows: Iterable[Sequence]) -> Iterator[bytes]:
+        """
+        写入工作表，超过 Excel 行数上限时自动续写到新工作表（重复表头）
+
+        Yields:
+            已生成的 zip 字节
+        """
+        rows = iter(rows)
+        part = 1
+        while True:
+            sheet_name = self._unique_sheet_name(name if part == 1 else f"{name} ({part})")
+            truncated = yield from self._write_sheet_part(sheet_name, header, rows)
+            if not truncated:
+                return
+            following = next(rows, _END)
+            if following is _END:
+                return
+            rows = chain((following,), rows)
+            part += 1
+
+    def close(self) -> Iterator[bytes]:
+        """写入工作簿元数据与 zip 目录"""
+        if not self._sheet_names:
+            yield from self._write_sheet_part(self._unique_sheet_name("Sheet1"), None, iter(()))
+
+        sheets = "".join(
+            f'<sheet name={quoteattr(name)} sheetId="{index}" r:id="rId{index}"/>'
+            for index, name in enumerate(self._sheet_names, 1)
+        )
+        self._zip.writestr("xl/workbook.xml", (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            f'<sheets>{sheets}</sheets></workbook>'
+        ))
+
+        relationships = "".join(
+            f'<Relationship Id="rId{index}" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+            f'Target="worksheets/sheet{index}.xml"/>'
+            for index in range(1, len(self._sheet_names) + 1)
+        )
+        style_id = len(self._sheet_names) + 1
+        self._zip.writestr("xl/_rels/workbook.xml.rels", (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            f'{relationships}'
+            f'<Relationship Id="rId{style_id}" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+            'Target="styles.xml"/>'
+            '</Relationships>'
+        ))
+
+        # 首行加粗（s="1"）
+        self._zip.writestr("xl/styles.xml", (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+            '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+            '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+            '<fill><patternFill patternType="gray125"/></fill></fills>'
+            '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+            '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+            '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+            '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/></cellXfs>'
+            '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+            '</styleSheet>'
+        ))
+
+        self._zip.writestr("_rels/.rels", (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+            'Target="xl/workbook.xml"/>'
+            '</Relationships>'
+        ))
+
+        overrides = "".join(
+            f'<Override PartName="/xl/worksheets/sheet{index}.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            for index in range(1, len(self._sheet_names) + 1)
+        )
+        self._zip.writestr("[Content_Types].xml", (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/styles.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+            f'{overrides}'
+            '</Types>'
+        ))
+
+        self._zip.close()
+        yield self._sink.drain()
+
+    # ---- 内部方法 ----
+
+    def _write_sheet_part(self, sheet_name: str, header: Optional[Sequence], rows: Iterator[Sequence]):
+        """写入单个工作表，返回是否因达到行数上限而截断"""
+        self._sheet_names.append(sheet_name)
+        index = len(self._sheet_names)
+        truncated = False
+
+        with self._zip.open(f"xl/worksheets/sheet{index}.xml", mode="w") as sheet:
+            sheet.write(_SHEET_HEADER)
+            row_number = 0
+            if header:
+                row_number += 1
+                sheet.write(_row_xml(row_number, header, style=1))
+
+            batch = []
+            for row in rows:
+                row_number += 1
+                batch.append(_row_xml(row_number, row))
+                if len(batch) >= self._flush_rows:
+                    sheet.write(b"".join(batch))
+                    batch.clear()
+                    data = self._sink.drain()
+                    if data:
+                        yield data
+                if row_number >= MAX_SHEET_ROWS:
+                    truncated = True
+                    break
+            if batch:
+                sheet.write(b"".join(batch))
+            sheet.write(_SHEET_FOOTER)
+
+        data = self._sink.drain()
+        if data:
+            yield data
+        return truncated
+
+    def _unique_sheet_name(self, name: str) -> str:
+        """工作表名去除非法字符、截断到31个字符并保证唯一（不区分大小写）"""
+        base = _INVALID_SHEET_CHARS.sub("_", name).strip("'") or "Sheet"
+        candidate = base[:MAX_SHEET_NAME_LENGTH]
+        suffix = 2
+        while candidate.lower() in self._used_names:
+            tail = f" ({suffix})"
+            candidate = base[:MAX_SHEET_NAME_LENGTH - len(tail)] + tail
+            suffix += 1
+        self._used_names.add(candidate.lower())
+        return candidate
+
+def _column_letter(index: int) -> str:
+    letters = ""
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+# 常用列字母预先计算
+_COLUMNS = [_column_letter(index) for index in range(1, 65)]
+
+def _cell_xml(reference: str, value, style: int) -> str:
+    style_attr = f' s="{style}"' if style else ""
+    if value is None or value == "":
+        return ""
+    if isinstance(value, bool):
+        return f'<c r="{reference}" t="b"{style_attr}><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{reference}"{style_attr}><v>{value}</v></c>'
+    text = escape(_INVALID_XML_CHARS.sub("", str(value)))
+    return f'<c r="{reference}" t="inlineStr"{style_attr}><is><t xml:space="preserve">{text}</t></is></c>'
+
+def _row_xml(row_number: int, values: Sequence, style: int = 0) -> bytes:
+    cells = "".join(
+        _cell_xml(f"{_COLUMNS[index] if index < len(_COLUMNS) else _column_letter(index + 1)}{row_number}", value, style)
+        for index, value in enumerate(values)
+    )
+    return f'<row r="{row_number}">{cells}</row>'.encode("utf-8")
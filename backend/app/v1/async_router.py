@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+
+from app.v1.async_routes import roots, fields, models
+
+# 异步路由：与同步路由接口一致，挂载在 /api/v1/async 下便于对比并发吞吐
+# 流式导出与CSV导入本身已是流式处理，只保留同步版本
+async_api_v1_router = APIRouter()
+
+async_api_v1_router.include_router(roots.router, prefix="/roots", tags=["async-roots"])
+async_api_v1_router.include_router(fields.router, prefix="/fields", tags=["async-fields"])
+async_api_v1_router.include_router(models.router, prefix="/models", tags=["async-models"])
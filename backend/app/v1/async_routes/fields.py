@@ -0,0 +1,158 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from app.db.async_database import get_async_db
+from app.services.async_services import AsyncFieldService
+from app.schemas.field import (
+    FieldCreate, FieldUpdate, FieldResponse, FieldListResponse,
+    FieldStatusUpdate, FieldUniqueCheck, FieldUniqueResponse,
+    FieldBatchCreate, FieldBatchCreateResponse, FieldAutocompleteResponse
+)
+
+router = APIRouter()
+field_service = AsyncFieldService()
+
+@router.get("", response_model=FieldListResponse)
+async def list_fields(
+    page: int = Query(1, ge=1, description="页码"),
+    page_size: int = Query(20, ge=1, le=100, description="每页大小"),
+    search: Optional[str] = Query(None, description="搜索关键词"),
+    status: Optional[str] = Query(None, description="状态过滤"),
+    root_filter: Optional[str] = Query(None, description="词根过滤"),
+    sort: Optional[str] = Query(None, pattern="^(relevance|id|name|created_at)$", description="排序字段（有搜索词时默认relevance，否则默认id）"),
+    order: str = Query("asc", pattern="^(asc|desc)$", description="排序方向"),
+    cursor: Optional[str] = Query(None, description="分页游标（传入时忽略页码）"),
+    include_total: bool = Query(True, description="是否统计总数（仅首页统计）"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """获取字段列表"""
+    skip = (page - 1) * page_size
+    fields, total, next_cursor = await field_service.get_fields(
+        db,
+        skip=skip,
+        limit=page_size,
+        search=search,
+        status=status,
+        root_filter=root_filter,
+        sort=sort,
+        order=order,
+        cursor=cursor,
+        include_total=include_total
+    )
+    
+    return FieldListResponse(
+        list=fields,
+        total=total,
+        page=page,
+        pageSize=page_size,
+        next_cursor=next_cursor
+    )
+
+@router.post("", response_model=FieldResponse)
+async def create_field(field_data: FieldCreate, db: AsyncSession = Depends(get_async_db)):
+    """创建字段（强制词根组合）"""
+    field, errors = await field_service.create_field(db, field_data)
+    if not field:
+        raise HTTPException(status_code=400, detail={"errors": errors})
+    
+    return field
+
+@router.post("/batch", response_model=FieldBatchCreateResponse)
+async def batch_create_fields(batch_data: FieldBatchCreate, db: AsyncSession = Depends(get_async_db)):
+    """文本批量创建字段（每行一个字段，支持预览）"""
+    report, errors = await field_service.batch_create_fields(
+        db,
+        batch_data.text,
+        data_type=batch_data.data_type,
+        dry_run=batch_data.dry_run,
+        atomic=batch_data.atomic
+    )
+    if report is None:
+        raise HTTPException(status_code=400, detail={"errors": errors})
+    
+    return report
+
+@router.get("/autocomplete", response_model=FieldAutocompleteResponse)
+async def autocomplete_fields(
+    q: str = Query(..., min_length=1, description="输入前缀"),
+    limit: int = Query(10, ge=1, le=20, description="最多返回数量"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """按前缀补全字段名，按被模型引用次数排序"""
+    return await field_service.autocomplete_fields(db, q, limit=limit)
+
+@router.get("/{field_id}", response_model=FieldResponse)
+async def get_field(field_id: int, db: AsyncSession = Depends(get_async_db)):
+    """获取字段详情"""
+    field = await field_service.get_field(db, field_id)
+    if not field:
+        raise HTTPException(status_code=404, detail="字段不存在")
+    
+    return field
+
+@router.put("/{field_id}", response_model=FieldResponse)
+async def update_field(field_id: int, field_data: FieldUpdate, db: AsyncSession = Depends(get_async_db)):
+    """更新字段"""
+    field, errors = await field_service.update_field(db, field_id, field_data)
+    if not field:
+        raise HTTPException(status_code=400, detail={"errors": errors})
+    
+    return field
+
+@router.delete("/{field_id}")
+async def delete_field(field_id: int, db: AsyncSession = Depends(get_async_db)):
+    """删除字段"""
+    success, errors = await field_service.delete_field(db, field_id)
+    if not success:
+        raise HTTPException(status_code=400, detail={"errors": errors})
+    
+    return {"message": "字段删除成功"}
+
+@router.patch("/{field_id}/status")
+async def update_field_status(field_id: int, status_data: FieldStatusUpdate, db: AsyncSession = Depends(get_async_db)):
+    """更新字段状态"""
+    success, errors = await field_service.update_field_status(db, field_id, status_data)
+    if not success:
+        raise HTTPException(status_code=400, detail={"errors": errors})
+    
+    return {"message": "字段状态更新成功"}
+
+@router.post("/check-unique", response_model=FieldUniqueResponse)
+async def check_field_unique(check_data: FieldUniqueCheck, db: AsyncSession = Depends(get_async_db)):
+    """检查字段唯一性"""
+    is_unique, message, alternatives = await field_service.check_field_unique(db, check_data.field_name)
+    
+    return FieldUniqueResponse(
+        unique=is_unique,
+        message=message,
+        alternatives=alternatives
+    )
+
+@router.get("/by-roots/{root_names}")
+async def get_fields_by_roots(
+    root_names: str,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """根据词根组合查找字段"""
+    root_list = [r.strip() for r in root_names.split(",") if r.strip()]
+    
+    if not root_list:
+        raise HTTPException(status_code=400, detail="请提供有效的词根名称")
+    
+    fields = await field_service.get_field_by_roots(db, root_list)
+    
+    return {
+        "root_names": root_list,
+        "fields": [
+            {
+                "id": f.id,
+                "field_name": f.field_name,
+                "meaning": f.meaning,
+                "data_type": f.data_type,
+                "root_list": f.root_list,
+                "status": f.status
+            }
+            for f in fields
+        ]
+    }
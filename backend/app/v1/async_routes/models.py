@@ -0,0 +1,153 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from app.db.async_database import get_async_db
+from app.services.async_services import AsyncModelService
+from app.schemas.model import (
+    ModelCreate, ModelUpdate, ModelResponse, ModelListResponse,
+    ModelFieldBinding, ModelFieldUnbinding, ModelFieldListResponse,
+    ModelFieldBatchBinding, ModelFieldBatchResponse
+)
+
+router = APIRouter()
+model_service = AsyncModelService()
+
+@router.get("", response_model=ModelListResponse)
+async def list_models(
+    page: int = Query(1, ge=1, description="页码"),
+    page_size: int = Query(20, ge=1, le=100, description="每页大小"),
+    search: Optional[str] = Query(None, description="搜索关键词"),
+    status: Optional[str] = Query(None, description="状态过滤"),
+    sort: Optional[str] = Query(None, pattern="^(relevance|id|name|created_at)$", description="排序字段（有搜索词时默认relevance，否则默认id）"),
+    order: str = Query("asc", pattern="^(asc|desc)$", description="排序方向"),
+    cursor: Optional[str] = Query(None, description="分页游标（传入时忽略页码）"),
+    include_total: bool = Query(True, description="是否统计总数（仅首页统计）"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """获取模型列表"""
+    skip = (page - 1) * page_size
+    models, total, next_cursor = await model_service.get_models(
+        db,
+        skip=skip,
+        limit=page_size,
+        search=search,
+        status=status,
+        sort=sort,
+        order=order,
+        cursor=cursor,
+        include_total=include_total
+    )
+    
+    return ModelListResponse(
+        list=models,
+        total=total,
+        page=page,
+        pageSize=page_size,
+        next_cursor=next_cursor
+    )
+
+@router.post("", response_model=ModelResponse)
+async def create_model(model_data: ModelCreate, db: AsyncSession = Depends(get_async_db)):
+    """创建模型"""
+    model, errors = await model_service.create_model(db, model_data)
+    if not model:
+        raise HTTPException(status_code=400, detail={"errors": errors})
+    
+    return model
+
+@router.get("/{model_id}", response_model=ModelResponse)
+async def get_model(model_id: int, db: AsyncSession = Depends(get_async_db)):
+    """获取模型详情"""
+    model = await model_service.get_model(db, model_id)
+    if not model:
+        raise HTTPException(status_code=404, detail="模型不存在")
+    
+    return model
+
+@router.get("/{model_id}/detail")
+async def get_model_detail(model_id: int, db: AsyncSession = Depends(get_async_db)):
+    """获取模型详情（包含字段信息）"""
+    model_detail = await model_service.get_model_detail(db, model_id)
+    if not model_detail:
+        raise HTTPException(status_code=404, detail="模型不存在")
+    
+    return model_detail
+
+@router.get("/{model_id}/fields", response_model=ModelFieldListResponse)
+async def list_model_fields(
+    model_id: int,
+    page: int = Query(1, ge=1, description="页码"),
+    page_size: int = Query(100, ge=1, le=1000, description="每页大小"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """分页获取模型字段（按 pos 排序）"""
+    if not await model_service.get_model(db, model_id):
+        raise HTTPException(status_code=404, detail="模型不存在")
+    
+    skip = (page - 1) * page_size
+    fields, total = await model_service.get_model_fields(db, model_id, skip=skip, limit=page_size)
+    
+    return ModelFieldListResponse(
+        list=fields,
+        total=total,
+        page=page,
+        pageSize=page_size
+    )
+
+@router.put("/{model_id}", response_model=ModelResponse)
+async def update_model(model_id: int, model_data: ModelUpdate, db: AsyncSession = Depends(get_async_db)):
+    """更新模型"""
+    model, errors = await model_service.update_model(db, model_id, model_data)
+    if not model:
+        raise HTTPException(status_code=400, detail={"errors": errors})
+    
+    return model
+
+@router.delete("/{model_id}")
+async def delete_model(model_id: int, db: AsyncSession = Depends(get_async_db)):
+    """删除模型"""
+    success, errors = await model_service.delete_model(db, model_id)
+    if not success:
+        raise HTTPException(status_code=400, detail={"errors": errors})
+    
+    return {"message": "模型删除成功"}
+
+@router.post("/{model_id}/fields")
+async def bind_field_to_model(
+    model_id: int,
+    binding_data: ModelFieldBinding,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """绑定字段到模型"""
+    success, errors = await model_service.bind_field(db, model_id, binding_data)
+    if not success:
+        raise HTTPException(status_code=400, detail={"errors": errors})
+    
+    return {"message": "字段绑定成功"}
+
+@router.post("/{model_id}/fields:batch", response_model=ModelFieldBatchResponse)
+async def batch_bind_fields_to_model(
+    model_id: int,
+    batch_data: ModelFieldBatchBinding,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """批量绑定字段到模型"""
+    result, errors = await model_service.bind_fields(db, model_id, batch_data)
+    if result is None:
+        raise HTTPException(status_code=400, detail={"errors": errors})
+    
+    return result
+
+@router.delete("/{model_id}/fields")
+async def unbind_field_from_model(
+    model_id: int,
+    unbinding_data: ModelFieldUnbinding,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """从模型解绑字段"""
+    success, errors = await model_service.unbind_field(db, model_id, unbinding_data)
+    if not success:
+        raise HTTPException(status_code=400, detail={"errors": errors})
+    
+    return {"message": "字段解绑成功"}
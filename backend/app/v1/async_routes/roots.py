@@ -0,0 +1,163 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+import json
+
+from app.core.pagination import page_window
+from app.db.async_database import get_async_db
+from app.services.async_services import AsyncRootService
+from app.schemas.root import (
+    RootCreate, RootUpdate, RootResponse, RootListResponse,
+    AliasCreate, AliasResponse, RootImpactResponse,
+    RootImpactBatchRequest, RootImpactBatchResponse, RootSuggestResponse,
+    RootAutocompleteResponse, RootSegmentRequest, RootSegmentResponse,
+    RootMatchRequest, RootMatchResponse, RootMatchBatchRequest, RootMatchBatchResponse
+)
+
+router = APIRouter()
+root_service = AsyncRootService()
+
+@router.get("", response_model=RootListResponse)
+async def list_roots(
+    page: int = Query(1, ge=1, description="页码"),
+    page_size: int = Query(20, ge=1, le=100, description="每页大小"),
+    search: Optional[str] = Query(None, description="搜索关键词"),
+    status: Optional[str] = Query(None, description="状态过滤"),
+    sort: Optional[str] = Query(None, pattern="^(relevance|id|name|created_at|usage_count)$", description="排序字段（有搜索词时默认relevance，否则默认id）"),
+    order: str = Query("asc", pattern="^(asc|desc)$", description="排序方向"),
+    cursor: Optional[str] = Query(None, description="分页游标（传入时忽略页码）"),
+    include_total: bool = Query(True, description="是否统计总数（仅首页统计）"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """获取词根列表"""
+    skip = (page - 1) * page_size
+    roots, total, next_cursor = await root_service.get_roots(
+        db,
+        skip=skip,
+        limit=page_size,
+        search=search,
+        status=status,
+        sort=sort,
+        order=order,
+        cursor=cursor,
+        include_total=include_total
+    )
+    
+    return RootListResponse(
+        list=roots,
+        total=total,
+        page=page,
+        pageSize=page_size,
+        next_cursor=next_cursor
+    )
+
+@router.post("", response_model=RootResponse)
+async def create_root(root_data: RootCreate, db: AsyncSession = Depends(get_async_db)):
+    """创建词根"""
+    root, errors = await root_service.create_root(db, root_data)
+    if not root:
+        raise HTTPException(status_code=400, detail={"errors": errors})
+    
+    return root
+
+@router.post("/impact:batch", response_model=RootImpactBatchResponse)
+async def batch_root_impact(batch_data: RootImpactBatchRequest, db: AsyncSession = Depends(get_async_db)):
+    """批量获取词根影响面"""
+    return await root_service.get_roots_impact(db, batch_data.root_ids, include_details=batch_data.include_details)
+
+@router.post("/segment", response_model=RootSegmentResponse)
+async def segment_names(segment_data: RootSegmentRequest, db: AsyncSession = Depends(get_async_db)):
+    """把历史字段名等标识符切分为已知词根序列"""
+    return await root_service.segment_names(db, segment_data.names, top_k=segment_data.top_k)
+
+@router.post("/match", response_model=RootMatchResponse)
+async def match_roots(match_data: RootMatchRequest, db: AsyncSession = Depends(get_async_db)):
+    """分析文本中出现的词根"""
+    items = await root_service.match_roots(
+        db, [match_data.text], whole_word=match_data.whole_word, longest_only=match_data.longest_only
+    )
+    return items[0]
+
+@router.post("/match:batch", response_model=RootMatchBatchResponse)
+async def batch_match_roots(match_data: RootMatchBatchRequest, db: AsyncSession = Depends(get_async_db)):
+    """批量分析文本中出现的词根"""
+    items = await root_service.match_roots(
+        db, match_data.texts, whole_word=match_data.whole_word, longest_only=match_data.longest_only
+    )
+    return RootMatchBatchResponse(items=items)
+
+@router.get("/suggest", response_model=RootSuggestResponse)
+async def suggest_roots(
+    q: str = Query(..., min_length=1, description="查询词"),
+    limit: int = Query(5, ge=1, le=50, description="最多返回数量"),
+    max_distance: int = Query(2, ge=0, le=3, description="最大编辑距离"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """按编辑距离推荐相似词根"""
+    return await root_service.suggest_roots(db, q, limit=limit, max_distance=max_distance)
+
+@router.get("/autocomplete", response_model=RootAutocompleteResponse)
+async def autocomplete_roots(
+    q: str = Query(..., min_length=1, description="输入前缀"),
+    limit: int = Query(10, ge=1, le=20, description="最多返回数量"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """按前缀补全词根（含别名），按使用次数排序"""
+    return await root_service.autocomplete_roots(db, q, limit=limit)
+
+@router.get("/{root_id}", response_model=RootResponse)
+async def get_root(root_id: int, db: AsyncSession = Depends(get_async_db)):
+    """获取词根详情"""
+    root = await root_service.get_root(db, root_id)
+    if not root:
+        raise HTTPException(status_code=404, detail="词根不存在")
+    
+    return root
+
+@router.put("/{root_id}", response_model=RootResponse)
+async def update_root(root_id: int, root_data: RootUpdate, db: AsyncSession = Depends(get_async_db)):
+    """更新词根"""
+    root, errors = await root_service.update_root(db, root_id, root_data)
+    if not root:
+        raise HTTPException(status_code=400, detail={"errors": errors})
+    
+    return root
+
+@router.delete("/{root_id}")
+async def delete_root(root_id: int, db: AsyncSession = Depends(get_async_db)):
+    """删除词根"""
+    success, errors = await root_service.delete_root(db, root_id)
+    if not success:
+        raise HTTPException(status_code=400, detail={"errors": errors})
+    
+    return {"message": "词根删除成功"}
+
+@router.post("/{root_id}/aliases", response_model=AliasResponse)
+async def add_alias(root_id: int, alias_data: AliasCreate, db: AsyncSession = Depends(get_async_db)):
+    """添加别名"""
+    root, errors = await root_service.add_alias(db, root_id, alias_data.alias)
+    if not root:
+        raise HTTPException(status_code=400, detail={"errors": errors})
+    
+    aliases = json.loads(root.aliases) if root.aliases else []
+    
+    return AliasResponse(id=root.id, aliases=aliases)
+
+@router.get("/{root_id}/impact", response_model=RootImpactResponse)
+async def root_impact(
+    root_id: int,
+    page: Optional[int] = Query(None, ge=1, description="页码（不传则返回全部），字段与模型列表未单独指定时共用"),
+    page_size: int = Query(100, ge=1, le=1000, description="每页大小"),
+    field_page: Optional[int] = Query(None, ge=1, description="字段列表页码"),
+    field_page_size: Optional[int] = Query(None, ge=1, le=1000, description="字段列表每页大小"),
+    model_page: Optional[int] = Query(None, ge=1, description="模型列表页码"),
+    model_page_size: Optional[int] = Query(None, ge=1, le=1000, description="模型列表每页大小"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """获取词根影响面"""
+    impact = await root_service.get_root_impact(
+        db, root_id,
+        *page_window(field_page or page, field_page_size or page_size),
+        *page_window(model_page or page, model_page_size or page_size)
+    )
+    return RootImpactResponse(**impact)
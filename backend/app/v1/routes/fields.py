@@ -1,12 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from typing import Optional
 
-from app.db.database import get_db
+from app.core.conditional import check_not_modified
+from app.db.database import get_db, get_read_db
 from app.services.field_service import FieldService
 from app.schemas.field import (
     FieldCreate, FieldUpdate, FieldResponse, FieldListResponse,
-    FieldStatusUpdate, FieldUniqueCheck, FieldUniqueResponse
+    FieldStatusUpdate, FieldUniqueCheck, FieldUniqueResponse,
+    FieldBatchCreate, FieldBatchCreateResponse, FieldAutocompleteResponse
 )
 
 router = APIRouter()
@@ -14,29 +16,44 @@ field_service = FieldService()
 
 @router.get("", response_model=FieldListResponse)
 def list_fields(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1, description="页码"),
     page_size: int = Query(20, ge=1, le=100, description="每页大小"),
     search: Optional[str] = Query(None, description="搜索关键词"),
     status: Optional[str] = Query(None, description="状态过滤"),
     root_filter: Optional[str] = Query(None, description="词根过滤"),
-    db: Session = Depends(get_db)
+    sort: Optional[str] = Query(None, pattern="^(relevance|id|name|created_at)$", description="排序字段（有搜索词时默认relevance，否则默认id）"),
+    order: str = Query("asc", pattern="^(asc|desc)$", description="排序方向"),
+    cursor: Optional[str] = Query(None, description="分页游标（传入时忽略页码）"),
+    include_total: bool = Query(True, description="是否统计总数（仅首页统计）"),
+    db: Session = Depends(get_read_db)
 ):
     """获取字段列表"""
+    not_modified = check_not_modified(request, response, db, ("fields", "roots", "model_fields"))
+    if not_modified:
+        return not_modified
+    
     skip = (page - 1) * page_size
-    fields, total = field_service.get_fields(
+    fields, total, next_cursor = field_service.get_fields(
         db, 
         skip=skip, 
         limit=page_size, 
         search=search, 
         status=status,
-        root_filter=root_filter
+        root_filter=root_filter,
+        sort=sort,
+        order=order,
+        cursor=cursor,
+        include_total=include_total
     )
     
     return FieldListResponse(
         list=fields,
         total=total,
         page=page,
-        pageSize=page_size
+        pageSize=page_size,
+        next_cursor=next_cursor
     )
 
 @router.post("", response_model=FieldResponse)
@@ -48,9 +65,37 @@ def create_field(field_data: FieldCreate, db: Session = Depends(get_db)):
     
     return field
 
+@router.post("/batch", response_model=FieldBatchCreateResponse)
+def batch_create_fields(batch_data: FieldBatchCreate, db: Session = Depends(get_db)):
+    """文本批量创建字段（每行一个字段，支持预览）"""
+    report, errors = field_service.batch_create_fields(
+        db,
+        batch_data.text,
+        data_type=batch_data.data_type,
+        dry_run=batch_data.dry_run,
+        atomic=batch_data.atomic
+    )
+    if report is None:
+        raise HTTPException(status_code=400, detail={"errors": errors})
+    
+    return report
+
+@router.get("/autocomplete", response_model=FieldAutocompleteResponse)
+def autocomplete_fields(
+    q: str = Query(..., min_length=1, description="输入前缀"),
+    limit: int = Query(10, ge=1, le=20, description="最多返回数量"),
+    db: Session = Depends(get_read_db)
+):
+    """按前缀补全字段名，按被模型引用次数排序"""
+    return field_service.autocomplete_fields(db, q, limit=limit)
+
 @router.get("/{field_id}", response_model=FieldResponse)
-def get_field(field_id: int, db: Session = Depends(get_db)):
+def get_field(field_id: int, request: Request, response: Response, db: Session = Depends(get_read_db)):
     """获取字段详情"""
+    not_modified = check_not_modified(request, response, db, ("fields",))
+    if not_modified:
+        return not_modified
+    
     field = field_service.get_field(db, field_id)
     if not field:
         raise HTTPException(status_code=404, detail="字段不存在")
@@ -85,7 +130,7 @@ def update_field_status(field_id: int, status_data: FieldStatusUpdate, db: Sessi
     return {"message": "字段状态更新成功"}
 
 @router.post("/check-unique", response_model=FieldUniqueResponse)
-def check_field_unique(check_data: FieldUniqueCheck, db: Session = Depends(get_db)):
+def check_field_unique(check_data: FieldUniqueCheck, db: Session = Depends(get_read_db)):
     """检查字段唯一性"""
     is_unique, message, alternatives = field_service.check_field_unique(db, check_data.field_name)
     
@@ -98,7 +143,7 @@ def check_field_unique(check_data: FieldUniqueCheck, db: Session = Depends(get_d
 @router.get("/by-roots/{root_names}")
 def get_fields_by_roots(
     root_names: str,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """根据词根组合查找字段"""
     # 解析词根名称（用逗号分隔）
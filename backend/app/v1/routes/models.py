@@ -1,41 +1,144 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import List, Optional
+from datetime import datetime
+from urllib.parse import quote
+import os
 
-from app.db.database import get_db
+from app.core.conditional import check_not_modified
+from app.db.database import get_db, get_read_db, ReadSessionLocal
 from app.services.model_service import ModelService
+from app.services.export_cache import export_cache
 from app.schemas.model import (
     ModelCreate, ModelUpdate, ModelResponse, ModelListResponse,
     ModelDetailResponse, ModelFieldBinding, ModelFieldUnbinding,
-    ExportFormat, ExportResponse
+    ModelFieldListResponse, ModelFieldBatchBinding, ModelFieldBatchResponse,
+    ExportFormat, ExportResponse, ModelExportRequest
 )
 
 router = APIRouter()
 model_service = ModelService()
 
+# 流式导出的媒体类型
+EXPORT_MEDIA_TYPES = {
+    "sql": "application/sql; charset=utf-8",
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+def _attachment_headers(filename: str) -> dict:
+    """下载响应头（文件名按 RFC 5987 编码以支持中文）"""
+    return {"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"}
+
+def _iter_file(file, chunk_size: int = 64 * 1024):
+    """分块读取已打开的文件，发送完毕后关闭"""
+    try:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        file.close()
+
+def _stream_export(model_ids: Optional[List[int]], format: str, filename: str, **options) -> StreamingResponse:
+    """生成流式导出响应"""
+    def content():
+        # 响应体在路由返回后才生成，使用独立会话
+        session = ReadSessionLocal()
+        try:
+            yield from model_service.iter_export(session, model_ids, format, **options)
+        finally:
+            session.close()
+    
+    return StreamingResponse(
+        content(),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers=_attachment_headers(filename)
+    )
+
+def _cached_export(
+    request: Request,
+    db: Session,
+    model_id: int,
+    format: str,
+    include_ddl: bool = True,
+    include_data: bool = False,
+    dialect: str = "mysql",
+    sheet_layout: str = "per_model"
+) -> Response:
+    """
+    单模型导出：命中缓存时直接发送磁盘文件，ETag 与 If-None-Match 一致时返回 304
+    
+    缓存关闭时退回流式导出。
+    """
+    options = dict(include_ddl=include_ddl, include_data=include_data, dialect=dialect, sheet_layout=sheet_layout)
+    if not export_cache.enabled:
+        model = model_service.get_model(db, model_id)
+        if not model:
+            raise HTTPException(status_code=400, detail={"errors": ["模型不存在"]})
+        return _stream_export([model_id], format, f"{model.model_name}.{format}", **options)
+    
+    file, key, model_name, errors = model_service.export_model_file(db, model_id, format, **options)
+    if errors:
+        raise HTTPException(status_code=400, detail={"errors": errors})
+    
+    etag = f'"{key}"'
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+        file.close()
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    # 发送已打开的文件：期间被其他请求淘汰或清理也能完整发送
+    return StreamingResponse(
+        _iter_file(file),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            **_attachment_headers(f"{model_name}.{format}"),
+            "ETag": etag,
+            "Content-Length": str(os.fstat(file.fileno()).st_size)
+        }
+    )
+
 @router.get("", response_model=ModelListResponse)
 def list_models(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1, description="页码"),
     page_size: int = Query(20, ge=1, le=100, description="每页大小"),
     search: Optional[str] = Query(None, description="搜索关键词"),
     status: Optional[str] = Query(None, description="状态过滤"),
-    db: Session = Depends(get_db)
+    sort: Optional[str] = Query(None, pattern="^(relevance|id|name|created_at)$", description="排序字段（有搜索词时默认relevance，否则默认id）"),
+    order: str = Query("asc", pattern="^(asc|desc)$", description="排序方向"),
+    cursor: Optional[str] = Query(None, description="分页游标（传入时忽略页码）"),
+    include_total: bool = Query(True, description="是否统计总数（仅首页统计）"),
+    db: Session = Depends(get_read_db)
 ):
     """获取模型列表"""
+    not_modified = check_not_modified(request, response, db, ("models",))
+    if not_modified:
+        return not_modified
+    
     skip = (page - 1) * page_size
-    models, total = model_service.get_models(
+    models, total, next_cursor = model_service.get_models(
         db, 
         skip=skip, 
         limit=page_size, 
         search=search, 
-        status=status
+        status=status,
+        sort=sort,
+        order=order,
+        cursor=cursor,
+        include_total=include_total
     )
     
     return ModelListResponse(
         list=models,
         total=total,
         page=page,
-        pageSize=page_size
+        pageSize=page_size,
+        next_cursor=next_cursor
     )
 
 @router.post("", response_model=ModelResponse)
@@ -47,9 +150,38 @@ def create_model(model_data: ModelCreate, db: Session = Depends(get_db)):
     
     return model
 
+@router.post("/export")
+def export_models(export_data: ModelExportRequest, request: Request, db: Session = Depends(get_read_db)):
+    """
+    流式导出模型（单个、多个或全部）
+    
+    边查询边输出，导出全部模型时内存占用保持平稳；单个模型的导出结果走磁盘缓存。
+    """
+    model_ids = export_data.model_ids
+    if model_ids is not None:
+        missing = model_service.find_missing_models(db, model_ids)
+        if missing:
+            raise HTTPException(status_code=400, detail={"errors": [f"以下模型不存在: {', '.join(map(str, missing))}"]})
+    
+    options = dict(
+        include_ddl=export_data.include_ddl,
+        include_data=export_data.include_data,
+        dialect=export_data.dialect,
+        sheet_layout=export_data.sheet_layout
+    )
+    if model_ids is not None and len(set(model_ids)) == 1:
+        return _cached_export(request, db, model_ids[0], export_data.format, **options)
+    
+    filename = f"models_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_data.format}"
+    return _stream_export(model_ids, export_data.format, filename, **options)
+
 @router.get("/{model_id}", response_model=ModelResponse)
-def get_model(model_id: int, db: Session = Depends(get_db)):
+def get_model(model_id: int, request: Request, response: Response, db: Session = Depends(get_read_db)):
     """获取模型详情"""
+    not_modified = check_not_modified(request, response, db, ("models",))
+    if not_modified:
+        return not_modified
+    
     model = model_service.get_model(db, model_id)
     if not model:
         raise HTTPException(status_code=404, detail="模型不存在")
@@ -57,14 +189,45 @@ def get_model(model_id: int, db: Session = Depends(get_db)):
     return model
 
 @router.get("/{model_id}/detail")
-def get_model_detail(model_id: int, db: Session = Depends(get_db)):
+def get_model_detail(model_id: int, request: Request, response: Response, db: Session = Depends(get_read_db)):
     """获取模型详情（包含字段信息）"""
+    not_modified = check_not_modified(request, response, db, ("models", "model_fields", "fields"))
+    if not_modified:
+        return not_modified
+    
     model_detail = model_service.get_model_detail(db, model_id)
     if not model_detail:
         raise HTTPException(status_code=404, detail="模型不存在")
     
     return model_detail
 
+@router.get("/{model_id}/fields", response_model=ModelFieldListResponse)
+def list_model_fields(
+    model_id: int,
+    request: Request,
+    response: Response,
+    page: int = Query(1, ge=1, description="页码"),
+    page_size: int = Query(100, ge=1, le=1000, description="每页大小"),
+    db: Session = Depends(get_read_db)
+):
+    """分页获取模型字段（按 pos 排序）"""
+    not_modified = check_not_modified(request, response, db, ("models", "model_fields", "fields"))
+    if not_modified:
+        return not_modified
+    
+    if not model_service.get_model(db, model_id):
+        raise HTTPException(status_code=404, detail="模型不存在")
+    
+    skip = (page - 1) * page_size
+    fields, total = model_service.get_model_fields(db, model_id, skip=skip, limit=page_size)
+    
+    return ModelFieldListResponse(
+        list=fields,
+        total=total,
+        page=page,
+        pageSize=page_size
+    )
+
 @router.put("/{model_id}", response_model=ModelResponse)
 def update_model(model_id: int, model_data: ModelUpdate, db: Session = Depends(get_db)):
     """更新模型"""
@@ -96,6 +259,19 @@ def bind_field_to_model(
     
     return {"message": "字段绑定成功"}
 
+@router.post("/{model_id}/fields:batch", response_model=ModelFieldBatchResponse)
+def batch_bind_fields_to_model(
+    model_id: int,
+    batch_data: ModelFieldBatchBinding,
+    db: Session = Depends(get_db)
+):
+    """批量绑定字段到模型"""
+    result, errors = model_service.bind_fields(db, model_id, batch_data)
+    if result is None:
+        raise HTTPException(status_code=400, detail={"errors": errors})
+    
+    return result
+
 @router.delete("/{model_id}/fields")
 def unbind_field_from_model(
     model_id: int, 
@@ -109,13 +285,33 @@ def unbind_field_from_model(
     
     return {"message": "字段解绑成功"}
 
+@router.get("/{model_id}/export/{format}")
+def download_model_export(
+    model_id: int,
+    request: Request,
+    format: str = Path(..., description="导出格式", pattern="^(sql|csv|xlsx)$"),
+    dialect: str = Query("mysql", description="SQL方言（仅sql）", pattern="^(mysql|oracle|postgresql)$"),
+    include_ddl: bool = Query(True, description="是否包含DDL语句（仅sql）"),
+    include_data: bool = Query(False, description="是否包含示例数据（仅sql）"),
+    db: Session = Depends(get_read_db)
+):
+    """下载模型导出文件（带 ETag，内容未变化时返回 304）"""
+    return _cached_export(
+        request, db, model_id, format,
+        include_ddl=include_ddl, include_data=include_data, dialect=dialect
+    )
+
 @router.post("/{model_id}/export")
 def export_model(
     model_id: int, 
     export_data: ExportFormat, 
-    db: Session = Depends(get_db)
+    request: Request,
+    db: Session = Depends(get_read_db)
 ):
-    """导出模型"""
+    """导出模型（sql 返回JSON内容，excel 直接下载XLSX文件）"""
+    if export_data.format == "excel":
+        return _cached_export(request, db, model_id, "xlsx")
+    
     content, filename, errors = model_service.export_model(db, model_id, export_data)
     if not content:
         raise HTTPException(status_code=400, detail={"errors": errors})
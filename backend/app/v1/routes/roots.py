@@ -1,12 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import Optional
 
-from app.db.database import get_db
+from app.core.csv_stream import iter_csv_rows
+from app.core.conditional import check_not_modified
+from app.core.pagination import page_window
+from app.db.database import get_db, get_read_db
 from app.services.root_service import RootService
 from app.schemas.root import (
     RootCreate, RootUpdate, RootResponse, RootListResponse,
-    AliasCreate, AliasResponse, RootImpactResponse
+    AliasCreate, AliasResponse, RootImpactResponse,
+    RootImpactBatchRequest, RootImpactBatchResponse, RootSuggestResponse,
+    RootImportResponse, RootAutocompleteResponse, RootSegmentRequest, RootSegmentResponse,
+    RootMatchRequest, RootMatchResponse, RootMatchBatchRequest, RootMatchBatchResponse
 )
 
 router = APIRouter()
@@ -14,21 +21,42 @@ root_service = RootService()
 
 @router.get("", response_model=RootListResponse)
 def list_roots(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1, description="页码"),
     page_size: int = Query(20, ge=1, le=100, description="每页大小"),
     search: Optional[str] = Query(None, description="搜索关键词"),
     status: Optional[str] = Query(None, description="状态过滤"),
-    db: Session = Depends(get_db)
+    sort: Optional[str] = Query(None, pattern="^(relevance|id|name|created_at|usage_count)$", description="排序字段（有搜索词时默认relevance，否则默认id）"),
+    order: str = Query("asc", pattern="^(asc|desc)$", description="排序方向"),
+    cursor: Optional[str] = Query(None, description="分页游标（传入时忽略页码）"),
+    include_total: bool = Query(True, description="是否统计总数（仅首页统计）"),
+    db: Session = Depends(get_read_db)
 ):
     """获取词根列表"""
+    not_modified = check_not_modified(request, response, db, ("roots",))
+    if not_modified:
+        return not_modified
+    
     skip = (page - 1) * page_size
-    roots, total = root_service.get_roots(db, skip=skip, limit=page_size, search=search, status=status)
+    roots, total, next_cursor = root_service.get_roots(
+        db, 
+        skip=skip, 
+        limit=page_size, 
+        search=search, 
+        status=status,
+        sort=sort,
+        order=order,
+        cursor=cursor,
+        include_total=include_total
+    )
     
     return RootListResponse(
         list=roots,
         total=total,
         page=page,
-        pageSize=page_size
+        pageSize=page_size,
+        next_cursor=next_cursor
     )
 
 @router.post("", response_model=RootResponse)
@@ -40,9 +68,91 @@ def create_root(root_data: RootCreate, db: Session = Depends(get_db)):
     
     return root
 
+@router.post("/import", response_model=RootImportResponse)
+async def import_roots(
+    request: Request,
+    atomic: bool = Query(False, description="任一行有误时整批不导入"),
+    db: Session = Depends(get_db)
+):
+    """
+    批量导入词根
+    
+    请求体为UTF-8编码的CSV（Content-Type: text/csv），首行为表头，
+    需包含 name 列，可选 remark、tags、aliases 列（列表以分号分隔）。
+    边读边解析，每凑满一块即交给服务层校验并暂存，不把整个文件读入内存；
+    请求体读完后才开启写事务一次性插入，上传期间不占用数据库写锁。
+    """
+    job = await run_in_threadpool(root_service.start_import, db, atomic)
+    try:
+        chunk = []
+        async for row in iter_csv_rows(request.stream(), required=("name",)):
+            chunk.append(row)
+            if len(chunk) >= root_service.IMPORT_CHUNK_SIZE:
+                await run_in_threadpool(job.feed, chunk)
+                chunk = []
+        if chunk:
+            await run_in_threadpool(job.feed, chunk)
+    except Exception:
+        await run_in_threadpool(job.abort)
+        raise
+    
+    report, errors = await run_in_threadpool(job.finish)
+    if report is None:
+        raise HTTPException(status_code=400, detail={"errors": errors})
+    
+    return report
+
+@router.post("/impact:batch", response_model=RootImpactBatchResponse)
+def batch_root_impact(batch_data: RootImpactBatchRequest, db: Session = Depends(get_read_db)):
+    """批量获取词根影响面"""
+    return root_service.get_roots_impact(db, batch_data.root_ids, include_details=batch_data.include_details)
+
+@router.post("/segment", response_model=RootSegmentResponse)
+def segment_names(segment_data: RootSegmentRequest, db: Session = Depends(get_read_db)):
+    """把历史字段名等标识符切分为已知词根序列"""
+    return root_service.segment_names(db, segment_data.names, top_k=segment_data.top_k)
+
+@router.post("/match", response_model=RootMatchResponse)
+def match_roots(match_data: RootMatchRequest, db: Session = Depends(get_read_db)):
+    """分析文本中出现的词根"""
+    return root_service.match_roots(
+        db, [match_data.text], whole_word=match_data.whole_word, longest_only=match_data.longest_only
+    )[0]
+
+@router.post("/match:batch", response_model=RootMatchBatchResponse)
+def batch_match_roots(match_data: RootMatchBatchRequest, db: Session = Depends(get_read_db)):
+    """批量分析文本中出现的词根"""
+    items = root_service.match_roots(
+        db, match_data.texts, whole_word=match_data.whole_word, longest_only=match_data.longest_only
+    )
+    return RootMatchBatchResponse(items=items)
+
+@router.get("/suggest", response_model=RootSuggestResponse)
+def suggest_roots(
+    q: str = Query(..., min_length=1, description="查询词"),
+    limit: int = Query(5, ge=1, le=50, description="最多返回数量"),
+    max_distance: int = Query(2, ge=0, le=3, description="最大编辑距离"),
+    db: Session = Depends(get_read_db)
+):
+    """按编辑距离推荐相似词根"""
+    return root_service.suggest_roots(db, q, limit=limit, max_distance=max_distance)
+
+@router.get("/autocomplete", response_model=RootAutocompleteResponse)
+def autocomplete_roots(
+    q: str = Query(..., min_length=1, description="输入前缀"),
+    limit: int = Query(10, ge=1, le=20, description="最多返回数量"),
+    db: Session = Depends(get_read_db)
+):
+    """按前缀补全词根（含别名），按使用次数排序"""
+    return root_service.autocomplete_roots(db, q, limit=limit)
+
 @router.get("/{root_id}", response_model=RootResponse)
-def get_root(root_id: int, db: Session = Depends(get_db)):
+def get_root(root_id: int, request: Request, response: Response, db: Session = Depends(get_read_db)):
     """获取词根详情"""
+    not_modified = check_not_modified(request, response, db, ("roots",))
+    if not_modified:
+        return not_modified
+    
     root = root_service.get_root(db, root_id)
     if not root:
         raise HTTPException(status_code=404, detail="词根不存在")
@@ -81,7 +191,26 @@ def add_alias(root_id: int, alias_data: AliasCreate, db: Session = Depends(get_d
     return AliasResponse(id=root.id, aliases=aliases)
 
 @router.get("/{root_id}/impact", response_model=RootImpactResponse)
-def root_impact(root_id: int, db: Session = Depends(get_db)):
+def root_impact(
+    root_id: int,
+    request: Request,
+    response: Response,
+    page: Optional[int] = Query(None, ge=1, description="页码（不传则返回全部），字段与模型列表未单独指定时共用"),
+    page_size: int = Query(100, ge=1, le=1000, description="每页大小"),
+    field_page: Optional[int] = Query(None, ge=1, description="字段列表页码"),
+    field_page_size: Optional[int] = Query(None, ge=1, le=1000, description="字段列表每页大小"),
+    model_page: Optional[int] = Query(None, ge=1, description="模型列表页码"),
+    model_page_size: Optional[int] = Query(None, ge=1, le=1000, description="模型列表每页大小"),
+    db: Session = Depends(get_read_db)
+):
     """获取词根影响面"""
-    impact = root_service.get_root_impact(db, root_id)
+    not_modified = check_not_modified(request, response, db, ("roots", "fields", "models", "model_fields"))
+    if not_modified:
+        return not_modified
+    
+    impact = root_service.get_root_impact(
+        db, root_id,
+        *page_window(field_page or page, field_page_size or page_size),
+        *page_window(model_page or page, model_page_size or page_size)
+    )
     return RootImpactResponse(**impact) 
\ No newline at end of file
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+名称规范化性能测试脚本
+对比逐个调用与批量接口的吞吐量（名称/秒），区分缓存冷启动与命中两种情况
+"""
+
+import sys
+import os
+import argparse
+import random
+import string
+import time
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.normalization import (
+    normalize_name,
+    normalize_many,
+    validate_name,
+    validate_many,
+    _normalize_cached
+)
+
+def generate_names(count, seed):
+    """生成测试名称：规范名称、驼峰/带空格的英文名称与全角名称混合"""
+    rng = random.Random(seed)
+    words = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 8))) for _ in range(500)]
+    names = []
+    for _ in range(count):
+        parts = rng.sample(words, rng.randint(1, 4))
+        kind = rng.random()
+        if kind < 0.6:
+            names.append("_".join(parts))
+        elif kind < 0.85:
+            names.append(" ".join(part.capitalize() for part in parts) + rng.choice(["", "-v2", " (old)"]))
+        else:
+            names.append("　".join(part.upper().translate(str.maketrans(
+                string.ascii_uppercase, "".join(chr(0xFF21 + i) for i in range(26))
+            )) for part in parts))
+    return names
+
+def measure(label, func, names, repeat):
+    """执行 repeat 次，取最快一次计算吞吐量"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(names)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    rate = len(names) / best if best else float("inf")
+    print(f"{label:<28} {best * 1000:10.2f} ms {rate:14,.0f} 名称/秒")
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="名称规范化性能测试")
+    parser.add_argument("--count", type=int, default=100000, help="测试名称数量")
+    parser.add_argument("--unique", type=int, default=20000, help="其中不重复的名称数量")
+    parser.add_argument("--repeat", type=int, default=3, help="重复次数（取最快一次）")
+    parser.add_argument("--seed", type=int, default=42, help="随机种子")
+    
+    args = parser.parse_args()
+    
+    pool = generate_names(args.unique, args.seed)
+    rng = random.Random(args.seed)
+    names = [rng.choice(pool) for _ in range(args.count)]
+    normalized = normalize_many(names)
+    
+    print(f"名称数量: {len(names)}，不重复: {len(set(names))}")
+    
+    def cold(func):
+        def run(items):
+            _normalize_cached.cache_clear()
+            return func(items)
+        return run
+    
+    measure("normalize_name (冷缓存)", cold(lambda items: [normalize_name(name) for name in items]), names, args.repeat)
+    measure("normalize_many (冷缓存)", cold(normalize_many), names, args.repeat)
+    measure("normalize_name (热缓存)", lambda items: [normalize_name(name) for name in items], names, args.repeat)
+    measure("normalize_many (热缓存)", normalize_many, names, args.repeat)
+    measure("validate_name", lambda items: [validate_name(name) for name in items], normalized, args.repeat)
+    measure("validate_many", validate_many, normalized, args.repeat)
+    
+    info = _normalize_cached.cache_info()
+    print(f"缓存: 命中 {info.hits}，未命中 {info.misses}，当前 {info.currsize}/{info.maxsize}")
+
+if __name__ == "__main__":
+    main()
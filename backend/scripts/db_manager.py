@@ -8,13 +8,12 @@ import sys
 import os
 import argparse
 import sqlite3
-import shutil
 from datetime import datetime
 
 # 添加项目根目录到Python路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.db.database import init_database, check_database_health, close_database
+from app.db.database import init_database, check_database_health, close_database, SessionLocal
 from app.core.config import settings
 import logging
 
@@ -36,6 +35,16 @@ def check_sqlite_backup():
     
     return backup_file
 
+def copy_sqlite_database(source_path, target_path):
+    """使用SQLite在线备份接口复制数据库（包含WAL中的数据）"""
+    source = sqlite3.connect(source_path)
+    target = sqlite3.connect(target_path)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+        source.close()
+
 def backup_sqlite():
     """备份SQLite数据库"""
     if settings.DATABASE_TYPE.lower() != "sqlite":
@@ -49,7 +58,8 @@ def backup_sqlite():
             return False
         
         backup_file = check_sqlite_backup()
-        shutil.copy2(source_db, backup_file)
+        # WAL 模式下未检查点的数据在 -wal 文件中，使用在线备份接口而非直接复制文件
+        copy_sqlite_database(source_db, backup_file)
         logger.info(f"SQLite数据库备份成功: {backup_file}")
         return True
         
@@ -73,11 +83,11 @@ def restore_sqlite(backup_file):
         # 先备份当前数据库
         current_backup = check_sqlite_backup()
         if os.path.exists(target_db):
-            shutil.copy2(target_db, current_backup)
+            copy_sqlite_database(target_db, current_backup)
             logger.info(f"当前数据库已备份: {current_backup}")
         
-        # 恢复备份
-        shutil.copy2(backup_file, target_db)
+        # 恢复备份（写入现有库，-wal/-shm 文件随之保持一致）
+        copy_sqlite_database(backup_file, target_db)
         logger.info(f"SQLite数据库恢复成功: {backup_file}")
         return True
         
@@ -125,6 +135,7 @@ def check_database_status():
             file_size = os.path.getsize(settings.SQLITE_DB_PATH)
             size_mb = file_size / (1024 * 1024)
             logger.info(f"数据库文件大小: {size_mb:.2f}MB")
+            logger.info(f"SQLite PRAGMA配置: {settings.get_sqlite_pragmas()}")
         else:
             logger.warning("SQLite数据库文件不存在")
     
@@ -134,14 +145,26 @@ def check_database_status():
     else:
         logger.error("✗ 数据库连接失败")
 
+def recompute_usage(chunk_size: int):
+    """按字段实际引用重算词根使用计数"""
+    from app.services.root_service import RootService
+    
+    db = SessionLocal()
+    try:
+        total, fixed = RootService().recompute_usage_counts(db, chunk_size=chunk_size)
+        logger.info(f"词根使用计数重算完成: 检查{total}个, 修正{fixed}个")
+    finally:
+        db.close()
+
 def main():
     """主函数"""
     parser = argparse.ArgumentParser(description="数据库管理工具")
     parser.add_argument("action", choices=[
-        "init", "backup", "restore", "status", "list-backups"
+        "init", "backup", "restore", "status", "list-backups", "recompute-usage"
     ], help="要执行的操作")
     parser.add_argument("--backup-file", help="恢复时指定的备份文件路径")
     parser.add_argument("--force", action="store_true", help="强制执行操作")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="重算使用计数时每批处理的词根数")
     
     args = parser.parse_args()
     
@@ -177,6 +200,9 @@ def main():
         elif args.action == "list-backups":
             list_backups()
             
+        elif args.action == "recompute-usage":
+            recompute_usage(args.chunk_size)
+            
     except KeyboardInterrupt:
         logger.info("操作被用户中断")
         sys.exit(1)